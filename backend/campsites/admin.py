@@ -37,3 +37,21 @@ class PolicyAdmin(admin.ModelAdmin):
 @admin.register(models.PricingRule)
 class PricingRuleAdmin(admin.ModelAdmin):
     pass
+
+
+@admin.register(models.AddressGeocode)
+class AddressGeocodeAdmin(admin.ModelAdmin):
+    list_display = ("prefix", "latitude", "longitude")
+    search_fields = ("prefix",)
+
+
+@admin.register(models.CampsiteImport)
+class CampsiteImportAdmin(admin.ModelAdmin):
+    list_display = (
+        "source_name",
+        "owner",
+        "processed",
+        "created_count",
+        "failed_count",
+        "completed_at",
+    )
@@ -1,6 +1,22 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class CampsitesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "campsites"
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        post_migrate.connect(install_search_index, sender=self)
+
+
+def install_search_index(sender, using, plan=None, **kwargs):
+    # SQLite는 테이블을 다시 만드는 마이그레이션 뒤에 FTS 트리거가 사라지므로 매번 복구
+    from django.db import connections
+
+    from . import search
+
+    if plan:
+        search.install_if_ready(connections[using])
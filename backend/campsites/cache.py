@@ -0,0 +1,14 @@
+from common import cache as common_cache
+
+# 캠핑장 목록 전체가 의존하는 버전 키
+LIST_VERSION_KEY = "campsites:list:version"
+
+
+def campsite_version_key(campsite_id):
+    """캠핑장 상세/리뷰 목록이 의존하는 캠핑장별 버전 키"""
+    return f"campsites:{campsite_id}:version"
+
+
+def bump_campsite(campsite_id):
+    """캠핑장 한 곳의 상세 캐시와 목록 캐시를 함께 무효화"""
+    common_cache.bump_versions(LIST_VERSION_KEY, campsite_version_key(campsite_id))
@@ -0,0 +1,405 @@
+"""
+Cloudflare Images API 클라이언트
+
+- 요청은 프로세스별 requests.Session 하나로 보내므로 TLS 연결을 재사용(keep-alive)함.
+  연결/응답 timeout과 429/5xx, 연결 오류에 대한 재시도(지수 backoff)를 적용
+- direct upload URL은 UploadURLPool에 미리 발급해 두고 요청이 오면 바로 꺼내 줌.
+  풀이 줄어들면 백그라운드 스레드가 채움 (워커 프로세스마다 따로 가짐)
+- 여러 개를 요청하면 풀에 없는 만큼을 동시에 발급
+- async view(ASGI)용 a* 함수는 이벤트 루프별 httpx.AsyncClient로 발급하므로 응답을
+  기다리는 동안 워커가 다른 요청을 처리함. WSGI에서 async view를 실행할 때처럼 호출마다
+  새로 만들어지는 루프이거나 httpx가 없으면 requests.Session으로 스레드에서 발급
+- UploadURLQuota: 사용자별 발급 한도
+
+오프라인 개발/테스트는 cloudflare_stub 명령(campsites.cloudflare_stub)으로 띄운 서버 주소를
+CLOUDFLARE_API_URL에 지정해서 사용
+"""
+
+import asyncio
+import collections
+import datetime
+import functools
+import logging
+import os
+import threading
+import time
+import weakref
+
+# requests는 DRF(rest_framework.compat)도 시작할 때 import하므로 미뤄도 이득이 없음
+import requests
+from asgiref.sync import AsyncToSync, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger("camping")
+
+# 한 프로세스에서 동시에 유지할 Cloudflare 연결 수 (요청/발급/풀 채우기 스레드)
+CONNECTION_POOL_SIZE = 10
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_BACKOFF = 0.2
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+@functools.cache
+def _httpx():
+    """
+    httpx 모듈 (설치되어 있지 않으면 None)
+    import에 20ms 넘게 걸리므로 모듈을 불러올 때가 아니라 async 발급을 처음 할 때 import
+    (campsites.views를 불러오는 모든 워커가 시작할 때 비용을 내지 않도록)
+    """
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover
+        # 없으면 async 함수도 requests를 스레드에서 사용
+        return None
+    return httpx
+
+
+@functools.cache
+def request_errors():
+    """발급 요청의 연결/응답 오류 (sync: requests, async: httpx)"""
+    httpx = _httpx()
+    return (RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
+
+class CloudflareError(Exception):
+    """Cloudflare API가 success: false로 응답함"""
+
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def get_session():
+    """프로세스별 requests.Session (fork된 워커에서는 부모의 연결을 쓰지 않도록 새로 만듦)"""
+    global _session, _session_pid
+    if _session is None or _session_pid != os.getpid():
+        with _session_lock:
+            if _session is None or _session_pid != os.getpid():
+                _session = _build_session()
+                _session_pid = os.getpid()
+    return _session
+
+
+def _build_session():
+    retry = Retry(
+        total=settings.CLOUDFLARE_RETRIES,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        # 업로드 URL 발급은 같은 요청을 다시 보내도 안전하므로 POST도 재시도
+        allowed_methods=None,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=CONNECTION_POOL_SIZE, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def mint_upload_url(expiry=None):
+    """
+    direct upload URL을 하나 발급해서 Cloudflare 응답의 result({"id", "uploadURL"})를 return
+    expiry(aware datetime)를 주면 그 시각에 URL이 만료됨 (Cloudflare 기본값은 30분)
+    """
+    url, headers, form = _mint_request(expiry)
+    response = get_session().post(
+        url, headers=headers, files=form, timeout=settings.CLOUDFLARE_TIMEOUT
+    )
+    response.raise_for_status()
+    return _mint_result(response.json())
+
+
+async def amint_upload_url(expiry=None):
+    """mint_upload_url()의 async 버전 (timeout, 재시도 규칙이 같음)"""
+    httpx = _httpx()
+    if httpx is None or _on_temporary_loop():
+        return await sync_to_async(mint_upload_url, thread_sensitive=False)(expiry)
+    url, headers, form = _mint_request(expiry)
+    client = get_async_client()
+    retries = settings.CLOUDFLARE_RETRIES
+    for attempt in range(retries + 1):
+        try:
+            response = await client.post(url, headers=headers, files=form)
+        except httpx.TransportError:
+            if attempt == retries:
+                raise
+            await asyncio.sleep(_backoff(attempt + 1))
+            continue
+        if response.status_code not in RETRY_STATUSES or attempt == retries:
+            break
+        await asyncio.sleep(_retry_after(response) or _backoff(attempt + 1))
+    response.raise_for_status()
+    return _mint_result(response.json())
+
+
+def _mint_request(expiry):
+    url = (
+        f"{settings.CLOUDFLARE_API_URL}/accounts/"
+        f"{settings.CLOUDFLARE_ACCOUNT_ID}/images/v2/direct_upload"
+    )
+    headers = {"Authorization": f"Bearer {settings.CLOUDFLARE_API_TOKEN}"}
+    # Cloudflare는 multipart/form-data 본문을 받음
+    form = None
+    if expiry is not None:
+        form = {"expiry": (None, expiry.strftime("%Y-%m-%dT%H:%M:%SZ"))}
+    return url, headers, form
+
+
+def _mint_result(data):
+    if not data.get("success"):
+        raise CloudflareError(data.get("errors"))
+    return data["result"]
+
+
+def _backoff(errors):
+    # urllib3 Retry와 같은 간격 (첫 재시도는 바로, 이후 RETRY_BACKOFF * 2^(n-1)초)
+    return 0 if errors <= 1 else RETRY_BACKOFF * 2 ** (errors - 1)
+
+
+def _retry_after(response):
+    value = response.headers.get("Retry-After", "")
+    return int(value) if value.isdigit() else None
+
+
+def _on_temporary_loop():
+    """
+    async_to_sync가 호출 하나를 위해 만든 루프인지 (WSGI에서 async view를 실행할 때)
+    이 루프는 호출이 끝나면 닫히므로 AsyncClient를 만들면 연결을 재사용하지도, 닫지도 못함
+    """
+    return asyncio.get_running_loop() in AsyncToSync.loop_thread_executors
+
+
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_client():
+    """
+    이벤트 루프별 httpx.AsyncClient (연결은 만든 루프에서만 쓸 수 있음)
+    동시 연결은 CONNECTION_POOL_SIZE개까지이고 나머지 요청은 연결이 빌 때까지 기다림
+    ASGI 서버처럼 계속 도는 루프에서만 사용 (_on_temporary_loop() 참고)
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        httpx = _httpx()
+        connect, read = settings.CLOUDFLARE_TIMEOUT
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(read, connect=connect),
+            limits=httpx.Limits(max_connections=CONNECTION_POOL_SIZE),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+class UploadURLPool:
+    """
+    미리 발급해 둔 direct upload URL 풀
+
+    - atake(): 풀에 URL이 있으면 바로 return, 비어 있으면 그 자리에서 발급
+    - 꺼낸 뒤 남은 URL이 low_water개 이하이면 백그라운드 스레드가 size개까지 채움
+    - URL은 ttl초 뒤 만료되도록 발급하고, 만료까지 margin초도 남지 않은 URL은 버림
+      (사용자가 파일을 고르고 업로드를 마칠 시간)
+    """
+
+    def __init__(self, size, ttl, margin, mint=mint_upload_url):
+        self.size = size
+        self.low_water = size // 2
+        self.ttl = ttl
+        self.margin = margin
+        self.mint = mint
+        self._items = collections.deque()  # (만료 시각 timestamp, result)
+        self._lock = threading.Lock()
+        self._refill_thread = None
+        self._pid = os.getpid()
+
+    def __len__(self):
+        return len(self._items)
+
+    async def atake(self):
+        results = self.take_many(1)
+        return results[0] if results else await amint_upload_url(self.new_expiry())
+
+    def take_many(self, count):
+        """만료되지 않은 URL을 최대 count개 꺼냄 (부족해도 발급을 기다리지 않음)"""
+        self._reset_after_fork()
+        results = []
+        now = time.time()
+        with self._lock:
+            while self._items and len(results) < count:
+                expires_at, item = self._items.popleft()
+                if expires_at - self.margin > now:
+                    results.append(item)
+        self.refill()
+        return results
+
+    def refill(self):
+        """필요하면 백그라운드 스레드로 풀을 채움 (이미 채우는 중이면 아무것도 안 함)"""
+        with self._lock:
+            if len(self._items) > self.low_water or self._refilling():
+                return
+            self._refill_thread = threading.Thread(
+                target=self._refill, name="cloudflare-upload-url-pool", daemon=True
+            )
+            self._refill_thread.start()
+
+    def wait(self, timeout=None):
+        """채우는 중인 스레드가 끝날 때까지 기다림 (테스트, 종료 처리용)"""
+        thread = self._refill_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _refilling(self):
+        return self._refill_thread is not None and self._refill_thread.is_alive()
+
+    def _refill(self):
+        try:
+            while len(self._items) < self.size:
+                item = self._mint()
+                with self._lock:
+                    self._items.append(item)
+        except (RequestException, CloudflareError, ValueError):
+            # 다음 atake()에서 다시 시도하고, 그동안은 요청마다 직접 발급
+            logger.warning(
+                "Cloudflare 업로드 URL 풀을 채우지 못했습니다.", exc_info=True
+            )
+
+    def new_expiry(self):
+        """지금 발급하는 URL의 만료 시각 (ttl초 뒤)"""
+        return datetime.datetime.fromtimestamp(
+            time.time() + self.ttl, tz=datetime.timezone.utc
+        )
+
+    def _mint(self):
+        expiry = self.new_expiry()
+        return expiry.timestamp(), self.mint(expiry=expiry)
+
+    def _reset_after_fork(self):
+        # fork 전에 채운 URL은 부모 프로세스와 중복될 수 있고 스레드는 복사되지 않음
+        if self._pid != os.getpid():
+            self._items.clear()
+            self._refill_thread = None
+            self._pid = os.getpid()
+
+
+_pool = None
+
+
+async def atake_upload_url():
+    """업로드 URL 하나를 return (CLOUDFLARE_UPLOAD_URL_POOL_SIZE가 0이면 매번 발급)"""
+    if settings.CLOUDFLARE_UPLOAD_URL_POOL_SIZE <= 0:
+        return await amint_upload_url()
+    return await get_pool().atake()
+
+
+async def atake_upload_urls(count):
+    """
+    업로드 URL count개를 요청해서 (발급된 result 목록, 실패한 요청의 오류 목록)을 return
+    풀에 있는 만큼 바로 꺼내고, 나머지는 동시에 발급 (일부가 실패해도 나머지는 return)
+    """
+    results = []
+    if settings.CLOUDFLARE_UPLOAD_URL_POOL_SIZE > 0:
+        results = get_pool().take_many(count)
+    outcomes = await asyncio.gather(
+        *(amint_upload_url() for _ in range(count - len(results))),
+        return_exceptions=True,
+    )
+    errors = []
+    for outcome in outcomes:
+        if isinstance(outcome, CloudflareError):
+            errors.append({"errors": outcome.errors})
+        elif isinstance(outcome, request_errors()):
+            errors.append({"error": str(outcome)})
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results.append(outcome)
+    return results, errors
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        _pool = UploadURLPool(
+            size=settings.CLOUDFLARE_UPLOAD_URL_POOL_SIZE,
+            ttl=settings.CLOUDFLARE_UPLOAD_URL_TTL,
+            margin=settings.CLOUDFLARE_UPLOAD_URL_MARGIN,
+        )
+    return _pool
+
+
+class UploadURLQuota:
+    """
+    사용자별 업로드 URL 발급 한도 (CLOUDFLARE_UPLOAD_URL_QUOTA개 / QUOTA_WINDOW초, 고정 구간)
+    사용량은 캐시에 저장하므로 워커 간에 공유하려면 공유 캐시(CACHE_URL)가 필요함
+    """
+
+    def __init__(self, user_id):
+        window = settings.CLOUDFLARE_UPLOAD_URL_QUOTA_WINDOW
+        now = time.time()
+        self.key = f"cloudflare:upload-urls:{user_id}:{int(now // window)}"
+        self.timeout = window
+        # 다음 구간이 시작될 때까지 남은 초
+        self.reset_in = window - now % window
+
+    def reserve(self, count):
+        """count개를 사용 처리. 한도를 넘으면 사용하지 않고 False를 return"""
+        cache.add(self.key, 0, timeout=self.timeout)
+        try:
+            used = cache.incr(self.key, count)
+        except ValueError:
+            # 그 사이 키가 evict 된 경우
+            cache.set(self.key, count, timeout=self.timeout)
+            used = count
+        if used > settings.CLOUDFLARE_UPLOAD_URL_QUOTA:
+            self.release(count)
+            return False
+        return True
+
+    def release(self, count):
+        """발급에 실패한 만큼 되돌림"""
+        if count:
+            try:
+                cache.decr(self.key, count)
+            except ValueError:
+                pass
+
+    async def areserve(self, count):
+        await cache.aadd(self.key, 0, timeout=self.timeout)
+        try:
+            used = await cache.aincr(self.key, count)
+        except ValueError:
+            await cache.aset(self.key, count, timeout=self.timeout)
+            used = count
+        if used > settings.CLOUDFLARE_UPLOAD_URL_QUOTA:
+            await self.arelease(count)
+            return False
+        return True
+
+    async def arelease(self, count):
+        if count:
+            try:
+                await cache.adecr(self.key, count)
+            except ValueError:
+                pass
+
+
+@receiver(setting_changed)
+def reset_client(setting, **kwargs):
+    # 설정이 바뀌면(테스트의 override_settings 등) 세션과 풀을 새 설정으로 다시 만듦
+    global _session, _pool
+    if setting.startswith("CLOUDFLARE_"):
+        _session = None
+        _pool = None
+        _async_clients.clear()
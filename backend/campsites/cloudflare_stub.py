@@ -0,0 +1,143 @@
+"""
+Cloudflare Images direct upload API를 흉내 내는 로컬 HTTP 서버 (오프라인 개발/테스트용)
+
+    POST /client/v4/accounts/<account>/images/v2/direct_upload
+        -> {"success": true, "result": {"id": ..., "uploadURL": ...}}
+    POST /upload/<id>   (발급한 uploadURL, 파일은 저장하지 않음)
+
+개발 서버에서는 `python manage.py cloudflare_stub` 으로 띄우고
+CLOUDFLARE_API_URL=http://127.0.0.1:8787/client/v4 로 지정해서 사용
+"""
+
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_MINT_PATH = re.compile(r"^/client/v4/accounts/[^/]+/images/v2/direct_upload$")
+
+
+class CloudflareStub:
+    """
+    with CloudflareStub() as stub:
+        override_settings(CLOUDFLARE_API_URL=stub.api_url)
+
+    - minted: 발급한 URL 수, connections: 받은 TCP 연결 수 (keep-alive 확인용)
+    - fail_next(count, status): 다음 count번의 발급 요청을 status로 실패시킴
+    - reject_next(count): 다음 count번은 200이지만 success: false로 응답
+    - delay: 발급 응답 전에 기다릴 시간(초)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, delay=0):
+        self.delay = delay
+        self.minted = 0
+        self.connections = 0
+        self.authorizations = []
+        self._failures = []
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), _handler_class(self))
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self):
+        return f"{self.base_url}/client/v4"
+
+    def fail_next(self, count, status=503):
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def reject_next(self, count):
+        with self._lock:
+            self._failures.extend([None] * count)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _next_failure(self):
+        with self._lock:
+            if self._failures:
+                return True, self._failures.pop(0)
+        return False, None
+
+    def _mint(self):
+        image_id = str(uuid.uuid4())
+        with self._lock:
+            self.minted += 1
+        return {"id": image_id, "uploadURL": f"{self.base_url}/upload/{image_id}"}
+
+
+def _handler_class(stub):
+    class Handler(BaseHTTPRequestHandler):
+        # keep-alive 연결 재사용을 확인할 수 있도록 HTTP/1.1로 응답
+        protocol_version = "HTTP/1.1"
+        # 헤더와 본문을 따로 쓰므로 keep-alive 연결에서 Nagle 지연(약 40ms)이 생기지 않게 함
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            super().setup()
+            with stub._lock:
+                stub.connections += 1
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_OPTIONS(self):
+            # 브라우저(프론트엔드 개발 서버)에서 uploadURL로 바로 올릴 때의 CORS preflight
+            self._send(204, None)
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if self.path.startswith("/upload/"):
+                image_id = self.path.rsplit("/", 1)[-1]
+                self._send(200, {"success": True, "result": {"id": image_id}})
+                return
+            if not _MINT_PATH.match(self.path):
+                self._send(
+                    404, {"success": False, "errors": [{"message": "not found"}]}
+                )
+                return
+
+            with stub._lock:
+                stub.authorizations.append(self.headers.get("Authorization"))
+            if stub.delay:
+                time.sleep(stub.delay)
+            failed, status = stub._next_failure()
+            if failed and status is not None:
+                self._send(status, {"success": False, "errors": []})
+            elif failed:
+                errors = [{"code": 5400, "message": "rejected by stub"}]
+                self._send(200, {"success": False, "errors": errors})
+            else:
+                self._send(200, {"success": True, "result": stub._mint()})
+
+        def _send(self, status, payload):
+            body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Allow-Headers", "*")
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
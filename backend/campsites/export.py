@@ -0,0 +1,69 @@
+"""
+캠핑장 카탈로그 내보내기 (common.export로 NDJSON/CSV 스트리밍)
+"""
+
+from collections import defaultdict
+
+from common import export as common_export
+
+from . import models
+from .serializers import build_image_url
+
+CAMPSITE_FIELDS = (
+    "id",
+    "owner_id",
+    "name",
+    "address",
+    "contact_number",
+    "description",
+    "price",
+    "check_in",
+    "check_out",
+    "latitude",
+    "longitude",
+    "rating_count",
+    "rating_average",
+    "rating_1_count",
+    "rating_2_count",
+    "rating_3_count",
+    "rating_4_count",
+    "rating_5_count",
+    "created_at",
+    "updated_at",
+)
+CAMPSITE_COLUMNS = (*CAMPSITE_FIELDS, "images", "amenities")
+
+
+def campsite_rows(chunk_size=common_export.CHUNK_SIZE):
+    """
+    캠핑장 행(평점 집계 포함)에 이미지 URL 목록과 편의시설 이름 목록을 붙여 return.
+    이미지/편의시설은 캠핑장 chunk_size개마다 IN 쿼리 한 번씩으로 조회.
+    """
+    campsites = (
+        models.Campsite.objects.order_by("pk")
+        .values(*CAMPSITE_FIELDS)
+        .iterator(chunk_size=chunk_size)
+    )
+    for chunk in common_export.chunked(campsites, chunk_size):
+        ids = [row["id"] for row in chunk]
+
+        images = defaultdict(list)
+        for campsite_id, cloudflare_id in (
+            models.CampsiteImage.objects.filter(campsite_id__in=ids)
+            .order_by("campsite_id", "order", "id")
+            .values_list("campsite_id", "cloudflare_id")
+        ):
+            images[campsite_id].append(build_image_url(cloudflare_id))
+
+        amenities = defaultdict(list)
+        for campsite_id, name in (
+            models.CampsiteAmenity.objects.filter(campsite_id__in=ids)
+            .order_by("campsite_id", "amenity__name")
+            .values_list("campsite_id", "amenity__name")
+        ):
+            amenities[campsite_id].append(name)
+
+        for row in chunk:
+            row["images"] = images[row["id"]]
+            row["amenities"] = amenities[row["id"]]
+            yield row
@@ -0,0 +1,68 @@
+"""
+필터 사이드바용 facet 개수 (편의시설별/사이트 유형별 캠핑장 수)
+
+facet마다 COUNT 쿼리를 따로 실행하지 않고, 편의시설별/유형별 GROUP BY와 전체 개수를
+UNION ALL로 묶어 쿼리 한 번으로 계산함. 결과는 목록과 같은 버전 키로 캐싱됨.
+"""
+
+from django.db.models import Count, F, IntegerField, Q, Value
+
+from . import models
+
+AMENITY = "amenity"
+CAMP_TYPE = "camp_type"
+TOTAL = "total"
+
+
+def facet_counts(campsites):
+    """
+    campsites(필터가 적용된 queryset)에 대한 facet 개수를 return
+    해당 캠핑장이 없는 편의시설/유형도 0으로 포함됨
+    """
+    matched_ids = campsites.order_by().values("pk")
+    no_key = Value(None, output_field=IntegerField())
+
+    amenities = (
+        models.Amenity.objects.order_by()
+        .annotate(
+            kind=Value(AMENITY),
+            key=F("id"),
+            label=F("name"),
+            count=Count(
+                "campsites", filter=Q(campsites__in=matched_ids), distinct=True
+            ),
+        )
+        .values_list("kind", "key", "label", "count")
+    )
+    camp_types = (
+        models.Site.objects.order_by()
+        .values("camp_type")
+        .annotate(
+            kind=Value(CAMP_TYPE),
+            key=no_key,
+            label=F("camp_type"),
+            count=Count("campsite", filter=Q(campsite__in=matched_ids), distinct=True),
+        )
+        .values_list("kind", "key", "label", "count")
+    )
+    total = (
+        campsites.order_by()
+        .annotate(kind=Value(TOTAL))
+        .values("kind")
+        .annotate(key=no_key, label=Value(""), count=Count("pk"))
+        .values_list("kind", "key", "label", "count")
+    )
+
+    result = {"count": 0, "amenities": [], "camp_types": []}
+    for kind, key, label, count in amenities.union(camp_types, total, all=True):
+        if kind == AMENITY:
+            result["amenities"].append({"id": key, "name": label, "count": count})
+        elif kind == CAMP_TYPE:
+            result["camp_types"].append({"camp_type": label, "count": count})
+        else:
+            result["count"] = count
+
+    # 개수가 많은 순, 같으면 이름순
+    result["amenities"].sort(key=lambda item: (-item["count"], item["name"]))
+    result["camp_types"].sort(key=lambda item: (-item["count"], item["camp_type"]))
+    return result
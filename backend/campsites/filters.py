@@ -0,0 +1,104 @@
+import django_filters
+from django.db.models import F
+from rest_framework import filters
+
+from . import models, serializers
+
+
+class NumberInFilter(django_filters.BaseInFilter, django_filters.NumberFilter):
+    pass
+
+
+class CharInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
+    pass
+
+
+class CampsiteFilter(django_filters.FilterSet):
+    """
+    캠핑장 목록 필터
+    - price_min, price_max: 요금 범위
+    - check_in_after, check_in_before / check_out_after, check_out_before: 날짜 범위
+    - amenities=1,2: 지정한 편의시설을 모두 갖춘 캠핑장
+    - owner: 소유자 id
+    - camp_type=오토캠핑,글램핑: 해당 유형의 사이트가 하나라도 있는 캠핑장
+
+    연관 테이블 조건은 JOIN 대신 id IN (서브쿼리)로 걸어 중복 행/DISTINCT 없이
+    각 테이블의 (조건 컬럼, campsite) 인덱스로 처리함.
+    """
+
+    price = django_filters.RangeFilter()
+    check_in = django_filters.DateFromToRangeFilter()
+    check_out = django_filters.DateFromToRangeFilter()
+    # ModelChoiceFilter는 값 검증을 위해 사용자 테이블을 한 번 더 조회하므로 id로만 필터
+    owner = django_filters.NumberFilter(field_name="owner_id")
+    amenities = NumberInFilter(method="filter_amenities")
+    camp_type = CharInFilter(method="filter_camp_type")
+
+    class Meta:
+        model = models.Campsite
+        fields = ["price", "check_in", "check_out", "owner", "amenities", "camp_type"]
+
+    def filter_amenities(self, queryset, name, value):
+        for amenity_id in value:
+            queryset = queryset.filter(
+                id__in=models.CampsiteAmenity.objects.filter(
+                    amenity_id=amenity_id
+                ).values("campsite_id")
+            )
+        return queryset
+
+    def filter_camp_type(self, queryset, name, value):
+        return queryset.filter(
+            id__in=models.Site.objects.filter(camp_type__in=value).values("campsite_id")
+        )
+
+
+class StayPriceFilter(filters.BaseFilterBackend):
+    """
+    숙박 기간 요금 필터/정렬 (일자 요금표 SiteDailyPrice 기반)
+
+    ?stay_start=2024-07-01&stay_end=2024-07-03&min_stay_price=&max_stay_price=
+    기간 내 가장 저렴한 사이트의 총 요금(stay_price)을 annotate 하므로
+    ?ordering=stay_price 로 정렬할 수 있음 (OrderingFilter보다 앞에 있어야 함)
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        ordering = params.get("ordering", "")
+        wants_ordering = "stay_price" in ordering.replace("-", "").split(",")
+        if not (
+            wants_ordering
+            or any(
+                name in params for name in serializers.StayPriceQuerySerializer.FIELDS
+            )
+        ):
+            return queryset
+
+        query = serializers.StayPriceQuerySerializer(data=params)
+        query.is_valid(raise_exception=True)
+        stay = query.validated_data
+        queryset = queryset.with_stay_price(stay["stay_start"], stay["stay_end"])
+        if "min_stay_price" in stay:
+            queryset = queryset.filter(stay_price__gte=stay["min_stay_price"])
+        if "max_stay_price" in stay:
+            queryset = queryset.filter(stay_price__lte=stay["max_stay_price"])
+        return queryset
+
+
+class CampsiteOrderingFilter(filters.OrderingFilter):
+    """stay_price 정렬 시 요금표가 없는 캠핑장(NULL)은 DB 종류와 관계없이 항상 마지막에 둠"""
+
+    nulls_last_fields = ("stay_price",)
+
+    def filter_queryset(self, request, queryset, view):
+        ordering = self.get_ordering(request, queryset, view)
+        if not ordering:
+            return queryset
+        return queryset.order_by(*(self._expression(term) for term in ordering))
+
+    def _expression(self, term):
+        if not isinstance(term, str) or term.lstrip("-") not in self.nulls_last_fields:
+            return term
+        if term.startswith("-"):
+            return F(term[1:]).desc(nulls_last=True)
+        return F(term).asc(nulls_last=True)
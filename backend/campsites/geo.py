@@ -0,0 +1,190 @@
+"""
+캠핑장 위치(위도/경도) 검색
+
+- 지오코딩: 외부 서비스 없이 AddressGeocode 테이블(주소 접두어 -> 좌표)에서
+  가장 긴 접두어가 일치하는 좌표를 사용 (geocode_campsites 명령으로 일괄 처리)
+- 격자 인덱스: 위경도를 0.1도 격자 칸 번호(geo_cell)로 저장하고 (geo_cell, latitude, longitude)
+  복합 인덱스를 둠. 같은 위도 줄의 칸 번호는 연속이므로 반경/영역 검색은
+  "줄 수만큼의 geo_cell BETWEEN 범위"로 인덱스를 읽은 뒤 정확한 거리로 거름.
+
+서비스 지역(한국) 기준이므로 날짜변경선(경도 ±180)을 넘는 영역은 고려하지 않음.
+"""
+
+import csv
+import math
+import re
+
+from django.db.models import F, Q
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+# 격자 한 칸의 크기 (0.1도 = 위도 방향 약 11km)
+CELLS_PER_DEGREE = 10
+CELL_COLUMNS = 360 * CELLS_PER_DEGREE
+
+# 너무 넓은 영역은 격자 범위가 많아지므로 제한
+MAX_RADIUS_KM = 200
+MAX_BBOX_DEGREES = 5
+
+# 시/도 이름의 여러 표기를 짧은 이름으로 통일
+PROVINCE_ALIASES = {
+    "서울특별시": "서울",
+    "서울시": "서울",
+    "부산광역시": "부산",
+    "부산시": "부산",
+    "대구광역시": "대구",
+    "대구시": "대구",
+    "인천광역시": "인천",
+    "인천시": "인천",
+    "광주광역시": "광주",
+    "대전광역시": "대전",
+    "대전시": "대전",
+    "울산광역시": "울산",
+    "울산시": "울산",
+    "세종특별자치시": "세종",
+    "세종시": "세종",
+    "경기도": "경기",
+    "강원도": "강원",
+    "강원특별자치도": "강원",
+    "충청북도": "충북",
+    "충청남도": "충남",
+    "전라북도": "전북",
+    "전북특별자치도": "전북",
+    "전라남도": "전남",
+    "경상북도": "경북",
+    "경상남도": "경남",
+    "제주특별자치도": "제주",
+    "제주도": "제주",
+}
+MAX_PREFIX_TOKENS = 4
+
+_ADDRESS_TOKEN_RE = re.compile(r"[^\s,()]+")
+
+
+# --- 격자 ---
+
+
+def cell_row(latitude):
+    return min(
+        int(math.floor((latitude + 90) * CELLS_PER_DEGREE)), 180 * CELLS_PER_DEGREE
+    )
+
+
+def cell_column(longitude):
+    return min(int(math.floor((longitude + 180) * CELLS_PER_DEGREE)), CELL_COLUMNS - 1)
+
+
+def cell_for(latitude, longitude):
+    """위경도가 속한 격자 칸 번호 (좌표가 없으면 None)"""
+    if latitude is None or longitude is None:
+        return None
+    return cell_row(latitude) * CELL_COLUMNS + cell_column(longitude)
+
+
+def bbox_around(latitude, longitude, radius_km):
+    """중심점에서 반경 radius_km 원을 감싸는 (min_lat, min_lng, max_lat, max_lng)"""
+    delta_lat = radius_km / KM_PER_DEGREE
+    # 극지방 근처에서 0으로 나누지 않도록 cos 값의 하한을 둠
+    delta_lng = radius_km / (
+        KM_PER_DEGREE * max(math.cos(math.radians(latitude)), 0.01)
+    )
+    return (
+        max(latitude - delta_lat, -90.0),
+        max(longitude - delta_lng, -180.0),
+        min(latitude + delta_lat, 90.0),
+        min(longitude + delta_lng, 180.0),
+    )
+
+
+def _bbox_filter(min_lat, min_lng, max_lat, max_lng):
+    # 위도 한 줄의 칸 번호는 연속이므로 줄마다 BETWEEN 범위 하나로 표현됨
+    first_column, last_column = cell_column(min_lng), cell_column(max_lng)
+    cells = Q()
+    for row in range(cell_row(min_lat), cell_row(max_lat) + 1):
+        base = row * CELL_COLUMNS
+        cells |= Q(geo_cell__range=(base + first_column, base + last_column))
+    return cells & Q(
+        latitude__range=(min_lat, max_lat),
+        longitude__range=(min_lng, max_lng),
+    )
+
+
+def distance_expression(latitude, longitude):
+    """(latitude, longitude)까지의 대원 거리(km)를 계산하는 haversine 식"""
+    lat = math.radians(latitude)
+    lng = math.radians(longitude)
+    half_dlat = (Radians(F("latitude")) - lat) / 2
+    half_dlng = (Radians(F("longitude")) - lng) / 2
+    a = Power(Sin(half_dlat), 2) + math.cos(lat) * Cos(Radians(F("latitude"))) * Power(
+        Sin(half_dlng), 2
+    )
+    return 2 * EARTH_RADIUS_KM * ASin(Sqrt(a))
+
+
+def within_radius(queryset, latitude, longitude, radius_km):
+    """반경 radius_km 안의 캠핑장을 가까운 순으로 정렬하고 distance_km를 annotate"""
+    bbox = bbox_around(latitude, longitude, radius_km)
+    return (
+        queryset.filter(_bbox_filter(*bbox))
+        .annotate(distance_km=distance_expression(latitude, longitude))
+        .filter(distance_km__lte=radius_km)
+        .order_by("distance_km", "id")
+    )
+
+
+def within_bbox(queryset, min_lat, min_lng, max_lat, max_lng):
+    """영역 안의 캠핑장 (지도 화면 검색용)"""
+    return queryset.filter(_bbox_filter(min_lat, min_lng, max_lat, max_lng))
+
+
+# --- 지오코딩 ---
+
+
+def normalize_address(address):
+    """주소를 비교용 토큰 문자열로 정규화 ("강원도 평창군" -> "강원 평창군")"""
+    tokens = _ADDRESS_TOKEN_RE.findall(address or "")
+    if tokens:
+        tokens[0] = PROVINCE_ALIASES.get(tokens[0], tokens[0])
+    return " ".join(tokens)
+
+
+class Geocoder:
+    """
+    주소 접두어 -> 좌표 조회표를 메모리에 올려두고 가장 긴 접두어로 좌표를 찾음
+    (시/도 < 시/군/구 < 읍/면/동 순으로 구체적인 좌표가 우선)
+    """
+
+    def __init__(self, entries):
+        self.table = {
+            normalize_address(prefix): (latitude, longitude)
+            for prefix, latitude, longitude in entries
+        }
+
+    @classmethod
+    def from_table(cls):
+        from .models import AddressGeocode
+
+        return cls(
+            AddressGeocode.objects.values_list("prefix", "latitude", "longitude")
+        )
+
+    def lookup(self, address):
+        """(latitude, longitude)를 return (일치하는 접두어가 없으면 None)"""
+        tokens = normalize_address(address).split()
+        for size in range(min(len(tokens), MAX_PREFIX_TOKENS), 0, -1):
+            coordinates = self.table.get(" ".join(tokens[:size]))
+            if coordinates is not None:
+                return coordinates
+        return None
+
+
+def read_geocode_csv(path):
+    """prefix,latitude,longitude 헤더를 가진 CSV 파일을 읽어 (prefix, lat, lng) 목록을 return"""
+    with open(path, newline="", encoding="utf-8") as file:
+        return [
+            (row["prefix"].strip(), float(row["latitude"]), float(row["longitude"]))
+            for row in csv.DictReader(file)
+            if row.get("prefix", "").strip()
+        ]
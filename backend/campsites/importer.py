@@ -0,0 +1,234 @@
+"""
+캠핑장 대량 가져오기 (파트너 카탈로그 등록용)
+
+입력 한 행 = 캠핑장 하나 (NDJSON 또는 CSV, CSV의 목록/객체 칸은 JSON 문자열)
+    name, address, description, price, check_in, check_out, contact_number,
+    layout_image_url, latitude, longitude,
+    image_ids: [Cloudflare 이미지 ID, ...] (최소 3개)
+    policy: {check_in_time, check_out_time, manner_time_start, manner_time_end}
+    amenities: [편의시설 이름, ...]  (없는 이름은 새로 생성)
+    sites: [{name, camp_type, base_price}, ...]
+
+CHUNK_SIZE행씩 묶어서
+1. serializer 인스턴스 하나로 행을 검증 (실패한 행은 오류만 기록하고 건너뜀)
+2. 편의시설 이름은 묶음 전체를 IN 쿼리 한 번으로 조회
+3. 캠핑장/사이트는 bulk_create(pk 필요), 이미지/정책/편의시설 연결은
+   common.imports.bulk_insert, 일자 요금표는 common.imports.insert_rows
+   (PostgreSQL에서는 둘 다 COPY)
+4. 진행 상황(CampsiteImport.processed)을 같은 트랜잭션에서 갱신
+bulk_create는 save()와 시그널을 거치지 않으므로 파생 필드 계산, 요금표 생성,
+캐시 무효화를 여기서 직접 함
+"""
+
+import itertools
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+
+from common import cache as common_cache
+from common import export as common_export
+from common import imports as common_imports
+
+from . import cache, models, pricing, serializers
+
+CHUNK_SIZE = 500
+# 일자 요금표는 사이트당 PRICE_CALENDAR_DAYS행이므로 이 행 수마다 나누어 저장
+PRICE_FLUSH_SIZE = 20000
+JSON_COLUMNS = ("image_ids", "policy", "amenities", "sites")
+# pricing.daily_price_values()의 값 순서
+DAILY_PRICE_COLUMNS = ("site_id", "campsite_id", "date", "price")
+CAMPSITE_FIELDS = (
+    "name",
+    "address",
+    "description",
+    "price",
+    "contact_number",
+    "check_in",
+    "check_out",
+    "layout_image_url",
+    "latitude",
+    "longitude",
+)
+
+
+class ImportConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "같은 파일을 다른 곳에서 가져오는 중입니다."
+    default_code = "import_conflict"
+
+
+class ImportTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = "파일이 너무 큽니다. import_campsites 명령으로 가져오세요."
+    default_code = "import_too_large"
+
+
+def start(stream, source_name, owner, input_format=None):
+    """
+    stream 내용(checksum)에 해당하는 가져오기 기록을 return (없으면 생성)
+    이어서 가져오는 경우 처음 지정한 소유자와 형식을 그대로 사용
+    """
+    job, _ = models.CampsiteImport.objects.get_or_create(
+        checksum=common_imports.checksum(stream),
+        defaults={
+            "source_name": source_name[:255],
+            "input_format": input_format or common_imports.detect_format(source_name),
+            "owner": owner,
+        },
+    )
+    return job
+
+
+def run(job, stream, chunk_size=CHUNK_SIZE, on_progress=None):
+    """job.processed행 이후부터 가져오기를 진행. 묶음마다 on_progress(job) 호출"""
+    if job.completed_at is not None:
+        return job
+    records = common_imports.read_records(stream, job.input_format, JSON_COLUMNS)
+    importer = _ChunkImporter(job)
+    for chunk in common_export.chunked(
+        itertools.islice(records, job.processed, None), chunk_size
+    ):
+        importer.import_chunk(chunk)
+        if on_progress is not None:
+            on_progress(job)
+    job.completed_at = timezone.now()
+    job.save(update_fields=["completed_at", "updated_at"])
+    return job
+
+
+class _ChunkImporter:
+    def __init__(self, job):
+        self.job = job
+        # 필드 구성은 한 번만 하고 모든 행에 재사용
+        self.serializer = serializers.CampsiteImportRecordSerializer()
+
+    def import_chunk(self, chunk):
+        rows, errors = self._validate(chunk)
+        job = self.job
+        with transaction.atomic():
+            processed = (
+                models.CampsiteImport.objects.select_for_update()
+                .values_list("processed", flat=True)
+                .get(pk=job.pk)
+            )
+            if processed != job.processed:
+                raise ImportConflict()
+            created = self._insert(rows)
+            job.processed += len(chunk)
+            job.created_count += created
+            job.failed_count += len(errors)
+            job.errors = (job.errors + errors)[: models.CampsiteImport.MAX_ERRORS]
+            job.save(
+                update_fields=[
+                    "processed",
+                    "created_count",
+                    "failed_count",
+                    "errors",
+                    "updated_at",
+                ]
+            )
+
+    def _validate(self, chunk):
+        rows, errors = [], []
+        for number, record, error in chunk:
+            if record is not None:
+                try:
+                    rows.append(self.serializer.run_validation(record))
+                    continue
+                except ValidationError as exc:
+                    error = exc.detail
+            errors.append({"line": number, "errors": error})
+        return rows, errors
+
+    def _insert(self, rows):
+        if not rows:
+            return 0
+        campsites = []
+        for attrs in rows:
+            campsite = models.Campsite(
+                owner_id=self.job.owner_id,
+                **{field: attrs[field] for field in CAMPSITE_FIELDS if field in attrs},
+            )
+            campsite.refresh_derived_fields()
+            campsites.append(campsite)
+        models.Campsite.objects.bulk_create(
+            campsites, batch_size=common_imports.BATCH_SIZE
+        )
+
+        amenity_ids = self._amenity_ids(
+            {name for attrs in rows for name in attrs.get("amenities", ())}
+        )
+        images, policies, links, sites = [], [], [], []
+        for campsite, attrs in zip(campsites, rows):
+            images.extend(
+                models.CampsiteImage(
+                    campsite_id=campsite.pk, cloudflare_id=image_id, order=order
+                )
+                for order, image_id in enumerate(attrs["image_ids"])
+            )
+            if "policy" in attrs:
+                policies.append(
+                    models.Policy(campsite_id=campsite.pk, **attrs["policy"])
+                )
+            links.extend(
+                models.CampsiteAmenity(
+                    campsite_id=campsite.pk, amenity_id=amenity_ids[name]
+                )
+                for name in dict.fromkeys(attrs.get("amenities", ()))
+            )
+            sites.extend(
+                models.Site(campsite_id=campsite.pk, **site)
+                for site in attrs.get("sites", ())
+            )
+        common_imports.bulk_insert(models.CampsiteImage, images)
+        common_imports.bulk_insert(models.Policy, policies)
+        common_imports.bulk_insert(models.CampsiteAmenity, links)
+        models.Site.objects.bulk_create(sites, batch_size=common_imports.BATCH_SIZE)
+        self._insert_daily_prices(sites)
+
+        # 새 캠핑장은 목록/facet에만 영향을 주므로 목록 버전만 올림
+        common_cache.bump_versions(cache.LIST_VERSION_KEY)
+        return len(campsites)
+
+    def _amenity_ids(self, names):
+        if not names:
+            return {}
+        ids = dict(
+            models.Amenity.objects.filter(name__in=names).values_list("name", "id")
+        )
+        missing = names - ids.keys()
+        if missing:
+            models.Amenity.objects.bulk_create(
+                [models.Amenity(name=name) for name in sorted(missing)],
+                ignore_conflicts=True,
+            )
+            ids.update(
+                models.Amenity.objects.filter(name__in=missing).values_list(
+                    "name", "id"
+                )
+            )
+        return ids
+
+    def _insert_daily_prices(self, sites):
+        # 새 캠핑장에는 요금 규칙이 없으므로 DB를 다시 읽지 않고 기본 요금만으로 계산
+        by_campsite = defaultdict(list)
+        for site in sites:
+            by_campsite[site.campsite_id].append(
+                (site.pk, site.name, site.camp_type, site.base_price)
+            )
+        start, end = pricing.calendar_horizon()
+        pending = []
+        for campsite_id, site_rows in by_campsite.items():
+            compiled = pricing.CompiledPricing.build(site_rows, [])
+            pending.extend(
+                pricing.daily_price_values(campsite_id, compiled, start, end)
+            )
+            if len(pending) >= PRICE_FLUSH_SIZE:
+                common_imports.insert_rows(
+                    models.SiteDailyPrice, DAILY_PRICE_COLUMNS, pending
+                )
+                pending = []
+        common_imports.insert_rows(models.SiteDailyPrice, DAILY_PRICE_COLUMNS, pending)
@@ -0,0 +1,149 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from campsites import models, serializers
+from campsites.sample_data import seed_catalogue
+from common import fast_serializers
+from common import serializers as common_serializers
+from communities import models as community_models
+from communities import serializers as community_serializers
+
+
+class Command(BaseCommand):
+    help = (
+        "목록 직렬화 경로별 소요 시간 비교 (ModelSerializer vs .values() fast path). "
+        "두 경로의 JSON이 바이트 단위로 같은지도 확인함. "
+        "serializer 필드 구성 캐시(common.serializers) 사용 전후의 요청당 비용도 비교"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=100, help="한 번에 직렬화할 행 수 (기본 100)"
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="반복 횟수 (가장 빠른 값을 사용)"
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="지정한 수만큼 임시 캠핑장(이미지/리뷰 포함)을 만들어 측정 (측정 후 롤백)",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            try:
+                if options["seed"]:
+                    owner = get_user_model().objects.create_user(
+                        email="bench-owner@example.com", username="bench-owner"
+                    )
+                    seed_catalogue(owner, campsites=options["seed"])
+                self._bench_all(options["rows"], options["repeat"])
+                self._bench_field_cache(options["repeat"])
+            finally:
+                # 측정은 읽기만 하지만 --seed로 만든 데이터는 남기지 않음
+                transaction.set_rollback(True)
+
+    def _bench_all(self, rows, repeat):
+        campsites = models.Campsite.objects.for_response(
+            set(serializers.CampsiteListSerializer().fields)
+        ).order_by("-created_at", "-id")
+        reviews = community_models.Review.objects.select_related("user").order_by(
+            "-created_at", "-id"
+        )
+        for label, serializer_class, queryset in (
+            ("캠핑장 목록", serializers.CampsiteListSerializer, campsites),
+            ("리뷰 목록", community_serializers.ReviewSerializer, reviews),
+        ):
+            self._bench(label, serializer_class, queryset, rows, repeat)
+
+    def _bench(self, label, serializer_class, queryset, rows, repeat):
+        renderer = JSONRenderer()
+        columns = fast_serializers.queryset_columns(queryset)
+
+        def model_path(instances):
+            return renderer.render(serializer_class(instances, many=True).data)
+
+        def values_path(values):
+            plan = serializer_class().compile_values_plan(columns)
+            return renderer.render(plan.render(values))
+
+        plan = serializer_class().compile_values_plan(columns)
+        instances = list(queryset[:rows])
+        values = list(queryset.values(*plan.columns)[:rows])
+        if not instances:
+            raise CommandError(
+                f"{label}: 측정할 데이터가 없습니다. --seed 옵션을 사용하세요."
+            )
+        if model_path(instances) != values_path(values):
+            raise CommandError(f"{label}: 두 경로의 응답이 다릅니다.")
+
+        timings = [
+            ("직렬화", lambda: model_path(instances), lambda: values_path(values)),
+            (
+                "쿼리 포함",
+                lambda: model_path(list(queryset[:rows])),
+                lambda: values_path(list(queryset.values(*plan.columns)[:rows])),
+            ),
+        ]
+        for name, slow, fast in timings:
+            slow_ms = _best_ms(slow, repeat)
+            fast_ms = _best_ms(fast, repeat)
+            self.stdout.write(
+                f"{label} {len(instances)}행 {name}: "
+                f"ModelSerializer {slow_ms:.2f}ms, values {fast_ms:.2f}ms "
+                f"({slow_ms / fast_ms:.1f}배)"
+            )
+
+    def _bench_field_cache(self, repeat):
+        campsite = models.Campsite.objects.with_detail_relations().first()
+        campsites = list(models.Campsite.objects.with_thumbnail()[:10])
+        reviews = list(community_models.Review.objects.select_related("user")[:10])
+
+        def detail_fields():
+            # 상세 응답 한 번에 만들어지는 serializer들의 필드 구성
+            serializer = serializers.CampsiteDetailSerializer()
+            for name in ("policy", "amenities", "images"):
+                field = serializer.fields[name]
+                getattr(field, "child", field).fields
+
+        cases = [
+            ("상세 필드 구성", detail_fields),
+            (
+                "상세 응답",
+                lambda: serializers.CampsiteDetailSerializer(campsite).data,
+            ),
+            (
+                "목록 10행 응답",
+                lambda: serializers.CampsiteListSerializer(campsites, many=True).data,
+            ),
+            (
+                "리뷰 10행 응답",
+                lambda: community_serializers.ReviewSerializer(reviews, many=True).data,
+            ),
+        ]
+        mixin = common_serializers.CachedFieldsMixin
+        for name, func in cases:
+            mixin.cache_fields = False
+            try:
+                slow_ms = _best_ms(func, repeat)
+            finally:
+                mixin.cache_fields = True
+            fast_ms = _best_ms(func, repeat)
+            self.stdout.write(
+                f"{name}: 필드 캐시 없음 {slow_ms:.3f}ms, 캐시 {fast_ms:.3f}ms "
+                f"({slow_ms - fast_ms:.3f}ms 절약)"
+            )
+
+
+def _best_ms(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
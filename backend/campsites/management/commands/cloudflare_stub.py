@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from campsites.cloudflare_stub import CloudflareStub
+
+
+class Command(BaseCommand):
+    help = (
+        "Cloudflare Images direct upload API를 흉내 내는 로컬 서버를 실행 (오프라인 개발용). "
+        "출력된 CLOUDFLARE_API_URL을 .env에 지정해서 사용"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8787)
+        parser.add_argument(
+            "--delay",
+            type=float,
+            default=0,
+            help="발급 응답 지연 (초, 느린 API 재현용)",
+        )
+
+    def handle(self, *args, **options):
+        stub = CloudflareStub(options["host"], options["port"], options["delay"])
+        self.stdout.write(
+            self.style.SUCCESS(f"CLOUDFLARE_API_URL={stub.api_url}")
+            + " (Ctrl+C로 종료)"
+        )
+        try:
+            stub.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stub.server.server_close()
@@ -0,0 +1,50 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from campsites import export as campsite_export
+from common import export as common_export
+from communities import export as community_export
+
+RESOURCES = {
+    "campsites": (campsite_export.CAMPSITE_COLUMNS, campsite_export.campsite_rows),
+    "reviews": (community_export.REVIEW_COLUMNS, community_export.review_rows),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "캠핑장(이미지, 편의시설, 평점 집계 포함) 또는 리뷰 전체를 NDJSON/CSV로 내보냄. "
+        "chunk-size행씩 읽어 바로 쓰므로 행 수와 관계없이 메모리 사용량이 일정함"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("resource", choices=RESOURCES)
+        parser.add_argument(
+            "--format",
+            dest="output_format",
+            choices=common_export.CONTENT_TYPES,
+            default="ndjson",
+        )
+        parser.add_argument(
+            "--output", "-o", default="-", help="저장할 파일 경로 (기본: 표준 출력)"
+        )
+        parser.add_argument("--chunk-size", type=int, default=common_export.CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        columns, get_rows = RESOURCES[options["resource"]]
+        rows = get_rows(options["chunk_size"])
+        if options["output"] == "-":
+            count = common_export.write(
+                sys.stdout.buffer, options["output_format"], columns, rows
+            )
+        else:
+            with open(options["output"], "wb") as stream:
+                count = common_export.write(
+                    stream, options["output_format"], columns, rows
+                )
+        # 표준 출력은 내보내기 결과이므로 요약은 stderr로 출력
+        self.stderr.write(
+            f"{options['resource']} {count}행을 내보냈습니다.",
+            style_func=self.style.SUCCESS,
+        )
@@ -0,0 +1,108 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from campsites import cache as campsite_cache
+from campsites import geo, models
+from common import cache as common_cache
+
+DEFAULT_TABLE = Path(__file__).resolve().parents[2] / "data" / "address_geocodes.csv"
+
+
+class Command(BaseCommand):
+    help = (
+        "주소 조회표(AddressGeocode)로 캠핑장 위도/경도를 채움 (외부 지오코딩 서비스 사용 안 함). "
+        "조회표가 비어 있으면 기본 조회표(campsites/data/address_geocodes.csv)를 먼저 불러옴"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--load",
+            metavar="CSV",
+            help="prefix,latitude,longitude 형식의 CSV로 조회표를 갱신한 뒤 지오코딩",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="이미 좌표가 있는 캠핑장도 다시 계산 (기본값: 좌표가 없는 캠핑장만)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 bulk_update 할 캠핑장 수 (기본값: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        if options["load"]:
+            self._load_table(options["load"])
+        elif not models.AddressGeocode.objects.exists():
+            self._load_table(DEFAULT_TABLE)
+
+        geocoder = geo.Geocoder.from_table()
+        campsites = models.Campsite.objects.only(
+            "id", "address", "latitude", "longitude", "geo_cell"
+        ).order_by("id")
+        if not options["all"]:
+            campsites = campsites.filter(latitude__isnull=True)
+
+        now = timezone.now()
+        changed = []
+        updated = missed = 0
+        for campsite in campsites.iterator(chunk_size=batch_size):
+            coordinates = geocoder.lookup(campsite.address)
+            if coordinates is None:
+                missed += 1
+                continue
+            if (campsite.latitude, campsite.longitude) == coordinates:
+                continue
+            campsite.latitude, campsite.longitude = coordinates
+            campsite.geo_cell = geo.cell_for(*coordinates)
+            campsite.updated_at = now
+            changed.append(campsite)
+
+            if len(changed) >= batch_size:
+                updated += self._flush(changed)
+                changed = []
+        updated += self._flush(changed)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"캠핑장 좌표를 갱신했습니다. (변경: {updated}곳, 주소 일치 없음: {missed}곳)"
+            )
+        )
+
+    def _load_table(self, path):
+        try:
+            entries = geo.read_geocode_csv(path)
+        except (OSError, KeyError, ValueError) as error:
+            raise CommandError(f"조회표를 읽을 수 없습니다: {path} ({error})")
+
+        rows = {
+            geo.normalize_address(prefix): (latitude, longitude)
+            for prefix, latitude, longitude in entries
+        }
+        with transaction.atomic():
+            models.AddressGeocode.objects.filter(prefix__in=rows).delete()
+            models.AddressGeocode.objects.bulk_create(
+                models.AddressGeocode(prefix=prefix, latitude=lat, longitude=lng)
+                for prefix, (lat, lng) in rows.items()
+            )
+        self.stdout.write(f"주소 조회표 {len(rows)}건을 불러왔습니다. ({path})")
+
+    def _flush(self, campsites):
+        if not campsites:
+            return 0
+        models.Campsite.objects.bulk_update(
+            campsites, ["latitude", "longitude", "geo_cell", "updated_at"]
+        )
+        # bulk_update는 시그널을 보내지 않으므로 캐시를 직접 무효화
+        common_cache.bump_versions(
+            campsite_cache.LIST_VERSION_KEY,
+            *(campsite_cache.campsite_version_key(c.pk) for c in campsites),
+        )
+        return len(campsites)
@@ -0,0 +1,70 @@
+import json
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from campsites import importer
+from common import imports as common_imports
+
+
+class Command(BaseCommand):
+    help = (
+        "NDJSON/CSV 캠핑장 목록(이미지, 정책, 편의시설, 사이트 포함)을 chunk-size행씩 "
+        "검증하고 대량으로 저장함. 중단되면 같은 파일로 다시 실행해 이어서 가져옴"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="가져올 파일 경로")
+        parser.add_argument(
+            "--owner", required=True, help="가져온 캠핑장의 소유자 이메일"
+        )
+        parser.add_argument(
+            "--format",
+            dest="input_format",
+            choices=common_imports.FORMATS,
+            help="입력 형식 (기본: 파일 확장자로 판단)",
+        )
+        parser.add_argument("--chunk-size", type=int, default=importer.CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        owner = get_user_model().objects.filter(email=options["owner"]).first()
+        if owner is None:
+            raise CommandError(f"{options['owner']} 사용자가 없습니다.")
+
+        with open(options["path"], "rb") as stream:
+            job = importer.start(
+                stream,
+                os.path.basename(options["path"]),
+                owner,
+                options["input_format"],
+            )
+            if job.completed_at is not None:
+                self.stdout.write("이미 가져온 파일입니다.")
+            elif job.processed:
+                self.stdout.write(
+                    f"{job.processed}행까지 처리한 기록이 있어 이어서 가져옵니다."
+                )
+            try:
+                job = importer.run(
+                    job, stream, options["chunk_size"], on_progress=self._progress
+                )
+            except importer.ImportConflict as exc:
+                raise CommandError(str(exc.detail))
+
+        for error in job.errors:
+            detail = json.dumps(error["errors"], ensure_ascii=False)
+            self.stderr.write(f"{error['line']}번 줄: {detail}")
+        if job.failed_count > len(job.errors):
+            self.stderr.write(f"... 외 {job.failed_count - len(job.errors)}행 실패")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{job.processed}행 처리: 캠핑장 {job.created_count}개 생성, "
+                f"{job.failed_count}행 실패"
+            )
+        )
+
+    def _progress(self, job):
+        self.stdout.write(
+            f"{job.processed}행 처리 (생성 {job.created_count}, 실패 {job.failed_count})"
+        )
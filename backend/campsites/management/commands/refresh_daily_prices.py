@@ -0,0 +1,81 @@
+import datetime
+
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+from django.utils import timezone
+
+from campsites import cache as campsite_cache
+from campsites import models, pricing
+from common import cache as common_cache
+
+TOUCH_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "사이트별 일자 요금표(SiteDailyPrice)를 오늘부터 PRICE_CALENDAR_DAYS일로 유지. "
+        "지난 날짜는 지우고, 요금표 끝에 새로 들어온 날짜만 계산함 (매일 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="이미 계산된 날짜도 모두 다시 계산",
+        )
+        parser.add_argument(
+            "--campsite",
+            type=int,
+            action="append",
+            dest="campsites",
+            help="지정한 캠핑장만 처리 (여러 번 지정 가능)",
+        )
+
+    def handle(self, *args, **options):
+        first, last = pricing.calendar_horizon()
+
+        prices = models.SiteDailyPrice.objects.all()
+        campsites = models.Campsite.objects.filter(sites__isnull=False).distinct()
+        if options["campsites"]:
+            prices = prices.filter(campsite_id__in=options["campsites"])
+            campsites = campsites.filter(pk__in=options["campsites"])
+
+        expired, _ = prices.filter(date__lt=first).delete()
+
+        # 캠핑장별로 이미 계산된 마지막 날짜를 GROUP BY 한 번으로 조회
+        computed_until = dict(
+            prices.values("campsite_id")
+            .annotate(last_date=Max("date"))
+            .values_list("campsite_id", "last_date")
+        )
+
+        refreshed = []
+        rows = 0
+        for campsite_id in campsites.values_list("pk", flat=True).order_by("pk"):
+            start = first
+            last_date = computed_until.get(campsite_id)
+            if last_date is not None and not options["full"]:
+                start = last_date + datetime.timedelta(days=1)
+            if start >= last:
+                continue
+            rows += pricing.refresh_daily_prices(campsite_id, start, last)
+            refreshed.append(campsite_id)
+        self._touch(refreshed)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"일자 요금표를 갱신했습니다. "
+                f"(캠핑장: {len(refreshed)}곳, 계산: {rows}행, 만료 삭제: {expired}행)"
+            )
+        )
+
+    def _touch(self, campsite_ids):
+        # 기간 요금 검색 결과가 바뀌었으므로 조건부 GET validator(updated_at)와 응답 캐시를 갱신
+        now = timezone.now()
+        for index in range(0, len(campsite_ids), TOUCH_BATCH_SIZE):
+            batch = campsite_ids[index : index + TOUCH_BATCH_SIZE]
+            models.Campsite.objects.filter(pk__in=batch).update(updated_at=now)
+            common_cache.bump_versions(
+                campsite_cache.LIST_VERSION_KEY,
+                *(campsite_cache.campsite_version_key(pk) for pk in batch),
+            )
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campsites", "0006_alter_campsite_options_remove_campsite_blog_url_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="campsite",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="campsite_created_id_idx"
+            ),
+        ),
+    ]
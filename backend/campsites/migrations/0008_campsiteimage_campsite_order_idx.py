@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campsites", "0007_campsite_created_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="campsiteimage",
+            index=models.Index(
+                fields=["campsite", "order"], name="campsiteimage_campsite_ord_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campsites", "0008_campsiteimage_campsite_order_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campsite",
+            name="amenities",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="campsites",
+                through="campsites.CampsiteAmenity",
+                to="campsites.amenity",
+            ),
+        ),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:35
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def populate_rating_aggregates(apps, schema_editor):
+    Campsite = apps.get_model("campsites", "Campsite")
+    Review = apps.get_model("communities", "Review")
+
+    histogram = {
+        f"rating_{star}_count": Count("id", filter=Q(rating=star))
+        for star in range(1, 6)
+    }
+    stats = Review.objects.values("campsite_id").annotate(
+        rating_count=Count("id"), rating_sum=Sum("rating"), **histogram
+    )
+    campsites = []
+    for row in stats:
+        campsite = Campsite(pk=row.pop("campsite_id"), **row)
+        campsite.rating_average = round(row["rating_sum"] / row["rating_count"], 2)
+        campsites.append(campsite)
+    Campsite.objects.bulk_update(
+        campsites,
+        ["rating_count", "rating_sum", "rating_average", *histogram],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campsites", "0009_campsite_amenities"),
+        ("communities", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campsite",
+            name="rating_1_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="campsite",
+            name="rating_2_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="campsite",
+            name="rating_3_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="campsite",
+            name="rating_4_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="campsite",
+            name="rating_5_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="campsite",
+            name="rating_average",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=3),
+        ),
+        migrations.AddField(
+            model_name="campsite",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="campsite",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="campsite",
+            index=models.Index(
+                fields=["-rating_average", "-id"], name="campsite_rating_idx"
+            ),
+        ),
+        migrations.RunPython(populate_rating_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:37
+
+from django.db import migrations, models
+
+from campsites import search
+
+
+def populate_search_document(apps, schema_editor):
+    Campsite = apps.get_model("campsites", "Campsite")
+    campsites = list(Campsite.objects.only("id", "name", "address", "description"))
+    for campsite in campsites:
+        campsite.search_document = search.build_search_document(
+            campsite.name, campsite.address, campsite.description
+        )
+    Campsite.objects.bulk_update(campsites, ["search_document"], batch_size=1000)
+
+
+def install_search_index(apps, schema_editor):
+    search.install(schema_editor.connection)
+
+
+def uninstall_search_index(apps, schema_editor):
+    search.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campsites", "0010_campsite_rating_aggregates"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campsite",
+            name="search_document",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(populate_search_document, migrations.RunPython.noop),
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
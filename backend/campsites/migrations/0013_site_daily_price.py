@@ -0,0 +1,59 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campsites", "0012_campsite_location"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SiteDailyPrice",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("price", models.DecimalField(decimal_places=2, max_digits=10)),
+                (
+                    "campsite",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_prices",
+                        to="campsites.campsite",
+                    ),
+                ),
+                (
+                    "site",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_prices",
+                        to="campsites.site",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["campsite", "date", "site", "price"],
+                        name="sitedailyprice_campsite_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("site", "date"), name="sitedailyprice_site_date_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campsites", "0013_site_daily_price"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="campsite",
+            index=models.Index(fields=["price", "id"], name="campsite_price_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="campsite",
+            index=models.Index(
+                fields=["check_in", "check_out"], name="campsite_check_in_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="campsite",
+            index=models.Index(fields=["check_out"], name="campsite_check_out_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="campsite",
+            index=models.Index(
+                fields=["owner", "-created_at", "-id"],
+                name="campsite_owner_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="campsiteamenity",
+            index=models.Index(
+                fields=["amenity", "campsite"], name="campsiteamenity_amenity_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="site",
+            index=models.Index(
+                fields=["camp_type", "campsite"], name="site_camp_type_idx"
+            ),
+        ),
+    ]
@@ -1,9 +1,133 @@
+from decimal import Decimal
+
 from django.utils import timezone
 from django.db import models
+from django.db.models.functions import Cast
 from django.core import exceptions
 from django.conf import settings
 from common.models import BaseModel
 
+from . import geo, pricing, search
+
+
+# 리뷰 평점 집계 컬럼 (CampsiteQuerySet.apply_rating_change와 rebuild_review_stats 명령만 갱신)
+RATING_FIELDS = [
+    "rating_count",
+    "rating_sum",
+    "rating_average",
+    *(f"rating_{star}_count" for star in range(1, 6)),
+]
+RATING_AVERAGE_FIELD = models.DecimalField(max_digits=3, decimal_places=2)
+
+
+class CampsiteQuerySet(models.QuerySet):
+    def with_thumbnail(self):
+        """
+        대표 이미지(order가 가장 낮은 이미지)의 cloudflare_id를
+        thumbnail_cloudflare_id로 annotate.
+        목록 조회 시 캠핑장마다 images.first()를 호출하는 N+1 쿼리를 없애기 위함.
+        """
+        first_image = CampsiteImage.objects.filter(campsite=models.OuterRef("pk"))
+        return self.annotate(
+            thumbnail_cloudflare_id=models.Subquery(
+                first_image.order_by("order", "id").values("cloudflare_id")[:1]
+            )
+        )
+
+    def with_detail_relations(self):
+        """
+        상세 조회/수정에 필요한 연관 객체를 한 번에 로드.
+        owner, policy는 JOIN으로, images와 amenities는 각각 한 번의 쿼리로 prefetch.
+        """
+        return self.select_related("owner", "policy").prefetch_related(
+            "images", "amenities"
+        )
+
+    # 응답에 없으면 읽지 않는 큰 컬럼
+    DEFERRABLE_FIELDS = ("description", "layout_image_url")
+
+    def for_response(self, fields):
+        """
+        응답에 포함될 필드(fields, ?fields=/?expand= 반영)에 필요한 것만 로드.
+        thumbnail_url은 서브쿼리, owner/policy는 JOIN, images/amenities는 prefetch로
+        가져오고 응답에 없는 큰 컬럼은 defer.
+        """
+        queryset = self
+        if "thumbnail_url" in fields:
+            queryset = queryset.with_thumbnail()
+        related = [name for name in ("owner", "policy") if name in fields]
+        if related:
+            queryset = queryset.select_related(*related)
+        prefetches = [name for name in ("images", "amenities") if name in fields]
+        if prefetches:
+            queryset = queryset.prefetch_related(*prefetches)
+        deferred = [name for name in self.DEFERRABLE_FIELDS if name not in fields]
+        if deferred:
+            queryset = queryset.defer(*deferred)
+        return queryset
+
+    def with_stay_price(self, start, end):
+        """
+        start ~ end 전날까지 묵을 때 가장 저렴한 사이트의 총 요금을 stay_price로 annotate.
+        SiteDailyPrice에서 사이트별 합계를 GROUP BY로 계산하며,
+        요금표에 모든 날짜가 있는 사이트만 대상 (없으면 NULL)
+        """
+        nights = (end - start).days
+        totals = (
+            SiteDailyPrice.objects.filter(
+                campsite=models.OuterRef("pk"), date__gte=start, date__lt=end
+            )
+            .values("site")
+            .annotate(total=models.Sum("price"), nights=models.Count("date"))
+            .filter(nights=nights)
+            .order_by("total")
+            .values("total")[:1]
+        )
+        return self.annotate(
+            stay_price=models.Subquery(
+                totals,
+                output_field=models.DecimalField(max_digits=12, decimal_places=2),
+            )
+        )
+
+    def apply_rating_change(self, campsite_id, added=None, removed=None):
+        """
+        리뷰 생성/수정/삭제에 맞춰 평점 집계를 F() 식으로 원자적으로 갱신.
+        - added: 새로 반영할 평점 (생성/수정 후 값)
+        - removed: 빼야 할 평점 (삭제/수정 전 값)
+        UPDATE의 SET 절은 갱신 전 값을 참조하므로 평균도 같은 쿼리에서 계산할 수 있음.
+        """
+        count_delta = (1 if added else 0) - (1 if removed else 0)
+        sum_delta = (added or 0) - (removed or 0)
+
+        new_count = models.F("rating_count") + count_delta
+        new_sum = models.F("rating_sum") + sum_delta
+        updates = {
+            "rating_count": new_count,
+            "rating_sum": new_sum,
+            # 컬럼과 같은 DecimalField(3, 2)로 반올림해서 저장
+            "rating_average": models.Case(
+                models.When(
+                    **{"rating_count__gt": -count_delta},
+                    then=Cast(
+                        Cast(new_sum, models.FloatField()) / new_count,
+                        RATING_AVERAGE_FIELD,
+                    ),
+                ),
+                default=models.Value(Decimal("0.00")),
+                output_field=RATING_AVERAGE_FIELD,
+            ),
+            "updated_at": timezone.now(),
+        }
+        if added != removed:
+            if added:
+                field = f"rating_{added}_count"
+                updates[field] = models.F(field) + 1
+            if removed:
+                field = f"rating_{removed}_count"
+                updates[field] = models.F(field) - 1
+        return self.filter(pk=campsite_id).update(**updates)
+
 
 class Campsite(BaseModel):
     owner = models.ForeignKey(
@@ -31,9 +155,61 @@ class Campsite(BaseModel):
 
     layout_image_url = models.URLField(blank=True)  # 사이트 배치도 이미지
 
+    # 위치 (geocode_campsites 명령으로 주소에서 채움)
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    # 반경 검색용 격자 칸 번호 (latitude/longitude에서 자동 계산)
+    geo_cell = models.PositiveIntegerField(null=True, blank=True, editable=False)
+
+    # 전문 검색용 정규화 문서 (name/address/description에서 자동 생성)
+    search_document = models.TextField(blank=True, editable=False)
+
+    # 리뷰 평점 집계 (communities.Review 생성/수정/삭제 시 갱신)
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_average = models.DecimalField(max_digits=3, decimal_places=2, default=0)
+    rating_1_count = models.PositiveIntegerField(default=0)
+    rating_2_count = models.PositiveIntegerField(default=0)
+    rating_3_count = models.PositiveIntegerField(default=0)
+    rating_4_count = models.PositiveIntegerField(default=0)
+    rating_5_count = models.PositiveIntegerField(default=0)
+
+    # CampsiteAmenity를 중간 테이블로 사용하는 M2M
+    amenities = models.ManyToManyField(
+        "Amenity",
+        through="CampsiteAmenity",
+        related_name="campsites",
+        blank=True,
+    )
+
+    objects = CampsiteQuerySet.as_manager()
+
     def __str__(self):
         return self.name  # 캠핑장 이름으로 표시
 
+    # 파생 필드(검색 문서, 격자 칸)와 그 원본 필드
+    DERIVED_FIELDS = {"search_document", "geo_cell"}
+    DERIVED_SOURCE_FIELDS = {"name", "address", "description", "latitude", "longitude"}
+
+    def refresh_derived_fields(self):
+        """
+        원본 필드로부터 파생 필드를 다시 계산.
+        bulk_create처럼 save()를 거치지 않는 경로에서는 직접 호출해야 함.
+        """
+        self.search_document = search.build_search_document(
+            self.name, self.address, self.description
+        )
+        self.geo_cell = geo.cell_for(self.latitude, self.longitude)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.refresh_derived_fields()
+        elif self.DERIVED_SOURCE_FIELDS & set(update_fields):
+            self.refresh_derived_fields()
+            kwargs["update_fields"] = {*update_fields, *self.DERIVED_FIELDS}
+        super().save(*args, **kwargs)
+
     @property
     def stay_nights(self):
         if self.check_in and self.check_out:
@@ -42,6 +218,34 @@ class Campsite(BaseModel):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # keyset 페이지네이션((created_at, id) 커서)용 복합 인덱스
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="campsite_created_id_idx",
+            ),
+            # 평점순 정렬용 인덱스
+            models.Index(
+                fields=["-rating_average", "-id"],
+                name="campsite_rating_idx",
+            ),
+            # 목록 필터용 인덱스 (campsites.filters.CampsiteFilter)
+            models.Index(fields=["price", "id"], name="campsite_price_idx"),
+            models.Index(
+                fields=["check_in", "check_out"], name="campsite_check_in_idx"
+            ),
+            models.Index(fields=["check_out"], name="campsite_check_out_idx"),
+            # 소유자별 목록을 기본 정렬(-created_at) 그대로 인덱스에서 읽기 위함
+            models.Index(
+                fields=["owner", "-created_at", "-id"],
+                name="campsite_owner_created_idx",
+            ),
+            # 반경/영역 검색용 격자 인덱스 (위경도까지 포함해 인덱스만으로 영역을 거름)
+            models.Index(
+                fields=["geo_cell", "latitude", "longitude"],
+                name="campsite_geo_cell_idx",
+            ),
+        ]
 
     def clean(self):
         super().clean()
@@ -68,6 +272,24 @@ class Campsite(BaseModel):
             )
 
 
+class AddressGeocode(BaseModel):
+    """
+    오프라인 지오코딩용 주소 접두어 -> 좌표 조회표
+    예: "강원 평창군" -> 평창군 중심 좌표
+    """
+
+    prefix = models.CharField(
+        max_length=100,
+        unique=True,
+        help_text="정규화된 주소 접두어 (시/도 이름은 짧은 이름 사용, 예: 강원 평창군)",
+    )
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+
+    def __str__(self):
+        return self.prefix
+
+
 class CampsiteImage(BaseModel):
     campsite = models.ForeignKey(
         Campsite, on_delete=models.CASCADE, related_name="images"
@@ -77,6 +299,13 @@ class CampsiteImage(BaseModel):
 
     class Meta:
         ordering = ["order"]
+        indexes = [
+            # 캠핑장별 대표 이미지(가장 낮은 order) 서브쿼리용 인덱스
+            models.Index(
+                fields=["campsite", "order"],
+                name="campsiteimage_campsite_ord_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.campsite.name} - Image (Order: {self.order})"  # "캠핑장 이름 - 이미지 (순서: 0)" 형식으로 표시
@@ -90,10 +319,51 @@ class Site(BaseModel):
     camp_type = models.CharField(max_length=50)  # 예: 오토캠핑, 글램핑
     base_price = models.DecimalField(max_digits=10, decimal_places=2)
 
+    class Meta:
+        indexes = [
+            # 사이트 유형 필터(camp_type IN -> campsite_id) 서브쿼리용
+            models.Index(fields=["camp_type", "campsite"], name="site_camp_type_idx"),
+        ]
+
     def __str__(self):
         return f"{self.campsite.name} - {self.name}"  # "캠핑장 이름 - 사이트 이름" 형식으로 표시
 
 
+class SiteDailyPrice(models.Model):
+    """
+    사이트별 일자 요금표 (오늘부터 PRICE_CALENDAR_DAYS일)
+    PricingRule/Site.base_price가 바뀌면 영향받는 날짜 구간만 다시 계산됨 (pricing.refresh_daily_prices)
+    행 수가 많은 파생 테이블이므로 created_at/updated_at(BaseModel)은 두지 않음
+    """
+
+    site = models.ForeignKey(
+        Site, on_delete=models.CASCADE, related_name="daily_prices"
+    )
+    # 캠핑장 단위 조회용 비정규화 필드
+    campsite = models.ForeignKey(
+        Campsite, on_delete=models.CASCADE, related_name="daily_prices"
+    )
+    date = models.DateField()
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["site", "date"], name="sitedailyprice_site_date_uniq"
+            ),
+        ]
+        indexes = [
+            # 캠핑장별 숙박 기간 요금 합계 서브쿼리용 (인덱스만으로 계산되도록 site, price 포함)
+            models.Index(
+                fields=["campsite", "date", "site", "price"],
+                name="sitedailyprice_campsite_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.site} - {self.date}: {self.price}"
+
+
 class Amenity(BaseModel):
     name = models.CharField(max_length=50, unique=True)
     icon_url = models.URLField(blank=True)
@@ -106,6 +376,14 @@ class CampsiteAmenity(BaseModel):
     campsite = models.ForeignKey(Campsite, on_delete=models.CASCADE)
     amenity = models.ForeignKey(Amenity, on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            # 편의시설 필터(amenity_id -> campsite_id) 서브쿼리용
+            models.Index(
+                fields=["amenity", "campsite"], name="campsiteamenity_amenity_idx"
+            ),
+        ]
+
     def __str__(self):
         return f"{self.campsite.name} has {self.amenity.name}"  # "캠핑장 이름 has 편의시설 이름" 형식으로 표시
 
@@ -139,3 +417,47 @@ class PricingRule(BaseModel):
 
     def __str__(self):
         return f"{self.campsite.name} - {self.name}"  # "캠핑장 이름 - 요금 규칙 이름" 형식으로 표시
+
+    def clean(self):
+        super().clean()
+        if self.start_date and self.end_date and self.start_date > self.end_date:
+            raise exceptions.ValidationError(
+                {"end_date": "종료일은 시작일과 같거나 이후여야 합니다."}
+            )
+        try:
+            pricing.parse_weekday_mask(self.day_of_week)
+        except ValueError:
+            raise exceptions.ValidationError(
+                {
+                    "day_of_week": "요일은 0(월)~6(일) 숫자를 쉼표로 구분해 입력해 주세요."
+                }
+            )
+
+
+class CampsiteImport(BaseModel):
+    """
+    대량 가져오기 진행 상황 (재시작 지점)
+    같은 내용의 파일(checksum)을 다시 가져오면 processed행 이후부터 이어서 처리함.
+    processed는 해당 묶음의 INSERT와 같은 트랜잭션에서 갱신되므로 중간에 중단되어도
+    행이 두 번 들어가거나 빠지지 않음
+    """
+
+    MAX_ERRORS = 100
+
+    checksum = models.CharField(max_length=64, unique=True)  # 입력 파일 sha256
+    source_name = models.CharField(max_length=255)
+    input_format = models.CharField(max_length=10)
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="campsite_imports",
+        help_text="가져온 캠핑장의 소유자",
+    )
+    processed = models.PositiveIntegerField(default=0)  # 처리한 입력 행 수
+    created_count = models.PositiveIntegerField(default=0)
+    failed_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)  # 처음 MAX_ERRORS개의 행 오류
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.source_name} ({self.processed}행 처리)"
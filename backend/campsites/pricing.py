@@ -0,0 +1,256 @@
+"""
+사이트별 1박 요금 계산 엔진
+
+1박 요금 = Site.base_price + 그 날짜에 적용되는 PricingRule.extra_charge 합계
+(규칙이 겹치면 추가 요금을 모두 더함)
+
+캠핑장의 규칙을 한 번 "컴파일"해서 시작일 순으로 정렬된 배열(구간 인덱스)과
+요일 비트마스크로 만들어 두고, 견적은 NumPy 배열 연산으로 계산함.
+    active[night, rule] = start <= night <= end AND 요일 비트가 켜져 있음
+    extra[night]        = active @ extra_charge
+    price[site, night]  = base_price[site] + extra[night]
+따라서 숙박 일수, 규칙 수, 사이트 수와 무관하게 Python 반복 없이 한 번에 계산됨.
+
+금액은 부동소수점 오차가 없도록 전(錢, 0.01원) 단위 정수(int64)로 계산함.
+"""
+
+import datetime
+from dataclasses import dataclass
+from decimal import Decimal
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache as django_cache
+from django.db import transaction
+from django.utils import timezone
+
+from common import cache as common_cache
+
+from . import cache
+
+# day_of_week는 Python date.weekday() 기준 (0=월요일 ... 6=일요일)
+ALL_WEEKDAYS = 0b1111111
+MAX_QUOTE_NIGHTS = 366
+COMPILED_CACHE_TIMEOUT = 60 * 60
+
+
+def parse_weekday_mask(value):
+    """
+    "0,5,6" 같은 요일 문자열을 7비트 마스크로 변환 (빈 문자열은 모든 요일)
+    잘못된 값이면 ValueError
+    """
+    mask = 0
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        weekday = int(part)
+        if not 0 <= weekday <= 6:
+            raise ValueError(f"요일은 0(월)~6(일) 사이여야 합니다: {weekday}")
+        mask |= 1 << weekday
+    return mask or ALL_WEEKDAYS
+
+
+def to_cents(amount):
+    return int(Decimal(amount).scaleb(2).to_integral_value())
+
+
+def from_cents(cents):
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def format_cents(cents):
+    """전 단위 정수를 DecimalField와 같은 "12345.00" 형식 문자열로 변환"""
+    cents = int(cents)
+    sign = "-" if cents < 0 else ""
+    whole, fraction = divmod(abs(cents), 100)
+    return f"{sign}{whole}.{fraction:02d}"
+
+
+def _ordinals_to_weekdays(ordinals):
+    # date.fromordinal(1)(0001-01-01)은 월요일
+    return (ordinals - 1) % 7
+
+
+@dataclass
+class CompiledPricing:
+    """캠핑장 하나의 사이트/요금 규칙을 배열로 정리한 것 (캐시에 그대로 저장됨)"""
+
+    site_ids: np.ndarray
+    site_names: list
+    site_types: list
+    base_prices: np.ndarray  # (사이트 수,) 전 단위
+    rule_starts: np.ndarray  # (규칙 수,) 시작일 ordinal, 오름차순 정렬
+    rule_ends: np.ndarray  # 종료일 ordinal (포함)
+    rule_masks: np.ndarray  # 요일 비트마스크
+    rule_charges: np.ndarray  # 추가 요금, 전 단위
+
+    @classmethod
+    def build(cls, sites, rules):
+        """
+        sites: (id, name, camp_type, base_price) 목록
+        rules: (start_date, end_date, day_of_week, extra_charge) 목록
+        """
+        rules = sorted(rules, key=lambda rule: rule[0])
+        return cls(
+            site_ids=np.array([site[0] for site in sites], dtype=np.int64),
+            site_names=[site[1] for site in sites],
+            site_types=[site[2] for site in sites],
+            base_prices=np.array([to_cents(site[3]) for site in sites], dtype=np.int64),
+            rule_starts=np.array(
+                [rule[0].toordinal() for rule in rules], dtype=np.int64
+            ),
+            rule_ends=np.array([rule[1].toordinal() for rule in rules], dtype=np.int64),
+            rule_masks=np.array(
+                [parse_weekday_mask(rule[2]) for rule in rules], dtype=np.int64
+            ),
+            rule_charges=np.array(
+                [to_cents(rule[3]) for rule in rules], dtype=np.int64
+            ),
+        )
+
+    def extra_charges(self, nights):
+        """숙박일 ordinal 배열에 대한 날짜별 추가 요금 합계 (전 단위)"""
+        if not len(nights) or not len(self.rule_starts):
+            return np.zeros(len(nights), dtype=np.int64)
+
+        # 구간 인덱스: 시작일이 마지막 숙박일 이후인 규칙은 정렬 순서상 뒤쪽에 모여 있으므로 잘라내고,
+        # 남은 규칙 중 종료일이 첫 숙박일 이전인 규칙도 제외
+        upto = np.searchsorted(self.rule_starts, nights[-1], side="right")
+        candidates = np.flatnonzero(self.rule_ends[:upto] >= nights[0])
+        if not len(candidates):
+            return np.zeros(len(nights), dtype=np.int64)
+
+        starts = self.rule_starts[candidates]
+        ends = self.rule_ends[candidates]
+        masks = self.rule_masks[candidates]
+        charges = self.rule_charges[candidates]
+
+        days = nights[:, np.newaxis]
+        weekday_bits = 1 << _ordinals_to_weekdays(nights)[:, np.newaxis]
+        active = (days >= starts) & (days <= ends) & ((masks & weekday_bits) != 0)
+        return active.astype(np.int64) @ charges
+
+    def quote(self, check_in, check_out):
+        """
+        check_in ~ check_out 전날까지 각 박의 사이트별 요금을 계산
+        return: (숙박일 목록, (사이트 수, 숙박 수) 요금 배열)
+        """
+        nights = np.arange(check_in.toordinal(), check_out.toordinal(), dtype=np.int64)
+        extras = self.extra_charges(nights)
+        prices = self.base_prices[:, np.newaxis] + extras[np.newaxis, :]
+        dates = [datetime.date.fromordinal(int(ordinal)) for ordinal in nights]
+        return dates, prices
+
+
+def compile_campsite(campsite_id):
+    """DB에서 사이트와 요금 규칙을 읽어 CompiledPricing 생성 (쿼리 2번)"""
+    sites, rules = _pricing_rows(campsite_id)
+    return CompiledPricing.build(list(sites), list(rules))
+
+
+async def acompile_campsite(campsite_id):
+    """compile_campsite()의 async 버전 (async ORM)"""
+    sites, rules = _pricing_rows(campsite_id)
+    return CompiledPricing.build(
+        [row async for row in sites], [row async for row in rules]
+    )
+
+
+def _pricing_rows(campsite_id):
+    from .models import PricingRule, Site
+
+    sites = Site.objects.filter(campsite_id=campsite_id).order_by("id")
+    rules = PricingRule.objects.filter(campsite_id=campsite_id)
+    return (
+        sites.values_list("id", "name", "camp_type", "base_price"),
+        rules.values_list("start_date", "end_date", "day_of_week", "extra_charge"),
+    )
+
+
+def get_compiled(campsite_id):
+    """
+    캐시된 CompiledPricing을 return
+    사이트/규칙이 바뀌면 캠핑장 버전이 올라가므로 자동으로 다시 컴파일됨
+    """
+    [version] = common_cache.get_versions([cache.campsite_version_key(campsite_id)])
+    key = _compiled_cache_key(campsite_id, version)
+    compiled = django_cache.get(key)
+    if compiled is None:
+        compiled = compile_campsite(campsite_id)
+        django_cache.set(key, compiled, timeout=COMPILED_CACHE_TIMEOUT)
+    return compiled
+
+
+async def aget_compiled(campsite_id):
+    """get_compiled()의 async 버전"""
+    [version] = await common_cache.aget_versions(
+        [cache.campsite_version_key(campsite_id)]
+    )
+    key = _compiled_cache_key(campsite_id, version)
+    compiled = await django_cache.aget(key)
+    if compiled is None:
+        compiled = await acompile_campsite(campsite_id)
+        await django_cache.aset(key, compiled, timeout=COMPILED_CACHE_TIMEOUT)
+    return compiled
+
+
+def _compiled_cache_key(campsite_id, version):
+    return f"pricing:{campsite_id}:{version}"
+
+
+# --- 일자 요금표(SiteDailyPrice) ---
+
+
+def calendar_horizon():
+    """요금표가 유지하는 [시작일, 종료일) 구간 (오늘부터 PRICE_CALENDAR_DAYS일)"""
+    today = timezone.localdate()
+    return today, today + datetime.timedelta(days=settings.PRICE_CALENDAR_DAYS)
+
+
+def refresh_daily_prices(campsite_id, start=None, end=None, site_ids=None):
+    """
+    캠핑장의 [start, end) 구간 요금표를 다시 계산해서 교체 (요금표 구간 밖은 잘라냄)
+    site_ids를 주면 해당 사이트만 갱신. 갱신한 행 수를 return
+    """
+    from .models import SiteDailyPrice
+
+    first, last = calendar_horizon()
+    start = max(start or first, first)
+    end = min(end or last, last)
+    if start >= end:
+        return 0
+
+    # 캐시된 컴파일 결과는 같은 트랜잭션의 변경을 반영하지 않았을 수 있으므로 새로 컴파일
+    compiled = compile_campsite(campsite_id)
+    rows = [
+        SiteDailyPrice(site_id=site_id, campsite_id=campsite_id, date=date, price=price)
+        for site_id, _, date, price in daily_price_values(
+            campsite_id, compiled, start, end, site_ids
+        )
+    ]
+    stale = SiteDailyPrice.objects.filter(
+        campsite_id=campsite_id, date__gte=start, date__lt=end
+    )
+    if site_ids is not None:
+        stale = stale.filter(site_id__in=site_ids)
+    with transaction.atomic():
+        stale.delete()
+        SiteDailyPrice.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def daily_price_values(campsite_id, compiled, start, end, site_ids=None):
+    """
+    compiled로 계산한 [start, end) 구간의 요금표 행 목록 (저장하지 않음)
+    각 행은 SiteDailyPrice의 (site_id, campsite_id, date, price) 값 tuple
+    """
+    dates, prices = compiled.quote(start, end)
+    selected = np.arange(len(compiled.site_ids))
+    if site_ids is not None:
+        selected = np.flatnonzero(np.isin(compiled.site_ids, list(site_ids)))
+    return [
+        (int(compiled.site_ids[index]), campsite_id, date, from_cents(cents))
+        for index in selected
+        for date, cents in zip(dates, prices[index].tolist())
+    ]
@@ -0,0 +1,96 @@
+"""
+개발/벤치마크/테스트용 샘플 카탈로그 데이터
+
+벤치마크 명령(bench_serialization, bench_renderers)과 테스트가 함께 사용
+"""
+
+import datetime
+
+from django.contrib.auth import get_user_model
+
+from communities import models as community_models
+from communities import stats as community_stats
+
+from . import models
+
+
+def seed_catalogue(
+    owner,
+    campsites=30,
+    images=5,
+    amenities=5,
+    reviews=10,
+    reviewers=10,
+):
+    """
+    실제 운영 데이터와 비슷한 규모의 캠핑장 카탈로그를 bulk_create로 생성.
+    캠핑장마다 이미지, 편의시설, 정책, 리뷰를 함께 만들고 평점 집계도 채움.
+    """
+    User = get_user_model()
+    reviewer_list = User.objects.bulk_create(
+        User(email=f"reviewer{index}@example.com", username=f"reviewer{index}")
+        for index in range(reviewers)
+    )
+    amenity_list = models.Amenity.objects.bulk_create(
+        models.Amenity(name=f"amenity-{index}") for index in range(amenities)
+    )
+
+    check_in = datetime.date(2024, 6, 1)
+    campsite_list = [
+        models.Campsite(
+            owner=owner,
+            name=f"캠핑장 {index}",
+            address=f"강원도 평창군 {index}번지",
+            description="계곡 옆 조용한 캠핑장입니다. " * 20,
+            price=50000 + index * 1000,
+            check_in=check_in,
+            check_out=check_in + datetime.timedelta(days=2),
+        )
+        for index in range(campsites)
+    ]
+    for campsite in campsite_list:
+        campsite.refresh_derived_fields()
+    models.Campsite.objects.bulk_create(campsite_list)
+
+    models.CampsiteImage.objects.bulk_create(
+        models.CampsiteImage(
+            campsite=campsite, cloudflare_id=f"cf-{campsite.pk}-{order}", order=order
+        )
+        for campsite in campsite_list
+        for order in range(images)
+    )
+    models.CampsiteAmenity.objects.bulk_create(
+        models.CampsiteAmenity(campsite=campsite, amenity=amenity)
+        for campsite in campsite_list
+        for amenity in amenity_list
+    )
+    models.Policy.objects.bulk_create(
+        models.Policy(
+            campsite=campsite,
+            check_in_time=datetime.time(15),
+            check_out_time=datetime.time(11),
+            manner_time_start=datetime.time(22),
+            manner_time_end=datetime.time(7),
+        )
+        for campsite in campsite_list
+    )
+    if reviewer_list:
+        community_models.Review.objects.bulk_create(
+            community_models.Review(
+                user=reviewer_list[index % len(reviewer_list)],
+                campsite=campsite,
+                rating=index % 5 + 1,
+                content="좋았어요",
+            )
+            for campsite in campsite_list
+            for index in range(reviews)
+        )
+        # bulk_create는 시그널을 보내지 않으므로 평점 집계를 한 번에 다시 계산
+        seeded = models.Campsite.objects.filter(pk__in=[c.pk for c in campsite_list])
+        community_stats.rebuild_rating_stats(seeded)
+        fields = [*models.RATING_FIELDS, "updated_at"]
+        rebuilt = seeded.only(*fields).in_bulk()
+        for campsite in campsite_list:
+            for field in fields:
+                setattr(campsite, field, getattr(rebuilt[campsite.pk], field))
+    return campsite_list
@@ -0,0 +1,182 @@
+"""
+캠핑장 전문 검색(full-text search)
+
+이름/주소/설명을 검색용 문서(Campsite.search_document)로 정규화해서 저장하고,
+DB별 전문 검색 인덱스로 조회함.
+
+- PostgreSQL: to_tsvector('simple', search_document) 함수 GIN 인덱스
+- SQLite(IN_DOCKER_BUILD): search_document를 외부 content로 쓰는 FTS5 가상 테이블 + 트리거
+
+한국어는 형태소 분석기 없이 2글자 n-gram(bigram)으로 색인함.
+예: "캠핑장" -> "캠핑장 캠핑 핑장" 이므로 "캠핑", "핑장"으로도 검색됨.
+"""
+
+import re
+
+from django.db import connections
+from django.db.models import F, Func
+from django.db.models.expressions import RawSQL
+
+TABLE = "campsites_campsite"
+FTS_TABLE = "campsites_campsite_fts"
+GIN_INDEX = "campsite_search_gin"
+MAX_QUERY_TERMS = 32
+
+_WORD_RE = re.compile(r"\w+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+
+def _bigrams(word):
+    return [word[index : index + 2] for index in range(len(word) - 1)]
+
+
+def build_search_document(*texts):
+    """검색 대상 텍스트들을 공백으로 구분된 색인 토큰 문자열로 변환"""
+    terms = []
+    for text in texts:
+        for word in _WORD_RE.findall((text or "").lower()):
+            terms.append(word)
+            if _HANGUL_RE.search(word) and len(word) > 2:
+                terms.extend(_bigrams(word))
+    return " ".join(terms)
+
+
+def tokenize_query(query):
+    """
+    검색어를 색인 토큰 목록으로 변환.
+    한글 단어는 bigram으로만 검색해야 "글램핑장입니다"처럼 조사가 붙은 문서도 찾을 수 있음.
+    """
+    terms = []
+    for word in _WORD_RE.findall((query or "").lower()):
+        if _HANGUL_RE.search(word) and len(word) > 2:
+            terms.extend(_bigrams(word))
+        else:
+            terms.append(word)
+    # 순서를 유지하면서 중복 제거
+    return list(dict.fromkeys(terms))[:MAX_QUERY_TERMS]
+
+
+def search(queryset, query):
+    """
+    검색어와 일치하는 캠핑장만 남기고 관련도(search_rank) 순으로 정렬한 queryset을 return
+    """
+    terms = tokenize_query(query)
+    if not terms:
+        return queryset.none()
+
+    if connections[queryset.db].vendor == "postgresql":
+        return _search_postgresql(queryset, terms)
+    return _search_sqlite(queryset, terms)
+
+
+def _search_postgresql(queryset, terms):
+    # django.contrib.postgres는 PostgreSQL 환경에서만 import
+    from django.contrib.postgres.search import (
+        SearchQuery,
+        SearchRank,
+        SearchVectorField,
+    )
+
+    # 인덱스 식(to_tsvector('simple', search_document))과 정확히 같아야 GIN 인덱스를 사용함
+    vector = Func(
+        F("search_document"),
+        template="to_tsvector('simple'::regconfig, %(expressions)s)",
+        output_field=SearchVectorField(),
+    )
+    search_query = SearchQuery(" ".join(terms), config="simple", search_type="plain")
+    return (
+        queryset.annotate(search_vector=vector)
+        .filter(search_vector=search_query)
+        .annotate(search_rank=SearchRank(F("search_vector"), search_query))
+        .order_by("-search_rank", "-id")
+    )
+
+
+def _search_sqlite(queryset, terms):
+    # 각 토큰을 큰따옴표로 감싸 FTS5 문법 문자로 해석되지 않도록 함 (공백 = AND)
+    match = " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+    matched_ids = RawSQL(
+        f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match]
+    )
+    # bm25는 값이 작을수록 관련도가 높으므로 부호를 바꿔 사용
+    rank = RawSQL(
+        f"SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} "
+        f"WHERE {FTS_TABLE} MATCH %s AND rowid = {TABLE}.id",
+        [match],
+    )
+    return (
+        queryset.filter(id__in=matched_ids)
+        .annotate(search_rank=rank)
+        .order_by("-search_rank", "-id")
+    )
+
+
+# --- 인덱스 설치 ---
+
+
+def install(connection):
+    """
+    DB별 전문 검색 인덱스를 생성 (이미 있으면 건너뜀)
+
+    SQLite는 컬럼 변경 시 테이블을 다시 만들면서 트리거가 사라지므로
+    마이그레이션 뒤(post_migrate)마다 호출해서 트리거를 복구함.
+    """
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {GIN_INDEX} ON {TABLE} "
+                f"USING GIN (to_tsvector('simple'::regconfig, search_document))"
+            )
+        elif connection.vendor == "sqlite":
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [FTS_TABLE],
+            )
+            created = cursor.fetchone() is None
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                f"search_document, content='{TABLE}', content_rowid='id', "
+                f"tokenize='unicode61')"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {TABLE} "
+                f"BEGIN INSERT INTO {FTS_TABLE}(rowid, search_document) "
+                f"VALUES (new.id, new.search_document); END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {TABLE} "
+                f"BEGIN INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_document) "
+                f"VALUES ('delete', old.id, old.search_document); END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au "
+                f"AFTER UPDATE OF search_document ON {TABLE} "
+                f"BEGIN INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_document) "
+                f"VALUES ('delete', old.id, old.search_document); "
+                f"INSERT INTO {FTS_TABLE}(rowid, search_document) "
+                f"VALUES (new.id, new.search_document); END"
+            )
+            if created:
+                cursor.execute(
+                    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+                )
+
+
+def install_if_ready(connection):
+    """search_document 컬럼이 있을 때만 install (마이그레이션을 되돌린 경우 대비)"""
+    with connection.cursor() as cursor:
+        if TABLE not in connection.introspection.table_names(cursor):
+            return
+        columns = connection.introspection.get_table_description(cursor, TABLE)
+    if any(column.name == "search_document" for column in columns):
+        install(connection)
+
+
+def uninstall(connection):
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(f"DROP INDEX IF EXISTS {GIN_INDEX}")
+        elif connection.vendor == "sqlite":
+            for suffix in ("ai", "ad", "au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}")
+            cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
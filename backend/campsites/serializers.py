@@ -1,28 +1,73 @@
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from common import dynamic_fields as common_dynamic_fields
+from common import fast_serializers as common_fast_serializers
+from common import imports as common_imports
+from common import serializers as common_serializers
 
-from . import models
+from . import cache, geo, models, pricing
 
 
-class AmenitySerializer(serializers.ModelSerializer):
+def build_image_url(cloudflare_id, variant="public"):
+    """Cloudflare ID와 variant 이름을 조합하여 전체 이미지 URL을 생성"""
+    return f"https://imagedelivery.net/{settings.CLOUDFLARE_ACCOUNT_HASH}/{cloudflare_id}/{variant}"
+
+
+class AmenitySerializer(common_serializers.ModelSerializer):
     class Meta:
         model = models.Amenity
         fields = ("name", "icon_url")
 
 
-class PolicySerializer(serializers.ModelSerializer):
+class PolicySerializer(common_serializers.ModelSerializer):
     class Meta:
         model = models.Policy
         # campsite 필드는 제외하고 나머지 정책 정보만 보여줌
         exclude = ("id", "campsite")
 
 
-class CampsiteListSerializer(serializers.ModelSerializer):
-    """캠핑장 목록을 위한 간단한 Serializer"""
+class CampsiteImageSerializer(common_serializers.ModelSerializer):
+    # 응답에 포함될, 동적으로 생성되는 전체 이미지 URL 필드
+    image_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = models.CampsiteImage
+        # API를 통해 보여줄 필드 목록
+        # fields = ("id", "cloudflare_id", "image_url", "order")
+        # 클라이언트로부터 직접 입력받는 필드
+        # extra_kwargs = {"cloudflare_id": {"write_only": True}}
+        fields = ("cloudflare_id", "order", "image_url")
+
+    def get_image_url(self, obj):
+        """
+        Cloudflare ID와 variant 이름을 조합하여 전체 이미지 URL을 생성
+        'public'은 기본 variant 이름. 필요에 따라 변경할 수 있음.
+        """
+        # 이 부분은 Cloudflare 대시보드의 'Images' > 'Variants'에서 확인 가능
+        variant = "public"
+        return build_image_url(obj.cloudflare_id, variant)
+
+
+class CampsiteListSerializer(
+    common_dynamic_fields.DynamicFieldsMixin,
+    common_fast_serializers.ValuesSerializerMixin,
+    common_serializers.ModelSerializer,
+):
+    """
+    캠핑장 목록을 위한 간단한 Serializer
+    ?fields=로 필드를 줄이거나 ?expand=amenities,images,policy로 연관 정보를 추가할 수 있음
+    목록 action에서는 .values() fast path로 직렬화됨 (common.fast_serializers)
+    """
 
     stay_nights = serializers.IntegerField(read_only=True)
     thumbnail_url = serializers.SerializerMethodField()
+    rating_average = serializers.FloatField(read_only=True)
+    # ?stay_start=&stay_end= 로 조회한 경우에만 값이 있음 (가장 저렴한 사이트의 기간 총 요금)
+    stay_price = serializers.DecimalField(
+        max_digits=12, decimal_places=2, read_only=True, default=None
+    )
 
     class Meta:
         model = models.Campsite
@@ -38,48 +83,202 @@ class CampsiteListSerializer(serializers.ModelSerializer):
             "thumbnail_url",
             "stay_nights",
             "price",
+            "rating_count",
+            "rating_average",
+            "stay_price",
         )
+        expandable_fields = {
+            "policy": (PolicySerializer, {}),
+            "amenities": (AmenitySerializer, {"many": True}),
+            "images": (CampsiteImageSerializer, {"many": True}),
+        }
+        # .values() fast path에서 모델 컬럼이 아닌 필드와 계산에 쓰는 컬럼
+        values_fields = {
+            "thumbnail_url": ("thumbnail_cloudflare_id",),
+            "stay_nights": ("check_in", "check_out"),
+        }
 
     def get_thumbnail_url(self, obj):
         """캠핑장의 첫 번째 이미지 URL을 return"""
         # obj는 Campsite 인스턴스.
-        # related_name='images'를 통해 캠핑장에 연결된 이미지들을 가져옴.
-        # ordering = ["order"]에 의해 정렬되어 있으므로 .first()는 대표 이미지가 됩니다.
-        first_image = obj.images.first()
+        # 목록 queryset은 with_thumbnail()로 대표 이미지 ID를 미리 annotate 해둠.
+        # annotate 되지 않은 경우에만 images.first()로 한 번 더 조회.
+        if hasattr(obj, "thumbnail_cloudflare_id"):
+            cloudflare_id = obj.thumbnail_cloudflare_id
+        else:
+            # ordering = ["order"]에 의해 정렬되어 있으므로 .first()는 대표 이미지가 됩니다.
+            first_image = obj.images.first()
+            cloudflare_id = first_image.cloudflare_id if first_image else None
 
         # 이미지가 없는 경우 null을 반환합니다.
-        if not first_image:
+        if not cloudflare_id:
             return None
 
-        # CampsiteImageSerializer의 URL 생성 로직을 활용.
         # 성능을 위해 목록 보기용 썸네일 variant를 사용하는 것이 좋습니다. (예: "thumbnail")
         variant = "public"  # 필요에 따라 "thumbnail" 등 작은 variant로 변경
-        return f"https://imagedelivery.net/{settings.CLOUDFLARE_ACCOUNT_HASH}/{first_image.cloudflare_id}/{variant}"
+        return build_image_url(cloudflare_id, variant)
 
+    def values_thumbnail_url(self, row):
+        # 목록 queryset은 항상 with_thumbnail()로 annotate 되어 있음
+        cloudflare_id = row["thumbnail_cloudflare_id"]
+        if not cloudflare_id:
+            return None
+        return build_image_url(cloudflare_id, "public")
 
-class CampsiteImageSerializer(serializers.ModelSerializer):
-    # 응답에 포함될, 동적으로 생성되는 전체 이미지 URL 필드
-    image_url = serializers.SerializerMethodField()
+    def values_stay_nights(self, row):
+        if row["check_in"] and row["check_out"]:
+            return (row["check_out"] - row["check_in"]).days
+        return None
 
-    class Meta:
-        model = models.CampsiteImage
-        # API를 통해 보여줄 필드 목록
-        # fields = ("id", "cloudflare_id", "image_url", "order")
-        # 클라이언트로부터 직접 입력받는 필드
-        # extra_kwargs = {"cloudflare_id": {"write_only": True}}
-        fields = ("cloudflare_id", "order", "image_url")
 
-    def get_image_url(self, obj):
-        """
-        Cloudflare ID와 variant 이름을 조합하여 전체 이미지 URL을 생성
-        'public'은 기본 variant 이름. 필요에 따라 변경할 수 있음.
-        """
-        # 이 부분은 Cloudflare 대시보드의 'Images' > 'Variants'에서 확인 가능
-        variant = "public"
-        return f"https://imagedelivery.net/{settings.CLOUDFLARE_ACCOUNT_HASH}/{obj.cloudflare_id}/{variant}"
+class CampsiteNearbySerializer(CampsiteListSerializer):
+    """위치 검색 결과용 Serializer (좌표와 검색 중심까지의 거리 포함)"""
+
+    distance_km = serializers.SerializerMethodField()
+
+    class Meta(CampsiteListSerializer.Meta):
+        fields = (
+            *CampsiteListSerializer.Meta.fields,
+            "latitude",
+            "longitude",
+            "distance_km",
+        )
+        values_fields = {
+            **CampsiteListSerializer.Meta.values_fields,
+            "distance_km": ("distance_km",),
+        }
+
+    def get_distance_km(self, obj):
+        # 영역(bbox) 검색에는 중심점이 없으므로 null
+        distance = getattr(obj, "distance_km", None)
+        return round(distance, 2) if distance is not None else None
+
+    def values_distance_km(self, row):
+        distance = row.get("distance_km")
+        return round(distance, 2) if distance is not None else None
+
+
+class CampsiteAvailabilitySerializer(CampsiteListSerializer):
+    """예약 가능 캠핑장 검색 결과용 Serializer (기간 내 빈 사이트 수 포함)"""
+
+    free_sites = serializers.IntegerField(read_only=True)
+
+    class Meta(CampsiteListSerializer.Meta):
+        fields = (*CampsiteListSerializer.Meta.fields, "free_sites")
+
+
+class CampsiteNearbyQuerySerializer(serializers.Serializer):
+    """
+    위치 검색 query parameter
+    - lat, lng, radius(km): 반경 검색
+    - bbox: "최소경도,최소위도,최대경도,최대위도" 영역 검색
+    """
+
+    lat = serializers.FloatField(min_value=-90, max_value=90, required=False)
+    lng = serializers.FloatField(min_value=-180, max_value=180, required=False)
+    radius = serializers.FloatField(
+        min_value=0.1, max_value=geo.MAX_RADIUS_KM, default=30
+    )
+    bbox = serializers.CharField(required=False)
+
+    def validate_bbox(self, value):
+        try:
+            min_lng, min_lat, max_lng, max_lat = (
+                float(part) for part in value.split(",")
+            )
+        except ValueError:
+            raise serializers.ValidationError(
+                "bbox는 '최소경도,최소위도,최대경도,최대위도' 형식이어야 합니다."
+            )
+        if not (-90 <= min_lat <= max_lat <= 90 and -180 <= min_lng <= max_lng <= 180):
+            raise serializers.ValidationError("bbox 좌표 범위가 올바르지 않습니다.")
+        if (
+            max_lat - min_lat > geo.MAX_BBOX_DEGREES
+            or max_lng - min_lng > geo.MAX_BBOX_DEGREES
+        ):
+            raise serializers.ValidationError(
+                f"bbox는 가로/세로 {geo.MAX_BBOX_DEGREES}도 이내여야 합니다."
+            )
+        return (min_lat, min_lng, max_lat, max_lng)
+
+    def validate(self, attrs):
+        if "bbox" in attrs:
+            return attrs
+        if "lat" not in attrs or "lng" not in attrs:
+            raise serializers.ValidationError("lat, lng 또는 bbox를 입력해 주세요.")
+        return attrs
+
+
+class CampsiteQuoteQuerySerializer(serializers.Serializer):
+    """요금 견적 query parameter (check_out 당일 밤은 포함하지 않음)"""
+
+    check_in = serializers.DateField()
+    check_out = serializers.DateField()
+
+    def validate(self, attrs):
+        nights = (attrs["check_out"] - attrs["check_in"]).days
+        if nights <= 0:
+            raise serializers.ValidationError(
+                {"check_out": "체크아웃 날짜는 체크인 날짜보다 이후이어야 합니다."}
+            )
+        if nights > pricing.MAX_QUOTE_NIGHTS:
+            raise serializers.ValidationError(
+                {
+                    "check_out": f"견적은 최대 {pricing.MAX_QUOTE_NIGHTS}박까지 가능합니다."
+                }
+            )
+        return attrs
 
 
-class CampsiteCreateSerializer(serializers.ModelSerializer):
+class StayPriceQuerySerializer(serializers.Serializer):
+    """숙박 기간 요금 필터 query parameter (stay_end 당일 밤은 포함하지 않음)"""
+
+    FIELDS = ("stay_start", "stay_end", "min_stay_price", "max_stay_price")
+
+    stay_start = serializers.DateField(
+        error_messages={
+            "required": "숙박 기간 요금을 사용하려면 stay_start가 필요합니다."
+        }
+    )
+    stay_end = serializers.DateField(
+        error_messages={
+            "required": "숙박 기간 요금을 사용하려면 stay_end가 필요합니다."
+        }
+    )
+    min_stay_price = serializers.DecimalField(
+        max_digits=12, decimal_places=2, min_value=0, required=False
+    )
+    max_stay_price = serializers.DecimalField(
+        max_digits=12, decimal_places=2, min_value=0, required=False
+    )
+
+    def validate(self, attrs):
+        nights = (attrs["stay_end"] - attrs["stay_start"]).days
+        if nights <= 0:
+            raise serializers.ValidationError(
+                {"stay_end": "stay_end는 stay_start보다 이후여야 합니다."}
+            )
+        if nights > settings.PRICE_CALENDAR_DAYS:
+            raise serializers.ValidationError(
+                {
+                    "stay_end": f"숙박 기간은 최대 {settings.PRICE_CALENDAR_DAYS}박까지 가능합니다."
+                }
+            )
+        return attrs
+
+
+class UploadURLBatchSerializer(serializers.Serializer):
+    count = serializers.IntegerField(min_value=1, help_text="발급할 업로드 URL 수")
+
+    def validate_count(self, value):
+        if value > settings.CLOUDFLARE_UPLOAD_URL_BATCH_MAX:
+            raise serializers.ValidationError(
+                f"한 번에 최대 {settings.CLOUDFLARE_UPLOAD_URL_BATCH_MAX}개까지 요청할 수 있습니다."
+            )
+        return value
+
+
+class CampsiteCreateSerializer(common_serializers.ModelSerializer):
     image_ids = serializers.ListField(
         child=serializers.CharField(),
         write_only=True,
@@ -89,20 +288,19 @@ class CampsiteCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = models.Campsite
         fields = (
-                    "id",
-                    "name", 
-                    "description", 
-                    "image_ids", 
-                    "check_in", 
-                    "check_out", 
-                    "address", 
-                    "price", 
-                    "contact_number", 
-                    "layout_image_url",
-                )
+            "id",
+            "name",
+            "description",
+            "image_ids",
+            "check_in",
+            "check_out",
+            "address",
+            "price",
+            "contact_number",
+            "layout_image_url",
+        )
         read_only_fields = ("id",)
 
-  
     def validate_image_ids(self, value):
         if len(value) < 3:
             raise serializers.ValidationError("최소 3장 이상의 사진 ID가 필요해요~")
@@ -113,7 +311,6 @@ class CampsiteCreateSerializer(serializers.ModelSerializer):
         if not request or not hasattr(request, "user"):
             raise serializers.ValidationError("로그인된 사용자 정보가 필요합니다.")
 
-
         # 프론트에서 받은 'image_ids' 목록을 가져옴
         image_ids_list = validated_data.pop("image_ids")
         validated_data["owner"] = request.user
@@ -130,12 +327,80 @@ class CampsiteCreateSerializer(serializers.ModelSerializer):
             for index, image_id in enumerate(image_ids_list)
         ]
         models.CampsiteImage.objects.bulk_create(images_to_create)
+        # bulk_create는 post_save 시그널을 보내지 않으므로 캐시를 직접 무효화
+        cache.bump_campsite(campsite.pk)
 
         return campsite
 
 
-class CampsiteDetailSerializer(serializers.ModelSerializer):
-    """캠핑장 상세 정보를 위한 Serializer"""
+class SiteSerializer(common_serializers.ModelSerializer):
+    class Meta:
+        model = models.Site
+        fields = ("name", "camp_type", "base_price")
+
+
+class CampsiteImportRecordSerializer(CampsiteCreateSerializer):
+    """
+    대량 가져오기(campsites.importer)의 입력 한 행
+    캠핑장 등록 API와 같은 규칙에 위치, 정책, 편의시설 이름, 사이트 목록을 더함
+    """
+
+    policy = PolicySerializer(required=False)
+    amenities = serializers.ListField(
+        child=serializers.CharField(max_length=50), required=False
+    )
+    sites = SiteSerializer(many=True, required=False)
+
+    class Meta(CampsiteCreateSerializer.Meta):
+        fields = (
+            *CampsiteCreateSerializer.Meta.fields,
+            "latitude",
+            "longitude",
+            "policy",
+            "amenities",
+            "sites",
+        )
+
+
+class CampsiteImportRequestSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    format = serializers.ChoiceField(
+        choices=common_imports.FORMATS,
+        required=False,
+        help_text="입력 형식 (기본: 파일 확장자로 판단)",
+    )
+    owner = serializers.PrimaryKeyRelatedField(
+        queryset=get_user_model().objects.all(),
+        required=False,
+        help_text="가져온 캠핑장의 소유자 (기본: 요청한 관리자)",
+    )
+
+
+class CampsiteImportSerializer(common_serializers.ModelSerializer):
+    """대량 가져오기 진행 상황"""
+
+    class Meta:
+        model = models.CampsiteImport
+        fields = (
+            "id",
+            "source_name",
+            "input_format",
+            "owner",
+            "processed",
+            "created_count",
+            "failed_count",
+            "errors",
+            "completed_at",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = fields
+
+
+class CampsiteDetailSerializer(
+    common_dynamic_fields.DynamicFieldsMixin, common_serializers.ModelSerializer
+):
+    """캠핑장 상세 정보를 위한 Serializer (?fields=로 필드를 줄일 수 있음)"""
 
     # owner의 username 필드를 읽기 전용으로 보여줌
     owner = serializers.ReadOnlyField(source="owner.username")
@@ -143,11 +408,10 @@ class CampsiteDetailSerializer(serializers.ModelSerializer):
     # 1:1 관계인 policy는 중첩 Serializer로 보여줌
     policy = PolicySerializer(read_only=True)
 
-    # M2M 관계인 amenities도 중첩 Serializer로 보여줌
+    # M2M 관계인 amenities도 중첩 Serializer로 보여줌 (CampsiteAmenity를 통한 M2M)
     amenities = AmenitySerializer(
         many=True,
         read_only=True,
-        source="amenity_set",
     )
 
     images = CampsiteImageSerializer(
@@ -155,6 +419,12 @@ class CampsiteDetailSerializer(serializers.ModelSerializer):
         read_only=True,
     )
 
+    # 목록(CampsiteListSerializer)과 같은 숫자 표현 (DecimalField 기본은 문자열)
+    rating_average = serializers.FloatField(read_only=True)
+
     class Meta:
         model = models.Campsite
-        fields = "__all__"
+        # 검색용 내부 필드는 응답에서 제외
+        exclude = ("search_document", "geo_cell")
+        # 평점 집계는 리뷰가 바뀔 때 F() 식으로만 갱신하므로 클라이언트가 쓸 수 없음
+        read_only_fields = models.RATING_FIELDS
@@ -0,0 +1,138 @@
+import datetime
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from common import cache as common_cache
+
+from . import cache, models, pricing
+
+
+@receiver(post_save, sender=models.Campsite)
+@receiver(post_delete, sender=models.Campsite)
+def invalidate_campsite(sender, instance, **kwargs):
+    cache.bump_campsite(instance.pk)
+
+
+@receiver(post_save, sender=models.CampsiteImage)
+@receiver(post_delete, sender=models.CampsiteImage)
+@receiver(post_save, sender=models.Policy)
+@receiver(post_delete, sender=models.Policy)
+@receiver(post_save, sender=models.CampsiteAmenity)
+@receiver(post_delete, sender=models.CampsiteAmenity)
+@receiver(post_save, sender=models.Site)
+@receiver(post_delete, sender=models.Site)
+@receiver(post_save, sender=models.PricingRule)
+@receiver(post_delete, sender=models.PricingRule)
+def invalidate_campsite_relation(sender, instance, **kwargs):
+    # 캠핑장에 속한 데이터가 바뀌면 해당 캠핑장 캐시를 무효화
+    cache.bump_campsite(instance.campsite_id)
+    # 조건부 GET validator(MAX(updated_at))가 바뀌도록 캠핑장의 updated_at도 갱신
+    # (queryset.update는 post_save를 보내지 않으므로 시그널이 반복되지 않음)
+    models.Campsite.objects.filter(pk=instance.campsite_id).update(
+        updated_at=timezone.now()
+    )
+
+
+@receiver(post_save, sender=models.Amenity)
+@receiver(post_delete, sender=models.Amenity)
+def invalidate_amenity(sender, instance, **kwargs):
+    # 편의시설 이름은 facet 응답에 포함되므로 목록 버전을 올림
+    common_cache.bump_versions(cache.LIST_VERSION_KEY)
+
+
+@receiver(post_save, sender=models.Amenity)
+def touch_amenity_campsites(sender, instance, created, **kwargs):
+    # 상세 응답과 ?expand=amenities에도 편의시설이 들어가므로 연결된 캠핑장의 캐시와
+    # 조건부 GET validator(updated_at)도 갱신
+    # (삭제는 CampsiteAmenity가 CASCADE로 지워지면서 invalidate_campsite_relation이 처리)
+    if created:
+        return
+    campsite_ids = list(
+        models.CampsiteAmenity.objects.filter(amenity=instance).values_list(
+            "campsite_id", flat=True
+        )
+    )
+    if not campsite_ids:
+        return
+    common_cache.bump_versions(*map(cache.campsite_version_key, campsite_ids))
+    models.Campsite.objects.filter(pk__in=campsite_ids).update(
+        updated_at=timezone.now()
+    )
+
+
+# --- 일자 요금표(SiteDailyPrice) 갱신 ---
+# 변경 전 값을 pre_save에서 기억해 두고, 요금에 영향을 주는 값이 바뀐 경우에만
+# 바뀐 날짜 구간(규칙) 또는 해당 사이트(기본 요금)의 요금표를 다시 계산
+
+PRICING_FIELDS = {
+    models.PricingRule: (
+        "campsite_id",
+        "start_date",
+        "end_date",
+        "day_of_week",
+        "extra_charge",
+    ),
+    models.Site: ("campsite_id", "base_price"),
+}
+
+
+def _pricing_values(instance):
+    # create(start_date="2024-07-01")처럼 변환 전 값이 들어 있어도 DB 값과 비교할 수 있도록 변환
+    opts = instance._meta
+    return {
+        field: opts.get_field(field).to_python(getattr(instance, field))
+        for field in PRICING_FIELDS[type(instance)]
+    }
+
+
+def _rule_window(values):
+    return values["start_date"], values["end_date"] + datetime.timedelta(days=1)
+
+
+@receiver(pre_save, sender=models.PricingRule)
+@receiver(pre_save, sender=models.Site)
+def remember_previous_pricing(sender, instance, **kwargs):
+    instance._previous_pricing = None
+    if instance.pk:
+        instance._previous_pricing = (
+            sender.objects.filter(pk=instance.pk)
+            .values(*PRICING_FIELDS[sender])
+            .first()
+        )
+
+
+@receiver(post_save, sender=models.PricingRule)
+def refresh_rule_prices(sender, instance, **kwargs):
+    previous = getattr(instance, "_previous_pricing", None)
+    current = _pricing_values(instance)
+    if previous == current:
+        return
+
+    start, end = _rule_window(current)
+    if previous is not None:
+        old_start, old_end = _rule_window(previous)
+        if previous["campsite_id"] != current["campsite_id"]:
+            pricing.refresh_daily_prices(previous["campsite_id"], old_start, old_end)
+        else:
+            start, end = min(start, old_start), max(end, old_end)
+    pricing.refresh_daily_prices(current["campsite_id"], start, end)
+
+
+@receiver(post_delete, sender=models.PricingRule)
+def refresh_deleted_rule_prices(sender, instance, **kwargs):
+    values = _pricing_values(instance)
+    pricing.refresh_daily_prices(values["campsite_id"], *_rule_window(values))
+
+
+@receiver(post_save, sender=models.Site)
+def refresh_site_prices(sender, instance, **kwargs):
+    previous = getattr(instance, "_previous_pricing", None)
+    current = _pricing_values(instance)
+    if previous == current:
+        return
+    if previous is not None and previous["campsite_id"] != current["campsite_id"]:
+        models.SiteDailyPrice.objects.filter(site_id=instance.pk).delete()
+    # 기본 요금은 모든 날짜에 영향을 주므로 해당 사이트의 요금표 전체를 다시 계산
+    pricing.refresh_daily_prices(current["campsite_id"], site_ids=[instance.pk])
@@ -1,3 +1,1512 @@
-from django.test import TestCase
+import asyncio
+import csv
+import datetime
+import io
+import json
+import tempfile
+import time
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from asgiref.testing import ApplicationCommunicator
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from common import fast_serializers
+from common.testing import QueryBudget, QueryBudgetTestCase
+from config import asgi
+
+from . import cloudflare, geo, importer, models, pricing, serializers, views
+from .cloudflare_stub import CloudflareStub
+from .sample_data import seed_catalogue
+
+PAGE_SIZE = settings.REST_FRAMEWORK["PAGE_SIZE"]
+
+
+class CampsiteQueryBudgetTests(QueryBudgetTestCase):
+    """캠핑장 엔드포인트별 최대 쿼리 수/행 수"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.campsites = seed_catalogue(cls.owner, campsites=30, images=5, amenities=5)
+        cls.campsite = cls.campsites[0]
+
+    def test_list(self):
+        # validator(MAX/COUNT) + COUNT(*) + 페이지 조회(대표 이미지 서브쿼리 포함)
+        with self.assertQueryBudget(queries=3, rows=1 + 1 + PAGE_SIZE):
+            response = self.client.get("/api/v1/campsites/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), PAGE_SIZE)
+        self.assertIsNotNone(response.data["results"][0]["thumbnail_url"])
+
+    def test_list_deep_page(self):
+        with self.assertQueryBudget(queries=3, rows=1 + 1 + PAGE_SIZE):
+            response = self.client.get("/api/v1/campsites/", {"page": 3})
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_cursor(self):
+        # keyset 페이지네이션은 COUNT(*) 없이 page_size + 1 행만 읽음
+        with self.assertQueryBudget(queries=2, rows=1 + PAGE_SIZE + 1):
+            response = self.client.get("/api/v1/campsites/", {"pagination": "cursor"})
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertQueryBudget(queries=2, rows=1 + PAGE_SIZE + 1):
+            response = self.client.get(response.data["next"])
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail(self):
+        # validator + campsite(+owner, policy JOIN) + images + amenities
+        with self.assertQueryBudget(queries=4, rows=1 + 1 + 5 + 5):
+            response = self.client.get(f"/api/v1/campsites/{self.campsite.pk}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["images"]), 5)
+        self.assertEqual(len(response.data["amenities"]), 5)
+
+    def test_create(self):
+        self.client.force_authenticate(self.owner)
+        payload = {
+            "name": "새 캠핑장",
+            "description": "설명",
+            "image_ids": ["a", "b", "c"],
+            "check_in": "2024-06-01",
+            "check_out": "2024-06-03",
+            "address": "강원도",
+            "price": 10000,
+        }
+        with self.assertQueryBudget(queries=2):
+            response = self.client.post("/api/v1/campsites/", payload, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            models.CampsiteImage.objects.filter(
+                campsite_id=response.data["id"]
+            ).count(),
+            3,
+        )
+
+    def test_partial_update(self):
+        self.client.force_authenticate(self.owner)
+        # campsite(+owner, policy JOIN) + images + amenities prefetch + UPDATE
+        # + 응답용 amenities/images 재조회 (UpdateModelMixin이 저장 후 prefetch 캐시를 비움)
+        with self.assertQueryBudget(queries=6):
+            response = self.client.patch(
+                f"/api/v1/campsites/{self.campsite.pk}/",
+                {"name": "이름 변경"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=True)
+class CampsiteResponseCacheTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.campsite = seed_catalogue(cls.owner, campsites=3)[0]
+        cls.detail_url = f"/api/v1/campsites/{cls.campsite.pk}/"
+
+    def test_repeat_reads_are_served_from_cache(self):
+        for url in ("/api/v1/campsites/", self.detail_url):
+            first = self.client.get(url)
+            self.assertEqual(first["X-Cache"], "MISS")
+            # 캐시 적중 시에는 validator 쿼리만 실행
+            with self.assertQueryBudget(queries=1):
+                second = self.client.get(url)
+            self.assertEqual(second["X-Cache"], "HIT")
+            self.assertEqual(first.data, second.data)
+
+    def test_writes_invalidate_list_and_detail(self):
+        self.client.get("/api/v1/campsites/")
+        self.client.get(self.detail_url)
+
+        image = self.campsite.images.first()
+        image.order = 99
+        image.save()
+
+        self.assertEqual(self.client.get(self.detail_url)["X-Cache"], "MISS")
+        self.assertEqual(self.client.get("/api/v1/campsites/")["X-Cache"], "MISS")
+
+    def test_change_without_version_bump_keeps_etag_and_body_consistent(self):
+        # 다른 워커의 쓰기처럼 이 프로세스의 버전 키는 그대로인 변경
+        etag = self.client.get(self.detail_url)["ETag"]
+        models.Campsite.objects.filter(pk=self.campsite.pk).update(
+            name="다른 워커에서 변경", updated_at=timezone.now()
+        )
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["name"], "다른 워커에서 변경")
+        self.assertNotEqual(response["ETag"], etag)
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_review_write_invalidates_review_list(self):
+        url = f"{self.detail_url}reviews/"
+        self.client.get(url)
+        self.client.force_authenticate(self.owner)
+        self.client.post(url, {"rating": 4, "content": "좋아요"}, format="json")
+
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["count"], 11)
+
+
+class CampsiteConditionalGetTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.campsite = seed_catalogue(cls.owner, campsites=3)[0]
+        cls.detail_url = f"/api/v1/campsites/{cls.campsite.pk}/"
+
+    def test_matching_etag_returns_304_with_one_query(self):
+        for url in (
+            "/api/v1/campsites/",
+            self.detail_url,
+            f"{self.detail_url}reviews/",
+        ):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn("Last-Modified", response)
+
+            with self.assertQueryBudget(queries=1, rows=1):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+            self.assertEqual(response.status_code, 304)
+
+    def test_child_change_updates_validators(self):
+        etag = self.client.get(self.detail_url)["ETag"]
+        list_etag = self.client.get("/api/v1/campsites/")["ETag"]
+
+        image = self.campsite.images.last()
+        image.delete()
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["images"]), 4)
+        response = self.client.get("/api/v1/campsites/", HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(RESPONSE_CACHE_ENABLED=True)
+    def test_amenity_rename_updates_validators(self):
+        list_params = {"fields": "id", "expand": "amenities"}
+        etags = [
+            self.client.get(self.detail_url)["ETag"],
+            self.client.get("/api/v1/campsites/", list_params)["ETag"],
+        ]
+
+        amenity = self.campsite.amenities.first()
+        amenity.name = "이름 바꾼 편의시설"
+        amenity.save()
+
+        detail = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etags[0])
+        self.assertEqual(detail.status_code, 200)
+        listing = self.client.get(
+            "/api/v1/campsites/", list_params, HTTP_IF_NONE_MATCH=etags[1]
+        )
+        self.assertEqual(listing.status_code, 200)
+        for data in (detail.data, listing.data["results"][0]):
+            self.assertIn(
+                "이름 바꾼 편의시설", [item["name"] for item in data["amenities"]]
+            )
+
+    def test_missing_campsite_is_404(self):
+        self.assertEqual(self.client.get("/api/v1/campsites/0/").status_code, 404)
+
+
+class CampsiteKeysetPaginationTests(QueryBudgetTestCase):
+    url = "/api/v1/campsites/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        seed_catalogue(cls.owner, campsites=PAGE_SIZE * 2 + 5, images=1, reviews=0)
+        # created_at이 같은 행이 페이지 경계에 걸쳐도 id로 순서가 정해져야 함
+        created_at = timezone.now()
+        models.Campsite.objects.update(created_at=created_at)
+        oldest = models.Campsite.objects.order_by("id")[:3]
+        models.Campsite.objects.filter(pk__in=oldest).update(
+            created_at=created_at - datetime.timedelta(days=1)
+        )
+        cls.expected = list(
+            models.Campsite.objects.order_by("-created_at", "-id").values_list(
+                "id", flat=True
+            )
+        )
+
+    def test_pages_follow_created_at_and_id(self):
+        response = self.client.get(self.url, {"pagination": "cursor"})
+        # COUNT(*)를 하지 않으므로 count 없이 next/previous 링크만 return
+        self.assertEqual(set(response.data), {"next", "previous", "results"})
+        self.assertIsNone(response.data["previous"])
+
+        seen = []
+        pages = [response.data]
+        while pages[-1]["next"]:
+            pages.append(self.client.get(pages[-1]["next"]).data)
+        for page in pages:
+            seen.extend(item["id"] for item in page["results"])
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(seen, self.expected)
+
+        # 이전 페이지 링크는 직전 페이지를 그대로 return
+        previous = self.client.get(pages[1]["previous"]).data
+        self.assertEqual(previous["results"], pages[0]["results"])
+        self.assertIsNotNone(previous["next"])
+
+    def test_invalid_cursor(self):
+        for cursor in ("not-base64!", "eyJrIjogMX0="):
+            response = self.client.get(
+                self.url, {"pagination": "cursor", "cursor": cursor}
+            )
+            self.assertEqual(response.status_code, 404)
+
+
+class CampsiteThumbnailTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.campsites = seed_catalogue(
+            cls.owner, campsites=3, images=0, amenities=0, reviews=0
+        )
+        first, second, _ = cls.campsites
+        models.CampsiteImage.objects.bulk_create(
+            [
+                models.CampsiteImage(campsite=first, cloudflare_id="a-2", order=2),
+                models.CampsiteImage(campsite=first, cloudflare_id="a-0", order=0),
+                models.CampsiteImage(campsite=first, cloudflare_id="a-1", order=1),
+                models.CampsiteImage(campsite=second, cloudflare_id="b-0", order=0),
+            ]
+        )
+        cls.expected = {first.pk: "a-0", second.pk: "b-0", cls.campsites[2].pk: None}
+
+    def test_with_thumbnail_annotates_first_image(self):
+        # 캠핑장 수와 관계없이 서브쿼리를 포함한 쿼리 하나
+        with self.assertNumQueries(1):
+            rows = dict(
+                models.Campsite.objects.with_thumbnail().values_list(
+                    "id", "thumbnail_cloudflare_id"
+                )
+            )
+        self.assertEqual(rows, self.expected)
+
+    def test_list_uses_annotation(self):
+        with self.assertQueryBudget(queries=3):
+            response = self.client.get("/api/v1/campsites/")
+        urls = {item["id"]: item["thumbnail_url"] for item in response.data["results"]}
+        self.assertEqual(
+            urls,
+            {
+                pk: cloudflare_id and serializers.build_image_url(cloudflare_id)
+                for pk, cloudflare_id in self.expected.items()
+            },
+        )
+
+    def test_falls_back_to_first_image(self):
+        # annotate 되지 않은 인스턴스는 이미지를 한 번 더 조회
+        campsite = models.Campsite.objects.get(pk=self.campsites[0].pk)
+        with self.assertNumQueries(1):
+            url = serializers.CampsiteListSerializer().get_thumbnail_url(campsite)
+        self.assertEqual(url, serializers.build_image_url("a-0"))
+
+
+class CampsiteOrderingTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.campsites = seed_catalogue(cls.owner, campsites=3, reviews=0)
+        for campsite, rating in zip(cls.campsites, (3, 5, 1)):
+            models.Campsite.objects.apply_rating_change(campsite.pk, added=rating)
+
+    def test_order_by_rating(self):
+        with self.assertQueryBudget(queries=3):
+            response = self.client.get(
+                "/api/v1/campsites/", {"ordering": "-rating_average"}
+            )
+        self.assertEqual(
+            [item["rating_average"] for item in response.data["results"]],
+            [5.0, 3.0, 1.0],
+        )
+        self.assertEqual(response.data["results"][0]["rating_count"], 1)
+
+    def test_rating_average_is_a_number_in_list_and_detail(self):
+        campsite = self.campsites[0]
+        for rating in (5, 4):
+            models.Campsite.objects.apply_rating_change(campsite.pk, added=rating)
+        campsite.refresh_from_db()
+        # (3 + 5 + 4) / 3, 컬럼과 같은 소수점 둘째 자리
+        self.assertEqual(campsite.rating_average, Decimal("4.00"))
+
+        detail = self.client.get(f"/api/v1/campsites/{campsite.pk}/")
+        self.assertEqual(json.loads(detail.content)["rating_average"], 4.0)
+        listing = self.client.get("/api/v1/campsites/", {"ordering": "-rating_average"})
+        self.assertEqual(
+            json.loads(listing.content)["results"][1]["rating_average"], 4.0
+        )
+
+        models.Campsite.objects.apply_rating_change(campsite.pk, added=5)
+        campsite.refresh_from_db()
+        self.assertEqual(campsite.rating_average, Decimal("4.25"))
+        models.Campsite.objects.apply_rating_change(campsite.pk, added=4)
+        campsite.refresh_from_db()
+        self.assertEqual(campsite.rating_average, Decimal("4.20"))
+        models.Campsite.objects.apply_rating_change(campsite.pk, added=1)
+        campsite.refresh_from_db()
+        self.assertEqual(campsite.rating_average, Decimal("3.67"))
+
+    def test_rating_fields_are_read_only(self):
+        campsite = self.campsites[1]
+        self.client.force_authenticate(self.owner)
+        response = self.client.patch(
+            f"/api/v1/campsites/{campsite.pk}/",
+            {"rating_average": "1.00", "rating_count": 999, "rating_5_count": 0},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        campsite.refresh_from_db()
+        self.assertEqual(
+            (campsite.rating_count, campsite.rating_average, campsite.rating_5_count),
+            (1, 5, 1),
+        )
+
+
+class CampsiteSearchTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        seed_catalogue(cls.owner, campsites=20)
+        cls.lake = models.Campsite.objects.create(
+            owner=cls.owner,
+            name="호수 글램핑",
+            address="경기도 가평군",
+            description="호수가 보이는 글램핑장입니다. Lake view",
+            price=120000,
+            check_in="2024-06-01",
+            check_out="2024-06-02",
+        )
+
+    def search(self, query):
+        return self.client.get("/api/v1/campsites/search/", {"q": query})
+
+    def test_korean_partial_words_match(self):
+        for query in ("글램핑", "호수", "가평", "lake", "글램핑장"):
+            response = self.search(query)
+            self.assertEqual(response.status_code, 200, query)
+            self.assertEqual(
+                [item["id"] for item in response.data["results"]], [self.lake.pk], query
+            )
+
+    def test_results_are_ranked_and_paginated(self):
+        with self.assertQueryBudget(queries=2, rows=1 + PAGE_SIZE):
+            response = self.search("평창 캠핑장")
+        self.assertEqual(response.data["count"], 20)
+        self.assertEqual(len(response.data["results"]), PAGE_SIZE)
+
+    def test_index_follows_updates_and_deletes(self):
+        self.lake.name = "숲속 오토캠핑"
+        self.lake.save()
+        self.assertEqual(self.search("숲속").data["count"], 1)
+        self.assertEqual(self.search("호수 글램핑").data["count"], 1)
+
+        self.lake.delete()
+        self.assertEqual(self.search("숲속").data["count"], 0)
+
+    def test_query_is_required(self):
+        self.assertEqual(self.search(" ").status_code, 400)
+
+
+class CampsiteNearbyTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        # seed_catalogue의 주소는 모두 "강원도 평창군 ..."
+        seed_catalogue(cls.owner, campsites=15, reviews=0)
+        cls.gapyeong = models.Campsite.objects.create(
+            owner=cls.owner,
+            name="가평 캠핑장",
+            address="경기도 가평군 북면",
+            description="계곡",
+            price=60000,
+            check_in="2024-06-01",
+            check_out="2024-06-02",
+        )
+        call_command("geocode_campsites", stdout=io.StringIO())
+
+    def nearby(self, **params):
+        return self.client.get("/api/v1/campsites/nearby/", params)
+
+    def test_geocoder_uses_longest_prefix(self):
+        geocoder = geo.Geocoder(
+            [("강원특별자치도", 37.8, 127.7), ("강원도 평창군", 37.37, 128.39)]
+        )
+        self.assertEqual(
+            geocoder.lookup("강원특별자치도 평창군 대관령면"), (37.37, 128.39)
+        )
+        self.assertEqual(geocoder.lookup("강원 홍천군"), (37.8, 127.7))
+        self.assertIsNone(geocoder.lookup("경기도 가평군"))
+
+    def test_command_fills_coordinates_and_grid_cell(self):
+        self.gapyeong.refresh_from_db()
+        self.assertIsNotNone(self.gapyeong.latitude)
+        self.assertEqual(
+            self.gapyeong.geo_cell,
+            geo.cell_for(self.gapyeong.latitude, self.gapyeong.longitude),
+        )
+        self.assertFalse(models.Campsite.objects.filter(latitude__isnull=True).exists())
+
+    def test_radius_search_orders_by_distance(self):
+        # COUNT(*) + 페이지 조회
+        with self.assertQueryBudget(queries=2, rows=1 + PAGE_SIZE):
+            response = self.nearby(lat=37.37, lng=128.39, radius=30)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 15)
+        distances = [item["distance_km"] for item in response.data["results"]]
+        self.assertEqual(distances, sorted(distances))
+        self.assertLess(distances[-1], 1)
+
+        # 평창과 가평은 약 80km 떨어져 있음
+        response = self.nearby(lat=37.83, lng=127.51, radius=30)
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]], [self.gapyeong.pk]
+        )
+        self.assertEqual(
+            self.nearby(lat=37.83, lng=127.51, radius=100).data["count"], 16
+        )
+
+    def test_bbox_search(self):
+        response = self.nearby(bbox="127.0,37.5,128.0,38.0")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]], [self.gapyeong.pk]
+        )
+        self.assertIsNone(response.data["results"][0]["distance_km"])
+
+    def test_grid_cell_follows_coordinate_updates(self):
+        self.gapyeong.latitude, self.gapyeong.longitude = 33.25, 126.56
+        self.gapyeong.save(update_fields=["latitude", "longitude"])
+        response = self.nearby(lat=33.25, lng=126.56, radius=5)
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]], [self.gapyeong.pk]
+        )
+
+    def test_invalid_parameters(self):
+        self.assertEqual(self.nearby(lat=37.37).status_code, 400)
+        self.assertEqual(
+            self.nearby(lat=37.37, lng=128.39, radius=1000).status_code, 400
+        )
+        self.assertEqual(self.nearby(bbox="1,2,3").status_code, 400)
+        self.assertEqual(self.nearby(bbox="120,30,130,40").status_code, 400)
+
+
+class CampsitePricingTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.campsite = seed_catalogue(cls.owner, campsites=1, reviews=0)[0]
+        cls.auto = models.Site.objects.create(
+            campsite=cls.campsite, name="A1", camp_type="오토캠핑", base_price=50000
+        )
+        cls.glamping = models.Site.objects.create(
+            campsite=cls.campsite, name="G1", camp_type="글램핑", base_price=80000
+        )
+        rules = [
+            ("주말", "2024-07-01", "2024-07-31", "5,6", 20000),
+            ("성수기", "2024-07-20", "2024-08-20", "", 10000),
+            ("작년 주말", "2023-07-01", "2023-07-31", "5,6", 99999),
+        ]
+        for name, start, end, weekdays, charge in rules:
+            models.PricingRule.objects.create(
+                campsite=cls.campsite,
+                name=name,
+                start_date=start,
+                end_date=end,
+                day_of_week=weekdays,
+                extra_charge=charge,
+            )
+
+    def quote(self, check_in, check_out, campsite=None):
+        campsite = campsite or self.campsite
+        return self.client.get(
+            f"/api/v1/campsites/{campsite.pk}/quote/",
+            {"check_in": check_in, "check_out": check_out},
+        )
+
+    def test_weekday_mask(self):
+        self.assertEqual(pricing.parse_weekday_mask("0, 6"), 0b1000001)
+        self.assertEqual(pricing.parse_weekday_mask(""), pricing.ALL_WEEKDAYS)
+        with self.assertRaises(ValueError):
+            pricing.parse_weekday_mask("7")
+
+    def test_quote_stacks_matching_rules(self):
+        # 2024-07-19(금), 20(토), 21(일) 3박
+        response = self.quote("2024-07-19", "2024-07-22")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["nights"], 3)
+        auto, glamping = response.data["sites"]
+        self.assertEqual(auto["id"], self.auto.pk)
+        self.assertEqual(auto["nightly_prices"], ["50000.00", "80000.00", "80000.00"])
+        self.assertEqual(auto["total_price"], "210000.00")
+        self.assertEqual(glamping["total_price"], "300000.00")
+
+    async def test_quote_from_async_client(self):
+        response = await self.async_client.get(
+            f"/api/v1/campsites/{self.campsite.pk}/quote/",
+            {"check_in": "2024-07-19", "check_out": "2024-07-22"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["sites"][1]["total_price"], "300000.00")
+
+    def test_compiled_rules_are_cached_until_rules_change(self):
+        # 첫 요청: 캠핑장 조회 + 사이트/규칙 컴파일
+        with self.assertQueryBudget(queries=3):
+            self.quote("2024-07-01", "2024-07-31")
+        with self.assertQueryBudget(queries=1):
+            response = self.quote("2024-07-01", "2024-07-31")
+        self.assertEqual(response.data["nights"], 30)
+
+        models.PricingRule.objects.create(
+            campsite=self.campsite,
+            name="평일 할인",
+            start_date="2024-07-01",
+            end_date="2024-07-31",
+            day_of_week="0,1,2,3",
+            extra_charge=-5000,
+        )
+        response = self.quote("2024-07-01", "2024-07-02")
+        self.assertEqual(response.data["sites"][0]["nightly_prices"], ["45000.00"])
+
+    def test_matches_per_night_evaluation(self):
+        rules = list(models.PricingRule.objects.all())
+        for check_in, check_out in [
+            ("2023-06-25", "2023-08-05"),
+            ("2024-06-25", "2024-08-25"),
+        ]:
+            data = self.quote(check_in, check_out).data
+            for night, price in zip(data["dates"], data["sites"][0]["nightly_prices"]):
+                expected = self.auto.base_price + sum(
+                    rule.extra_charge
+                    for rule in rules
+                    if rule.start_date <= night <= rule.end_date
+                    and pricing.parse_weekday_mask(rule.day_of_week) >> night.weekday()
+                    & 1
+                )
+                self.assertEqual(price, f"{expected:.2f}", night)
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.quote("2024-07-02", "2024-07-02").status_code, 400)
+        self.assertEqual(self.quote("2024-07-02", "2026-07-02").status_code, 400)
+        response = self.client.get(
+            "/api/v1/campsites/0/quote/",
+            {"check_in": "2024-07-01", "check_out": "2024-07-02"},
+        )
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(PRICE_CALENDAR_DAYS=60)
+class SiteDailyPriceTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.today = timezone.localdate()
+        cls.cheap, cls.pricey, cls.empty = seed_catalogue(
+            cls.owner, campsites=3, reviews=0
+        )
+        cls.cheap_site = models.Site.objects.create(
+            campsite=cls.cheap, name="A1", camp_type="오토캠핑", base_price=30000
+        )
+        models.Site.objects.create(
+            campsite=cls.cheap, name="A2", camp_type="오토캠핑", base_price=40000
+        )
+        cls.pricey_site = models.Site.objects.create(
+            campsite=cls.pricey, name="G1", camp_type="글램핑", base_price=55000
+        )
+        cls.rule = models.PricingRule.objects.create(
+            campsite=cls.cheap,
+            name="성수기",
+            start_date=cls.today + datetime.timedelta(days=10),
+            end_date=cls.today + datetime.timedelta(days=19),
+            extra_charge=30000,
+        )
+
+    def day(self, offset):
+        return self.today + datetime.timedelta(days=offset)
+
+    def prices(self, site):
+        return dict(site.daily_prices.values_list("date", "price"))
+
+    def test_table_covers_horizon(self):
+        prices = self.prices(self.cheap_site)
+        self.assertEqual(len(prices), 60)
+        self.assertEqual(prices[self.day(0)], 30000)
+        self.assertEqual(prices[self.day(10)], 60000)
+        self.assertEqual(prices[self.day(20)], 30000)
+
+    def test_rule_change_refreshes_only_its_window(self):
+        outside = set(
+            self.cheap_site.daily_prices.filter(date__gte=self.day(30)).values_list(
+                "id", flat=True
+            )
+        )
+        self.rule.end_date = self.day(24)
+        self.rule.save()
+
+        prices = self.prices(self.cheap_site)
+        self.assertEqual(prices[self.day(24)], 60000)
+        self.assertEqual(prices[self.day(25)], 30000)
+        # 규칙 구간 밖의 행은 그대로 유지됨
+        self.assertTrue(
+            outside <= set(self.cheap_site.daily_prices.values_list("id", flat=True))
+        )
+
+        self.rule.delete()
+        self.assertEqual(self.prices(self.cheap_site)[self.day(10)], 30000)
+
+    def test_base_price_change_refreshes_only_that_site(self):
+        other = set(self.pricey_site.daily_prices.values_list("id", flat=True))
+        self.cheap_site.base_price = 35000
+        self.cheap_site.save()
+        self.assertEqual(self.prices(self.cheap_site)[self.day(0)], 35000)
+        self.assertEqual(
+            set(self.pricey_site.daily_prices.values_list("id", flat=True)), other
+        )
+
+    def test_filter_and_order_by_stay_price(self):
+        stay = {"stay_start": self.day(9), "stay_end": self.day(12)}
+        # validator(MAX/COUNT) + COUNT(*) + 페이지 조회
+        with self.assertQueryBudget(queries=3):
+            response = self.client.get(
+                "/api/v1/campsites/", {**stay, "ordering": "stay_price"}
+            )
+        self.assertEqual(response.status_code, 200)
+        results = response.data["results"]
+        # 1박 30000 + 성수기 2박 60000, 요금표가 없는 캠핑장은 마지막(NULL)
+        self.assertEqual(
+            [(item["id"], item["stay_price"]) for item in results],
+            [
+                (self.cheap.pk, "150000.00"),
+                (self.pricey.pk, "165000.00"),
+                (self.empty.pk, None),
+            ],
+        )
+        response = self.client.get(
+            "/api/v1/campsites/", {**stay, "ordering": "-stay_price"}
+        )
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]],
+            [self.pricey.pk, self.cheap.pk, self.empty.pk],
+        )
+
+        response = self.client.get(
+            "/api/v1/campsites/", {**stay, "max_stay_price": 160000}
+        )
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]], [self.cheap.pk]
+        )
+
+    def test_stay_dates_are_validated(self):
+        response = self.client.get("/api/v1/campsites/", {"ordering": "stay_price"})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(
+            "/api/v1/campsites/", {"stay_start": self.day(3), "stay_end": self.day(3)}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_command_rolls_horizon(self):
+        models.SiteDailyPrice.objects.filter(date__gte=self.day(50)).delete()
+        models.SiteDailyPrice.objects.create(
+            site=self.pricey_site, campsite=self.pricey, date=self.day(-1), price=1
+        )
+        call_command("refresh_daily_prices", stdout=io.StringIO())
+        self.assertEqual(len(self.prices(self.cheap_site)), 60)
+        self.assertEqual(len(self.prices(self.pricey_site)), 60)
+        self.assertNotIn(self.day(-1), self.prices(self.pricey_site))
+
+
+class CampsiteFilterTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.owner = User.objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.other = User.objects.create_user(
+            email="other@example.com", username="other", password="password"
+        )
+        # 가격: 50000, 51000, ..., 55000 / 날짜는 모두 2024-06-01 ~ 06-03
+        cls.campsites = seed_catalogue(cls.owner, campsites=6, amenities=2, reviews=0)
+        first, second, third = cls.campsites[:3]
+
+        cls.pet = models.Amenity.objects.create(name="반려견 동반")
+        cls.wifi = models.Amenity.objects.create(name="와이파이")
+        models.CampsiteAmenity.objects.create(campsite=first, amenity=cls.pet)
+        models.CampsiteAmenity.objects.create(campsite=first, amenity=cls.wifi)
+        models.CampsiteAmenity.objects.create(campsite=second, amenity=cls.pet)
+
+        models.Site.objects.create(
+            campsite=second, name="G1", camp_type="글램핑", base_price=90000
+        )
+        models.Site.objects.create(
+            campsite=third, name="C1", camp_type="카라반", base_price=90000
+        )
+        models.Site.objects.create(
+            campsite=third, name="C2", camp_type="카라반", base_price=90000
+        )
+
+        third.owner = cls.other
+        third.check_in = datetime.date(2024, 7, 10)
+        third.check_out = datetime.date(2024, 7, 12)
+        third.save()
+
+    def ids(self, **params):
+        response = self.client.get("/api/v1/campsites/", params)
+        self.assertEqual(response.status_code, 200, response.data)
+        return {item["id"] for item in response.data["results"]}
+
+    def test_price_range(self):
+        expected = {c.pk for c in self.campsites if 51000 <= c.price <= 53000}
+        self.assertEqual(self.ids(price_min=51000, price_max=53000), expected)
+
+    def test_date_windows(self):
+        third = self.campsites[2]
+        self.assertEqual(self.ids(check_in_after="2024-07-01"), {third.pk})
+        self.assertEqual(
+            self.ids(check_out_before="2024-06-30"),
+            {c.pk for c in self.campsites} - {third.pk},
+        )
+
+    def test_amenities_require_all(self):
+        first, second = self.campsites[:2]
+        self.assertEqual(self.ids(amenities=str(self.pet.pk)), {first.pk, second.pk})
+        self.assertEqual(
+            self.ids(amenities=f"{self.pet.pk},{self.wifi.pk}"), {first.pk}
+        )
+
+    def test_owner_and_camp_type(self):
+        second, third = self.campsites[1:3]
+        self.assertEqual(self.ids(owner=self.other.pk), {third.pk})
+        self.assertEqual(self.ids(camp_type="카라반"), {third.pk})
+        self.assertEqual(self.ids(camp_type="글램핑,카라반"), {second.pk, third.pk})
+
+    def test_filters_keep_query_budget(self):
+        # 필터 조건은 모두 서브쿼리로 들어가므로 목록 쿼리 수는 그대로
+        with self.assertQueryBudget(queries=3):
+            response = self.client.get(
+                "/api/v1/campsites/",
+                {
+                    "price_min": 50000,
+                    "amenities": str(self.pet.pk),
+                    "camp_type": "글램핑",
+                    "owner": self.owner.pk,
+                },
+            )
+        self.assertEqual(response.data["count"], 1)
+
+    def test_invalid_filter_value(self):
+        response = self.client.get("/api/v1/campsites/", {"price_min": "abc"})
+        self.assertEqual(response.status_code, 400)
+
+
+class CampsiteFacetTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        # 모든 캠핑장이 amenity-0, amenity-1을 가짐. 가격: 50000 ~ 53000
+        cls.campsites = seed_catalogue(cls.owner, campsites=4, amenities=2, reviews=0)
+        cls.shower = models.Amenity.objects.create(name="샤워실")
+        cls.unused = models.Amenity.objects.create(name="수영장")
+        for campsite in cls.campsites[:2]:
+            models.CampsiteAmenity.objects.create(campsite=campsite, amenity=cls.shower)
+            models.Site.objects.create(
+                campsite=campsite, name="G1", camp_type="글램핑", base_price=90000
+            )
+            models.Site.objects.create(
+                campsite=campsite, name="G2", camp_type="글램핑", base_price=90000
+            )
+        models.Site.objects.create(
+            campsite=cls.campsites[3], name="A1", camp_type="오토캠핑", base_price=30000
+        )
+
+    def facets(self, **params):
+        return self.client.get("/api/v1/campsites/facets/", params)
+
+    def test_counts_all_facets_in_one_query(self):
+        with self.assertQueryBudget(queries=1):
+            response = self.facets()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 4)
+        self.assertEqual(
+            [(item["name"], item["count"]) for item in response.data["amenities"]],
+            [("amenity-0", 4), ("amenity-1", 4), ("샤워실", 2), ("수영장", 0)],
+        )
+        # 사이트가 여러 개여도 캠핑장 수로 셈
+        self.assertEqual(
+            response.data["camp_types"],
+            [
+                {"camp_type": "글램핑", "count": 2},
+                {"camp_type": "오토캠핑", "count": 1},
+            ],
+        )
+
+    def test_counts_follow_current_filter(self):
+        # seed 순서상 앞쪽 두 곳이 50000, 51000원
+        response = self.facets(price_max=51000)
+        self.assertEqual(response.data["count"], 2)
+        counts = {item["name"]: item["count"] for item in response.data["amenities"]}
+        self.assertEqual(counts["샤워실"], 2)
+        self.assertEqual(
+            {item["camp_type"]: item["count"] for item in response.data["camp_types"]},
+            {"글램핑": 2, "오토캠핑": 0},
+        )
+
+        response = self.facets(camp_type="오토캠핑")
+        self.assertEqual(response.data["count"], 1)
+        counts = {item["name"]: item["count"] for item in response.data["amenities"]}
+        self.assertEqual(counts["샤워실"], 0)
+
+    @override_settings(RESPONSE_CACHE_ENABLED=True)
+    def test_cached_until_data_changes(self):
+        self.facets()
+        with self.assertQueryBudget(queries=0):
+            response = self.facets()
+        self.assertEqual(response["X-Cache"], "HIT")
+
+        models.CampsiteAmenity.objects.create(
+            campsite=self.campsites[3], amenity=self.unused
+        )
+        counts = {
+            item["name"]: item["count"] for item in self.facets().data["amenities"]
+        }
+        self.assertEqual(counts["수영장"], 1)
+
+        self.unused.name = "야외 수영장"
+        self.unused.save()
+        names = {item["name"] for item in self.facets().data["amenities"]}
+        self.assertIn("야외 수영장", names)
+
+
+class CampsiteSparseFieldsTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", username="owner", password="password"
+        )
+        cls.campsites = seed_catalogue(cls.owner, campsites=3, images=3, amenities=2)
+        cls.campsite = cls.campsites[0]
+        cls.detail_url = f"/api/v1/campsites/{cls.campsite.pk}/"
+
+    def page_sql(self, budget):
+        # validator, COUNT(*) 다음이 페이지 조회
+        return budget.queries[-1]["sql"]
+
+    def test_list_fields(self):
+        with self.assertQueryBudget(queries=3) as budget:
+            response = self.client.get(
+                "/api/v1/campsites/", {"fields": "id,name,thumbnail_url"}
+            )
+        self.assertEqual(
+            set(response.data["results"][0]), {"id", "name", "thumbnail_url"}
+        )
+        self.assertNotIn('"description"', self.page_sql(budget))
+
+        # 대표 이미지가 필요 없으면 서브쿼리도 빠짐
+        with self.assertQueryBudget(queries=3) as budget:
+            self.client.get("/api/v1/campsites/", {"fields": "id,name"})
+        self.assertNotIn("campsiteimage", self.page_sql(budget))
+
+    def test_list_expand(self):
+        # validator + COUNT(*) + 페이지 조회 + 요청한 관계(images, amenities)만 prefetch
+        with self.assertQueryBudget(queries=5):
+            response = self.client.get(
+                "/api/v1/campsites/", {"fields": "id", "expand": "images,amenities"}
+            )
+        item = response.data["results"][0]
+        self.assertEqual(set(item), {"id", "images", "amenities"})
+        self.assertEqual(len(item["images"]), 3)
+
+        # 기본 목록 응답은 그대로
+        response = self.client.get("/api/v1/campsites/")
+        self.assertNotIn("images", response.data["results"][0])
+        self.assertIn("description", response.data["results"][0])
+
+    def test_detail_fields_skip_relations(self):
+        # validator + campsite (owner/policy JOIN, images/amenities prefetch 없음)
+        with self.assertQueryBudget(queries=2) as budget:
+            response = self.client.get(self.detail_url, {"fields": "id,name,price"})
+        self.assertEqual(
+            response.data, {"id": self.campsite.pk, "name": "캠핑장 0", "price": 50000}
+        )
+        self.assertNotIn("JOIN", self.page_sql(budget))
+        self.assertNotIn('"description"', self.page_sql(budget))
+
+        with self.assertQueryBudget(queries=3):
+            response = self.client.get(self.detail_url, {"fields": "owner,images"})
+        self.assertEqual(response.data["owner"], "owner")
+        self.assertEqual(len(response.data["images"]), 3)
+
+    @override_settings(RESPONSE_CACHE_ENABLED=True)
+    def test_fields_are_part_of_cache_key(self):
+        self.client.get(self.detail_url, {"fields": "id"})
+        response = self.client.get(self.detail_url, {"fields": "id,name"})
+        self.assertEqual(set(response.data), {"id", "name"})
+        self.assertEqual(response["X-Cache"], "MISS")
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=False, PRICE_CALENDAR_DAYS=30)
+class CampsiteValuesSerializationTests(QueryBudgetTestCase):
+    """.values() fast path가 기존 serializer와 같은 바이트를 응답하는지 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.today = timezone.localdate()
+        cls.campsites = seed_catalogue(cls.owner, campsites=12, images=2, reviews=15)
+        # 좌표/요금표가 없는 캠핑장도 섞이도록 일부에만 사이트 생성
+        for campsite in cls.campsites[:6]:
+            models.Site.objects.create(
+                campsite=campsite, name="A1", camp_type="오토캠핑", base_price=33333
+            )
+        call_command("geocode_campsites", stdout=io.StringIO())
+
+    def assertSameBytes(self, url, params=None):
+        with mock.patch.object(
+            fast_serializers.ValuesPlan,
+            "render",
+            autospec=True,
+            side_effect=fast_serializers.ValuesPlan.render,
+        ) as render:
+            fast = self.client.get(url, params)
+        self.assertTrue(render.called, url)
+
+        with mock.patch.object(views.CampsiteViewSet, "values_list_actions", ()):
+            slow = self.client.get(url, params)
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(fast.content, slow.content)
+
+    def test_list_endpoints_match_model_serializers(self):
+        stay_start = self.today + datetime.timedelta(days=2)
+        stay = {
+            "stay_start": stay_start,
+            "stay_end": stay_start + datetime.timedelta(days=3),
+        }
+        cases = [
+            ("/api/v1/campsites/", None),
+            ("/api/v1/campsites/", {"page": 2}),
+            ("/api/v1/campsites/", {"pagination": "cursor"}),
+            ("/api/v1/campsites/", {"fields": "id,name,thumbnail_url,stay_nights"}),
+            ("/api/v1/campsites/", {**stay, "ordering": "stay_price"}),
+            ("/api/v1/campsites/search/", {"q": "캠핑장"}),
+            ("/api/v1/campsites/nearby/", {"lat": 37.37, "lng": 128.39}),
+            ("/api/v1/campsites/nearby/", {"bbox": "128,37,129,38"}),
+            (
+                "/api/v1/campsites/available/",
+                {"check_in": stay["stay_start"], "check_out": stay["stay_end"]},
+            ),
+        ]
+        for url, params in cases:
+            with self.subTest(url=url, params=params):
+                self.assertSameBytes(url, params)
+
+    def test_cursor_pages_without_key_fields(self):
+        response = self.client.get(
+            "/api/v1/campsites/", {"pagination": "cursor", "fields": "name"}
+        )
+        self.assertEqual(set(response.data["results"][0]), {"name"})
+        response = self.client.get(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_nested_fields_fall_back_to_model_serializer(self):
+        response = self.client.get("/api/v1/campsites/", {"expand": "images"})
+        self.assertEqual(len(response.data["results"][0]["images"]), 2)
+
+
+class CampsiteExportTests(QueryBudgetTestCase):
+    url = "/api/v1/campsites/export/"
+
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.owner = User.objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.staff = User.objects.create_user(
+            email="staff@example.com", password="password", is_staff=True
+        )
+        cls.campsites = seed_catalogue(cls.owner, campsites=5, images=2, amenities=2)
+
+    def export(self, **params):
+        self.client.force_authenticate(self.staff)
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content)
+
+    def test_staff_only(self):
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+        self.client.force_authenticate(self.owner)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_ndjson_includes_relations_and_aggregates(self):
+        lines = self.export().decode("utf-8").splitlines()
+        self.assertEqual(len(lines), 5)
+        row = json.loads(lines[0])
+        self.assertEqual(row["id"], self.campsites[0].pk)
+        self.assertEqual(len(row["images"]), 2)
+        self.assertEqual(row["amenities"], ["amenity-0", "amenity-1"])
+        self.assertEqual(row["rating_count"], self.campsites[0].rating_count)
+
+    def test_csv(self):
+        body = self.export(format="csv").decode("utf-8")
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(json.loads(rows[0]["amenities"]), ["amenity-0", "amenity-1"])
+
+        self.client.force_authenticate(self.staff)
+        self.assertEqual(self.client.get(self.url, {"format": "xml"}).status_code, 400)
+
+    def test_reads_relations_per_chunk(self):
+        # 캠핑장 조회 1번 + 2개씩 3묶음 x (이미지 + 편의시설)
+        with mock.patch.object(views.CampsiteExportView, "chunk_size", 2):
+            with self.assertQueryBudget(queries=1 + 3 * 2):
+                self.export()
+
+    def test_command(self):
+        with tempfile.NamedTemporaryFile(suffix=".ndjson") as output:
+            call_command(
+                "export_catalogue", "reviews", output=output.name, stderr=io.StringIO()
+            )
+            lines = output.read().decode("utf-8").splitlines()
+        self.assertEqual(len(lines), 5 * 10)
+        self.assertIn("username", json.loads(lines[0]))
+
+
+class CampsiteExportASGITests(TransactionTestCase):
+    # ASGI handler는 요청마다 별도 스레드(DB 연결)에서 sync 코드를 실행하므로
+    # 테스트 트랜잭션 밖에서 데이터를 만들어야 함
+    def setUp(self):
+        User = get_user_model()
+        owner = User.objects.create_user(email="owner@example.com", password="password")
+        self.staff = User.objects.create_user(
+            email="staff@example.com", password="password", is_staff=True
+        )
+        seed_catalogue(owner, campsites=5, images=1, amenities=1, reviews=0)
+
+    async def test_streams_rows_through_asgi_handler(self):
+        read = []
+        get_rows = views.CampsiteExportView.get_rows
+
+        def counted_rows(view):
+            for row in get_rows(view):
+                read.append(row["id"])
+                yield row
+
+        token = str(AccessToken.for_user(self.staff))
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/campsites/export/",
+            "query_string": b"",
+            "headers": [
+                (b"host", b"testserver"),
+                (b"authorization", f"Bearer {token}".encode()),
+            ],
+        }
+        communicator = ApplicationCommunicator(asgi.application, scope)
+        with (
+            mock.patch.object(views.CampsiteExportView, "get_rows", counted_rows),
+            mock.patch("common.export.OUTPUT_BUFFER_SIZE", 1),
+        ):
+            await communicator.send_input({"type": "http.request", "body": b""})
+            start = await communicator.receive_output(timeout=10)
+            self.assertEqual(start["status"], 200)
+            # 첫 줄을 받았을 때는 아직 첫 행만 읽은 상태 (전체를 읽어 두고 보내지 않음)
+            message = await communicator.receive_output(timeout=10)
+            self.assertEqual(len(read), 1)
+            body = [message["body"]]
+            while message.get("more_body"):
+                message = await communicator.receive_output(timeout=10)
+                body.append(message.get("body", b""))
+        self.assertEqual(len(b"".join(body).splitlines()), 5)
+
+
+class CampsiteImportTests(QueryBudgetTestCase):
+    url = "/api/v1/campsites/import/"
+
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.owner = User.objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.staff = User.objects.create_user(
+            email="staff@example.com", password="password", is_staff=True
+        )
+        models.Amenity.objects.create(name="샤워실")
+
+    def record(self, index, **overrides):
+        record = {
+            "name": f"가져온 캠핑장 {index}",
+            "address": "강원 평창군 대관령면",
+            "description": "숲속 캠핑장",
+            "price": 50000 + index,
+            "check_in": "2024-01-01",
+            "check_out": "2024-01-02",
+            "latitude": 37.6,
+            "longitude": 128.7,
+            "image_ids": [f"image-{index}-{order}" for order in range(3)],
+            "policy": {
+                "check_in_time": "14:00",
+                "check_out_time": "11:00",
+                "manner_time_start": "22:00",
+                "manner_time_end": "07:00",
+            },
+            "amenities": ["샤워실", "매점", "샤워실"],
+            "sites": [
+                {"name": "A1", "camp_type": "오토캠핑", "base_price": "40000"},
+                {"name": "B1", "camp_type": "글램핑", "base_price": "90000"},
+            ],
+        }
+        record.update(overrides)
+        return record
+
+    def ndjson(self, records):
+        return b"".join(
+            json.dumps(record).encode("utf-8") + b"\n" for record in records
+        )
+
+    def upload(self, body, name="partner.ndjson", **data):
+        self.client.force_authenticate(self.staff)
+        upload = io.BytesIO(body)
+        upload.name = name
+        return self.client.post(self.url, {"file": upload, **data}, format="multipart")
+
+    def test_staff_only(self):
+        self.client.force_authenticate(self.owner)
+        response = self.client.post(self.url, {}, format="multipart")
+        self.assertEqual(response.status_code, 403)
+
+    def test_rejects_files_over_size_limit(self):
+        body = self.ndjson([self.record(index) for index in range(3)])
+        with self.settings(CAMPSITE_IMPORT_MAX_BYTES=len(body) - 1):
+            response = self.upload(body)
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(response.data["detail"].code, "import_too_large")
+        self.assertFalse(models.CampsiteImport.objects.exists())
+
+        with self.settings(CAMPSITE_IMPORT_MAX_BYTES=len(body)):
+            response = self.upload(body)
+        self.assertEqual(response.data["created_count"], 3)
+
+    def test_imports_relations_and_reports_invalid_rows(self):
+        body = self.ndjson([self.record(0), self.record(1, image_ids=["only-one"])])
+        body += b"not json\n" + self.ndjson([self.record(3)])
+        response = self.upload(body, owner=self.owner.pk)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["processed"], 4)
+        self.assertEqual(response.data["created_count"], 2)
+        self.assertEqual(response.data["failed_count"], 2)
+        self.assertEqual([error["line"] for error in response.data["errors"]], [2, 3])
+        self.assertIn("image_ids", response.data["errors"][0]["errors"])
+
+        campsite = models.Campsite.objects.get(name="가져온 캠핑장 0")
+        self.assertEqual(campsite.owner, self.owner)
+        self.assertTrue(campsite.search_document)
+        self.assertIsNotNone(campsite.geo_cell)
+        self.assertEqual(
+            list(campsite.images.values_list("cloudflare_id", flat=True)),
+            ["image-0-0", "image-0-1", "image-0-2"],
+        )
+        self.assertEqual(campsite.policy.check_out_time, datetime.time(11, 0))
+        self.assertEqual(
+            sorted(campsite.amenities.values_list("name", flat=True)),
+            ["매점", "샤워실"],
+        )
+        self.assertEqual(models.Amenity.objects.filter(name="매점").count(), 1)
+        self.assertEqual(campsite.sites.count(), 2)
+        self.assertEqual(
+            campsite.daily_prices.count(), 2 * settings.PRICE_CALENDAR_DAYS
+        )
+        glamping = campsite.daily_prices.filter(site__camp_type="글램핑").first()
+        self.assertEqual(glamping.price, 90000)
+
+    def test_reupload_resumes_from_checkpoint(self):
+        records = [self.record(index) for index in range(5)]
+        body = self.ndjson(records)
+        insert = importer._ChunkImporter._insert
+        calls = []
+
+        def fail_on_third_chunk(chunk_importer, rows):
+            calls.append(rows)
+            if len(calls) == 3:
+                raise RuntimeError("connection lost")
+            return insert(chunk_importer, rows)
+
+        job = importer.start(io.BytesIO(body), "partner.ndjson", self.owner)
+        with mock.patch.object(importer._ChunkImporter, "_insert", fail_on_third_chunk):
+            with self.assertRaises(RuntimeError):
+                importer.run(job, io.BytesIO(body), chunk_size=2)
+        job.refresh_from_db()
+        self.assertEqual(job.processed, 4)
+        self.assertEqual(models.Campsite.objects.count(), 4)
+
+        response = self.upload(body)
+        self.assertEqual(response.data["processed"], 5)
+        self.assertIsNotNone(response.data["completed_at"])
+        self.assertEqual(
+            sorted(models.Campsite.objects.values_list("price", flat=True)),
+            [record["price"] for record in records],
+        )
+
+        # 끝난 파일을 다시 올리면 아무것도 만들지 않음
+        self.upload(body)
+        self.assertEqual(models.Campsite.objects.count(), 5)
+
+    def test_queries_do_not_grow_with_rows(self):
+        def count_queries(rows):
+            body = self.ndjson(
+                # 일자 요금표는 행 수에 비례해 batch로 나뉘므로 사이트 없이 비교
+                [
+                    self.record(
+                        index, name=f"{rows}-{index}", amenities=["샤워실"], sites=[]
+                    )
+                    for index in range(rows)
+                ]
+            )
+            job = importer.start(io.BytesIO(body), "partner.ndjson", self.owner)
+            with QueryBudget() as budget:
+                importer.run(job, io.BytesIO(body))
+            return len(budget.queries)
+
+        self.assertEqual(count_queries(2), count_queries(6))
+
+    def test_csv_command(self):
+        header = ["name", "address", "description", "price", "check_in", "check_out"]
+        header += ["contact_number", "image_ids", "amenities"]
+        rows = [
+            [f"CSV 캠핑장 {index}", "경기 가평군", "계곡", 30000, "2024-01-01"]
+            + ["2024-01-03", "", json.dumps(["a", "b", "c"]), json.dumps(["샤워실"])]
+            for index in range(3)
+        ]
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", newline="") as source:
+            writer = csv.writer(source)
+            writer.writerow(header)
+            writer.writerows(rows)
+            source.flush()
+            stdout = io.StringIO()
+            call_command(
+                "import_campsites",
+                source.name,
+                owner="owner@example.com",
+                stdout=stdout,
+                stderr=io.StringIO(),
+            )
+        self.assertIn("캠핑장 3개 생성", stdout.getvalue())
+        campsite = models.Campsite.objects.get(name="CSV 캠핑장 0")
+        self.assertEqual(campsite.contact_number, "")
+        self.assertEqual(campsite.images.count(), 3)
+        self.assertEqual(
+            list(campsite.amenities.values_list("name", flat=True)), ["샤워실"]
+        )
+
+
+class ImageUploadURLTests(QueryBudgetTestCase):
+    url = "/api/v1/campsites/images/upload-url/"
+    batch_url = "/api/v1/campsites/images/upload-urls/"
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.stub = CloudflareStub().start()
+        cls.addClassCleanup(cls.stub.stop)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.stub.minted = 0
+        self.stub.connections = 0
+        settings_override = override_settings(
+            CLOUDFLARE_API_URL=self.stub.api_url,
+            CLOUDFLARE_ACCOUNT_ID="account",
+            CLOUDFLARE_API_TOKEN="token",
+            CLOUDFLARE_UPLOAD_URL_POOL_SIZE=0,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.client.force_authenticate(self.user)
+
+    async def test_mints_over_one_kept_alive_connection(self):
+        # async view + JWT aauthenticate. 테스트의 루프는 async_to_sync가 만든 루프이므로
+        # (WSGI와 같음) 프로세스별 requests 세션으로 발급하고 AsyncClient는 만들지 않음
+        headers = {"Authorization": f"Bearer {AccessToken.for_user(self.user)}"}
+        results = [
+            (await self.async_client.post(self.url, headers=headers)).json()
+            for _ in range(3)
+        ]
+        self.assertEqual(len({result["id"] for result in results}), 3)
+        self.assertTrue(results[0]["uploadURL"].startswith(self.stub.base_url))
+        self.assertEqual(self.stub.minted, 3)
+        self.assertEqual(self.stub.connections, 1)
+        self.assertEqual(self.stub.authorizations[-1], "Bearer token")
+        self.assertEqual(len(cloudflare._async_clients), 0)
+
+    def test_async_client_on_long_lived_loop(self):
+        # ASGI 워커처럼 루프 하나에서 여러 번 발급하면 AsyncClient의 연결 하나를 재사용
+        async def mint():
+            results = [await cloudflare.amint_upload_url() for _ in range(3)]
+            client = cloudflare.get_async_client()
+            await client.aclose()
+            return results
+
+        results = asyncio.run(mint())
+        self.assertEqual(len({result["id"] for result in results}), 3)
+        self.assertEqual(self.stub.connections, 1)
+
+    def test_retries_server_errors(self):
+        self.stub.fail_next(2, status=503)
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.stub.minted, 1)
+
+    def test_reports_cloudflare_errors(self):
+        self.stub.reject_next(1)
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["errors"][0]["code"], 5400)
+
+        self.stub.fail_next(settings.CLOUDFLARE_RETRIES + 1, status=500)
+        with mock.patch("campsites.cloudflare._backoff", return_value=0):
+            response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 500)
+
+    async def test_async_view_authentication(self):
+        response = await self.async_client.post(self.url)
+        self.assertEqual(response.status_code, 401)
+        self.assertIn("WWW-Authenticate", response)
+
+        response = await self.async_client.post(
+            self.url, headers={"Authorization": "Bearer invalid"}
+        )
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["code"], "token_not_valid")
+
+    @override_settings(CLOUDFLARE_UPLOAD_URL_POOL_SIZE=4)
+    def test_pool_hands_out_pre_minted_urls(self):
+        pool = cloudflare.get_pool()
+        # 첫 요청은 직접 발급하고 백그라운드에서 풀을 채움
+        self.assertEqual(self.client.post(self.url).status_code, 200)
+        pool.wait(timeout=5)
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(self.stub.minted, 5)
+
+        first = self.client.post(self.url).data
+        self.assertEqual(self.stub.minted, 5)
+        self.assertEqual(len(pool), 3)
+        self.assertNotEqual(first["id"], self.client.post(self.url).data["id"])
+        pool.wait(timeout=5)
+        self.assertEqual(len(pool), 4)
+
+        # 만료가 가까운 URL은 버리고 직접 발급한 뒤 풀을 다시 채움
+        minted = self.stub.minted
+        with mock.patch("time.time", return_value=time.time() + 3600):
+            self.client.post(self.url)
+            pool.wait(timeout=5)
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(self.stub.minted, minted + 1 + 4)
+
+    def test_batch_fetches_urls_concurrently(self):
+        self.stub.delay = 0.2
+        self.addCleanup(setattr, self.stub, "delay", 0)
+        started = time.perf_counter()
+        response = self.client.post(self.batch_url, {"count": 5}, format="json")
+        elapsed = time.perf_counter() - started
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len({result["id"] for result in response.data["results"]}), 5)
+        self.assertEqual(response.data["errors"], [])
+        # 순서대로 보냈다면 1초
+        self.assertLess(elapsed, 0.6)
+
+    def test_batch_reports_partial_failures(self):
+        self.stub.reject_next(2)
+        response = self.client.post(self.batch_url, {"count": 5}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertEqual(len(response.data["errors"]), 2)
+        self.assertEqual(response.data["errors"][0]["errors"][0]["code"], 5400)
+
+        self.stub.reject_next(2)
+        response = self.client.post(self.batch_url, {"count": 2}, format="json")
+        self.assertEqual(response.status_code, 502)
+
+    @override_settings(CLOUDFLARE_UPLOAD_URL_POOL_SIZE=4)
+    def test_batch_uses_pool_first(self):
+        pool = cloudflare.get_pool()
+        pool.refill()
+        pool.wait(timeout=5)
+        response = self.client.post(self.batch_url, {"count": 6}, format="json")
+        self.assertEqual(len(response.data["results"]), 6)
+        pool.wait(timeout=5)
+        # 풀 4개 + 직접 발급 2개 + 풀 다시 채우기 4개
+        self.assertEqual(self.stub.minted, 4 + 2 + 4)
+
+    @override_settings(CLOUDFLARE_UPLOAD_URL_QUOTA=5, CLOUDFLARE_UPLOAD_URL_BATCH_MAX=4)
+    def test_batch_limits(self):
+        response = self.client.post(self.batch_url, {"count": 5}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+        self.assertEqual(
+            self.client.post(self.batch_url, {"count": 4}, format="json").status_code,
+            200,
+        )
+        response = self.client.post(self.batch_url, {"count": 2}, format="json")
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+
+        # 발급에 실패한 URL은 한도에서 빠짐
+        self.stub.reject_next(1)
+        self.assertEqual(self.client.post(self.url).status_code, 400)
+        self.assertEqual(self.client.post(self.url).status_code, 200)
+        self.assertEqual(self.client.post(self.url).status_code, 429)
+
+    @override_settings(CLOUDFLARE_UPLOAD_URL_QUOTA=2)
+    def test_unexpected_errors_release_quota(self):
+        # HTTP 오류가 아닌 예외(응답 파싱 버그 등)로 끝나도 한도는 남아 있어야 함
+        self.client.raise_request_exception = False
+        with mock.patch(
+            "campsites.cloudflare.amint_upload_url", side_effect=RuntimeError
+        ):
+            self.assertEqual(self.client.post(self.url).status_code, 500)
+            response = self.client.post(self.batch_url, {"count": 2}, format="json")
+            self.assertEqual(response.status_code, 500)
+        response = self.client.post(self.batch_url, {"count": 2}, format="json")
+        self.assertEqual(len(response.data["results"]), 2)
@@ -33,6 +33,14 @@ reviews_router.register(
 urlpatterns = [
     # ⭐️ 구체적인 URL을 router보다 먼저 배치
     path("images/upload-url/", views.ImageUploadURLView.as_view()),
+    path("images/upload-urls/", views.ImageUploadURLBatchView.as_view()),
+    # 요금 견적 (async view)
+    path("<int:pk>/quote/", views.CampsiteQuoteView.as_view(), name="campsite-quote"),
+    # 관리자용 전체 내보내기 (NDJSON/CSV 스트리밍)
+    path("export/", views.CampsiteExportView.as_view()),
+    path("reviews/export/", commu_views.ReviewExportView.as_view()),
+    # 관리자용 대량 가져오기 (NDJSON/CSV)
+    path("import/", views.CampsiteImportView.as_view()),
     path("", include(router.urls)),
     path("", include(reviews_router.urls)),
     # path("<int:pk>/images/", views. API를 통해 백엔드에 전달하여 CampsiteImage 모델에 저장),
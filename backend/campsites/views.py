@@ -1,17 +1,36 @@
 from django.conf import settings
+from django.shortcuts import aget_object_or_404
 
-from rest_framework import viewsets, permissions
+from rest_framework import viewsets, permissions, parsers, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import Throttled, ValidationError
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
-
-import requests
-
+from common import cache as common_cache
+from common import conditional as common_conditional
+from common import dynamic_fields as common_dynamic_fields
+from common import export as common_export
+from common import fast_serializers as common_fast_serializers
+from common import pagination as common_pagination
 from common import permissions as common_perm
-from . import models, serializers
+from common import views as common_views
+from reservations import availability
+from reservations import serializers as reservation_serializers
+from . import cache, cloudflare, export, facets, geo, importer, models, pricing
+from . import serializers
+from . import filters as campsite_filters
+from . import search as campsite_search
 
 
-class CampsiteViewSet(viewsets.ModelViewSet):
+class CampsiteViewSet(
+    common_conditional.ConditionalGetMixin,
+    common_cache.CachedResponseMixin,
+    common_dynamic_fields.DynamicFieldsViewMixin,
+    common_fast_serializers.ValuesListMixin,
+    viewsets.ModelViewSet,
+):
     """
     캠핑장 정보 CRUD를 위한 ViewSet
     - list: 캠핑장 목록 조회
@@ -21,7 +40,8 @@ class CampsiteViewSet(viewsets.ModelViewSet):
     - destroy: 캠핑장 정보 삭제
     """
 
-    queryset = models.Campsite.objects.all()
+    # 검색 문서(search_document)는 응답에 쓰이지 않으므로 읽지 않음
+    queryset = models.Campsite.objects.defer("search_document")
 
     # 기본 권한: 인증된 사용자만 쓰기 가능, 읽기는 누구나
     # 추가 권한: IsOwnerOrReadOnly를 통해 객체 소유자만 수정/삭제 가능
@@ -30,16 +50,151 @@ class CampsiteViewSet(viewsets.ModelViewSet):
         common_perm.IsOwnerOrReadOnly,
     ]
 
+    # ?ordering=-rating_average 처럼 평점/가격/등록일 순 정렬 지원
+    # (평점은 Campsite에 비정규화된 값이므로 행마다 집계하지 않음)
+    # ?price_min=&amenities=1,2&camp_type=글램핑 등 목록 필터 (campsites.filters.CampsiteFilter)
+    filterset_class = campsite_filters.CampsiteFilter
+
+    # ?stay_start=&stay_end= 로 숙박 기간 요금(stay_price) 필터/정렬 지원 (일자 요금표 기반)
+    filter_backends = [
+        *api_settings.DEFAULT_FILTER_BACKENDS,
+        campsite_filters.StayPriceFilter,
+        campsite_filters.CampsiteOrderingFilter,
+    ]
+    ordering_fields = [
+        "created_at",
+        "price",
+        "rating_average",
+        "rating_count",
+        "stay_price",
+    ]
+
+    # ?pagination=cursor 로 요청하면 (created_at, id) keyset 페이지네이션 사용
+    cursor_pagination_class = common_pagination.KeysetPagination
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator") and self._use_cursor_pagination():
+            self._paginator = self.cursor_pagination_class()
+        return super().paginator
+
+    def _use_cursor_pagination(self):
+        if self.action != "list" or self.request is None:
+            return False
+        # keyset은 (created_at, id) 순서 고정이므로 ?ordering 과 함께 쓰면 page 방식으로 처리
+        params = self.request.query_params
+        return params.get("pagination") == "cursor" and not params.get("ordering")
+
+    # ?fields=id,name,thumbnail_url / ?expand=amenities 로 응답 필드 선택 (읽기 응답만)
+    dynamic_fields_actions = ("list", "retrieve", "search", "nearby", "available")
+    # 목록형 응답은 모델 인스턴스 대신 .values() 행으로 직렬화 (common.fast_serializers)
+    values_list_actions = ("list", "search", "nearby", "available")
+
+    # facet 개수도 목록과 같은 버전 키로 캐싱
+    response_cache_actions = ("list", "retrieve", "facets")
+
+    def get_response_cache_versions(self):
+        # 목록/facet은 전체 버전, 상세는 캠핑장별 버전에 의존
+        if self.action in ("list", "facets"):
+            return [cache.LIST_VERSION_KEY]
+        return [cache.campsite_version_key(self.kwargs[self.lookup_field])]
+
+    def get_conditional_queryset(self):
+        # validator 계산에는 annotate/prefetch가 필요 없으므로 기본 queryset 사용
+        queryset = models.Campsite.objects.all()
+        if self.action == "list":
+            return self.filter_queryset(queryset)
+        return queryset.filter(pk=self.kwargs[self.lookup_field])
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in self.dynamic_fields_actions:
+            # 응답에 포함될 필드에 필요한 것만 로드
+            # (대표 이미지는 서브쿼리, 연관 객체는 JOIN/prefetch로 페이지 크기와 무관하게 쿼리 수 고정)
+            queryset = queryset.for_response(self.get_response_fields())
+        elif self.action in ("update", "partial_update"):
+            # 상세 serializer가 사용하는 owner/policy/images/amenities를 미리 로드
+            queryset = queryset.with_detail_relations()
+        return queryset
+
     # 요청(action)에 따라 다른 serializer를 사용하도록 설정
     def get_serializer_class(self):
-        if self.action == "list":
+        if self.action in ("list", "search"):
             return serializers.CampsiteListSerializer
+        if self.action == "nearby":
+            return serializers.CampsiteNearbySerializer
+        if self.action == "available":
+            return serializers.CampsiteAvailabilitySerializer
         # 'create' 액션일 때 CampsiteCreateSerializer를 반환하도록 추가
         if self.action == "create":
             return serializers.CampsiteCreateSerializer
         # 그 외의 경우 (retrieve, update 등)는 DetailSerializer 사용
         return serializers.CampsiteDetailSerializer
 
+    @action(detail=False, methods=["get"])
+    def facets(self, request):
+        """
+        GET /api/v1/campsites/facets/?(목록과 같은 필터)
+        현재 필터 조건에서 편의시설별/사이트 유형별 캠핑장 수를 return
+        """
+        return self._cached_response(self._facets_response, request)
+
+    def _facets_response(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(facets.facet_counts(queryset))
+
+    @action(detail=False, methods=["get"])
+    def search(self, request):
+        """
+        GET /api/v1/campsites/search/?q=검색어
+        이름/주소/설명 전문 검색 결과를 관련도 순으로 페이지네이션하여 return
+        """
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            raise ValidationError({"q": "검색어를 입력해 주세요."})
+
+        queryset = campsite_search.search(self.get_queryset(), query)
+        return self.paginated_response(queryset)
+
+    @action(detail=False, methods=["get"])
+    def nearby(self, request):
+        """
+        GET /api/v1/campsites/nearby/?lat=37.37&lng=128.39&radius=30
+        반경(km) 안의 캠핑장을 가까운 순으로 return (distance_km 포함)
+
+        GET /api/v1/campsites/nearby/?bbox=128.0,37.0,129.0,38.0
+        지도 영역(최소경도,최소위도,최대경도,최대위도) 안의 캠핑장을 최신순으로 return
+        """
+        params = serializers.CampsiteNearbyQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        query = params.validated_data
+
+        if "bbox" in query:
+            queryset = geo.within_bbox(self.get_queryset(), *query["bbox"])
+            queryset = queryset.order_by("-created_at", "-id")
+        else:
+            queryset = geo.within_radius(
+                self.get_queryset(), query["lat"], query["lng"], query["radius"]
+            )
+        return self.paginated_response(queryset)
+
+    @action(detail=False, methods=["get"])
+    def available(self, request):
+        """
+        GET /api/v1/campsites/available/?check_in=2024-07-01&check_out=2024-07-03&sites=2
+        기간 내내 예약이 없는 사이트가 sites개 이상인 캠핑장을 return (free_sites 포함)
+        """
+        params = reservation_serializers.AvailabilityQuerySerializer(
+            data=request.query_params
+        )
+        params.is_valid(raise_exception=True)
+        query = params.validated_data
+
+        queryset = availability.with_free_sites(
+            self.get_queryset(), query["check_in"], query["check_out"]
+        ).filter(free_sites__gte=query["sites"])
+        return self.paginated_response(queryset)
+
     # def perform_create(self, serializer):
     #     """
     #     create 요청 시, 현재 로그인된 사용자를 자동으로 owner로 설정.
@@ -47,27 +202,151 @@ class CampsiteViewSet(viewsets.ModelViewSet):
     #     serializer.save(owner=self.request.user)
 
 
-class ImageUploadURLView(APIView):
-    permission_classes = [permissions.IsAuthenticated]
+class CampsiteQuoteView(common_views.AsyncAPIView):
+    async def get(self, request, pk):
+        """
+        GET /api/v1/campsites/{id}/quote/?check_in=2024-07-01&check_out=2024-07-03
+        모든 사이트의 박별 요금과 합계를 return (요금 규칙은 캐시된 컴파일 결과 사용)
+        """
+        params = serializers.CampsiteQuoteQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        check_in = params.validated_data["check_in"]
+        check_out = params.validated_data["check_out"]
+
+        # 견적에는 존재 여부만 필요
+        campsite = await aget_object_or_404(models.Campsite.objects.only("id"), pk=pk)
+        compiled = await pricing.aget_compiled(campsite.pk)
+        dates, prices = compiled.quote(check_in, check_out)
+        totals = prices.sum(axis=1)
+        return Response(
+            {
+                "campsite": campsite.pk,
+                "check_in": check_in,
+                "check_out": check_out,
+                "nights": len(dates),
+                "dates": dates,
+                "sites": [
+                    {
+                        "id": int(site_id),
+                        "name": name,
+                        "camp_type": camp_type,
+                        "nightly_prices": [pricing.format_cents(c) for c in row],
+                        "total_price": pricing.format_cents(total),
+                    }
+                    for site_id, name, camp_type, row, total in zip(
+                        compiled.site_ids,
+                        compiled.site_names,
+                        compiled.site_types,
+                        prices.tolist(),
+                        totals.tolist(),
+                    )
+                ],
+            }
+        )
+
+
+class CampsiteExportView(common_export.ExportView):
+    """
+    GET /api/v1/campsites/export/?format=ndjson|csv (관리자 전용)
+    전체 캠핑장을 이미지, 편의시설, 평점 집계와 함께 스트리밍
+    """
+
+    export_name = "campsites"
+    columns = export.CAMPSITE_COLUMNS
+
+    def get_rows(self):
+        return export.campsite_rows(self.chunk_size)
+
+
+class CampsiteImportView(APIView):
+    """
+    POST /api/v1/campsites/import/ (관리자 전용, multipart)
+    - file: NDJSON/CSV 캠핑장 목록 (형식은 campsites.importer 참고)
+    - format: ndjson | csv (기본: 파일 확장자로 판단)
+    - owner: 가져온 캠핑장의 소유자 id (기본: 요청한 관리자)
+    같은 파일을 다시 올리면 중단된 지점부터 이어서 가져오고, 이미 끝난 파일이면 결과만 return
+    파일이 CAMPSITE_IMPORT_MAX_BYTES보다 크면 413 (import_campsites 명령으로 가져옴)
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+    parser_classes = [parsers.MultiPartParser]
 
     def post(self, request):
-        url = f"https://api.cloudflare.com/client/v4/accounts/{settings.CLOUDFLARE_ACCOUNT_ID}/images/v2/direct_upload"
-        # 인증 헤더
-        headers = {
-            "Authorization": f"Bearer {settings.CLOUDFLARE_API_TOKEN}",
-        }
+        serializer = serializers.CampsiteImportRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data["file"]
+        # 요청 안에서 전부 처리하므로 워커를 오래 잡아 두지 않도록 크기를 제한
+        if upload.size > settings.CAMPSITE_IMPORT_MAX_BYTES:
+            raise importer.ImportTooLarge()
+        job = importer.start(
+            upload.file,
+            upload.name,
+            serializer.validated_data.get("owner", request.user),
+            serializer.validated_data.get("format"),
+        )
+        importer.run(job, upload.file)
+        return Response(serializers.CampsiteImportSerializer(job).data)
+
+
+class ImageUploadURLView(common_views.AsyncAPIView):
+    permission_classes = [permissions.IsAuthenticated]
 
+    async def post(self, request):
+        """
+        Cloudflare direct upload URL 하나를 return ({"id", "uploadURL"})
+        미리 발급해 둔 풀에서 꺼내므로 보통 Cloudflare 호출 없이 바로 응답함
+        """
+        quota = await _reserve_upload_urls(request.user, 1)
+        issued = 0
         try:
-            # Cloudflare에 일회용 업로드 URL 요청
-            response = requests.post(url, headers=headers)
-            response.raise_for_status()  # HTTP 에러가 발생하면 예외를 발생시킴
-
-            data = response.json()
-
-            if data.get("success"):
-                # 프론트엔드에 필요한 정보만 담아 전달
-                return Response(data["result"])
-            else:
-                return Response({"errors": data.get("errors")}, status=400)
-        except requests.exceptions.RequestException as e:
+            response = Response(await cloudflare.atake_upload_url())
+            issued = 1
+            return response
+        except cloudflare.CloudflareError as exc:
+            return Response({"errors": exc.errors}, status=400)
+        except cloudflare.request_errors() as e:
             return Response({"error": str(e)}, status=500)
+        finally:
+            # 발급하지 못했으면(예상하지 못한 오류, 요청 취소 포함) 한도를 되돌림
+            await quota.arelease(1 - issued)
+
+
+class ImageUploadURLBatchView(common_views.AsyncAPIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    async def post(self, request):
+        """
+        POST /api/v1/campsites/images/upload-urls/ {"count": 10}
+        업로드 URL count개를 한 번에 return (풀에 없는 만큼은 Cloudflare에 동시에 요청)
+            {"results": [{"id", "uploadURL"}, ...], "errors": [실패한 요청의 오류, ...]}
+        일부만 실패하면 200, 모두 실패하면 502
+        """
+        params = serializers.UploadURLBatchSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        count = params.validated_data["count"]
+
+        quota = await _reserve_upload_urls(request.user, count)
+        unused = count
+        try:
+            results, errors = await cloudflare.atake_upload_urls(count)
+            unused = len(errors)
+        finally:
+            # 예외로 끝나면(예상하지 못한 오류, 요청 취소 포함) 예약한 만큼 모두 되돌림
+            await quota.arelease(unused)
+        return Response(
+            {"results": results, "errors": errors},
+            status=status.HTTP_200_OK if results else status.HTTP_502_BAD_GATEWAY,
+        )
+
+
+async def _reserve_upload_urls(user, count):
+    quota = cloudflare.UploadURLQuota(user.pk)
+    if not await quota.areserve(count):
+        raise Throttled(
+            wait=quota.reset_in,
+            detail=(
+                f"업로드 URL은 {settings.CLOUDFLARE_UPLOAD_URL_QUOTA_WINDOW // 60}분에 "
+                f"{settings.CLOUDFLARE_UPLOAD_URL_QUOTA}개까지 요청할 수 있습니다."
+            ),
+        )
+    return quota
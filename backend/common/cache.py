@@ -0,0 +1,112 @@
+"""
+버전 키 기반 응답 캐시
+
+캐시 키에 "버전" 값을 포함시키고, 데이터가 바뀌면 버전만 올려서
+이전 캐시 항목을 한 번에 무효화하는 방식.
+(항목을 하나씩 찾아 지울 필요가 없어 LocMem/File/Redis 어떤 백엔드든 동일하게 동작)
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.response import Response
+
+
+def _initial_version():
+    # 버전 키가 evict 되었다가 다시 생성되어도 예전 버전 번호를 재사용하지 않도록 시간 기반으로 시작
+    return time.time_ns()
+
+
+def get_versions(keys):
+    """버전 키 목록의 현재 값을 return (없으면 새로 생성)"""
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _initial_version(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+async def aget_versions(keys):
+    """get_versions()의 async 버전"""
+    versions = await cache.aget_many(keys)
+    for key in keys:
+        if key not in versions:
+            await cache.aadd(key, _initial_version(), timeout=None)
+            versions[key] = await cache.aget(key)
+    return [versions[key] for key in keys]
+
+
+def bump_versions(*keys):
+    """버전을 올려 해당 버전을 포함한 모든 캐시 항목을 무효화"""
+    _bump(keys)
+    # 트랜잭션 안에서 호출되면 커밋 전에 다른 요청이 이전 데이터를 새 버전으로
+    # 캐싱할 수 있으므로 커밋 후에 한 번 더 올림
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _bump(keys))
+
+
+def _bump(keys):
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # 키가 없으면 새 버전으로 생성
+            cache.set(key, _initial_version(), timeout=None)
+
+
+class CachedResponseMixin:
+    """
+    ViewSet의 읽기 action 응답(response.data)을 버전 키와 함께 캐싱하는 mixin
+
+    - response_cache_actions: 캐싱할 action 목록
+    - get_response_cache_versions(): 응답이 의존하는 버전 키 목록을 return (각 ViewSet에서 구현)
+    - response_validator: 본문이 의존하는 validator(ETag). ConditionalGetMixin이 설정하며,
+      키에 포함되므로 버전을 올리지 않은 변경(다른 워커의 쓰기 등)도 이전 본문을 재사용하지 않음
+    """
+
+    response_cache_actions = ("list", "retrieve")
+    response_validator = None
+
+    def get_response_cache_versions(self):
+        raise NotImplementedError
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
+
+    def _cached_response(self, handler, request, *args, **kwargs):
+        if (
+            not settings.RESPONSE_CACHE_ENABLED
+            or self.action not in self.response_cache_actions
+        ):
+            return handler(request, *args, **kwargs)
+
+        key = self._response_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            response = Response(data)
+            response["X-Cache"] = "HIT"
+            return response
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, timeout=settings.RESPONSE_CACHE_TIMEOUT)
+            response["X-Cache"] = "MISS"
+        return response
+
+    def _response_cache_key(self, request):
+        version_keys = self.get_response_cache_versions()
+        versions = get_versions(version_keys)
+        # 페이지네이션 링크가 절대 URL이므로 host까지 포함
+        raw = f"{request.get_host()}{request.get_full_path()}"
+        if self.response_validator:
+            raw = f"{raw}:{self.response_validator}"
+        digest = hashlib.md5(raw.encode("utf-8")).hexdigest()
+        version_part = ".".join(str(version) for version in versions)
+        return f"response:{type(self).__name__}:{self.action}:{version_part}:{digest}"
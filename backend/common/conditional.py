@@ -0,0 +1,87 @@
+"""
+조건부 GET(ETag / Last-Modified) 처리
+
+응답 본문을 만들기 전에 MAX(updated_at)과 COUNT(*)만 조회해서 validator를 계산하고,
+클라이언트가 가진 버전과 같으면 serializer를 거치지 않고 바로 304를 return.
+"""
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+class ConditionalGetMixin:
+    """
+    ViewSet의 읽기 action에 ETag / Last-Modified를 붙이는 mixin
+
+    - conditional_actions: 조건부 GET을 적용할 action 목록
+    - get_conditional_queryset(): validator를 계산할 queryset (필요하면 override)
+    """
+
+    conditional_actions = ("list", "retrieve")
+
+    def get_conditional_queryset(self):
+        if self.action == "list":
+            return self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return self.get_queryset().filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional_response(super().retrieve, request, *args, **kwargs)
+
+    def _conditional_response(self, handler, request, *args, **kwargs):
+        if self.action not in self.conditional_actions:
+            return handler(request, *args, **kwargs)
+
+        etag, last_modified = self.get_validators(request)
+        if etag is None:
+            return handler(request, *args, **kwargs)
+
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if not_modified is not None:
+            return not_modified
+
+        # 응답 캐시(CachedResponseMixin) 키에 ETag를 넣어 본문과 ETag가 같은 데이터 기준이 되도록 함
+        self.response_validator = etag
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def get_validators(self, request):
+        """(ETag, Last-Modified timestamp)를 쿼리 한 번으로 계산"""
+        summary = (
+            self.get_conditional_queryset()
+            .order_by()
+            .aggregate(last_modified=Max("updated_at"), count=Count("pk"))
+        )
+        modified_at = summary["last_modified"]
+        if modified_at is None and self.action != "list":
+            # 대상이 없으면(404 등) 기본 처리에 맡김
+            return None, None
+
+        # 같은 데이터라도 URL(페이지, 필드 선택 등)과 응답 형식이 다르면 본문이 달라짐
+        raw = ":".join(
+            [
+                request.get_host(),
+                request.get_full_path(),
+                request.META.get("HTTP_ACCEPT", ""),
+                str(summary["count"]),
+                modified_at.isoformat() if modified_at else "",
+            ]
+        )
+        etag = f'W/"{hashlib.md5(raw.encode("utf-8")).hexdigest()}"'
+        # 빈 목록은 Last-Modified 없이 ETag만 사용
+        last_modified = int(modified_at.timestamp()) if modified_at else None
+        return etag, last_modified
@@ -0,0 +1,86 @@
+"""
+?fields= / ?expand= 로 응답 필드를 고르는 sparse fieldset
+
+    GET /api/v1/campsites/?fields=id,name,thumbnail_url
+    GET /api/v1/campsites/?expand=amenities,images
+
+- fields: 지정한 최상위 필드만 응답 (모르는 이름은 무시)
+- expand: serializer의 Meta.expandable_fields에 정의된 연관 필드를 추가하거나
+  기본 표현(예: username)을 중첩 객체로 교체. fields와 함께 쓰면 expand한 필드도 포함됨.
+
+view는 serializer가 실제로 내보낼 필드 이름(get_response_fields())을 보고
+필요한 JOIN/prefetch만 걸고 응답에 없는 컬럼은 defer 하도록 queryset을 구성함.
+"""
+
+from rest_framework import serializers
+
+FIELDS_PARAM = "fields"
+EXPAND_PARAM = "expand"
+
+
+def parse_names(value):
+    """'a, b,,c' -> {"a", "b", "c"} (값이 없으면 None)"""
+    if not value:
+        return None
+    names = {name.strip() for name in value.split(",")}
+    names.discard("")
+    return names or None
+
+
+class DynamicFieldsMixin:
+    """
+    serializer context의 fields/expand에 맞춰 필드를 고르는 serializer mixin
+
+    class Meta:
+        expandable_fields = {"amenities": (AmenitySerializer, {"many": True})}
+
+    중첩 serializer는 같은 context를 공유하므로 최상위 serializer에만 적용됨.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self._is_response_root():
+            return fields
+
+        requested = self.context.get(FIELDS_PARAM)
+        expand = self.context.get(EXPAND_PARAM) or set()
+        expandable = getattr(self.Meta, "expandable_fields", {})
+        for name in expand & expandable.keys():
+            serializer_class, kwargs = expandable[name]
+            fields[name] = serializer_class(read_only=True, **kwargs)
+
+        if requested is None:
+            return fields
+        return {
+            name: field
+            for name, field in fields.items()
+            if name in requested or name in expand
+        }
+
+    def _is_response_root(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+
+class DynamicFieldsViewMixin:
+    """
+    ?fields= / ?expand= 를 serializer context로 넘기는 ViewSet mixin
+
+    - dynamic_fields_actions: 필드 선택을 허용할 action 목록 (쓰기 응답은 항상 전체 필드)
+    - get_response_fields(): 응답에 포함될 필드 이름 집합 (get_queryset에서 사용)
+    """
+
+    dynamic_fields_actions = ("list", "retrieve")
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request is not None and self.action in self.dynamic_fields_actions:
+            params = self.request.query_params
+            context[FIELDS_PARAM] = parse_names(params.get(FIELDS_PARAM))
+            context[EXPAND_PARAM] = parse_names(params.get(EXPAND_PARAM)) or set()
+        return context
+
+    def get_response_fields(self):
+        return set(self.get_serializer().fields)
@@ -0,0 +1,171 @@
+"""
+대용량 내보내기 (NDJSON / CSV 스트리밍)
+
+페이지네이션 API로 전체 데이터를 받으려면 PAGE_SIZE 단위로 수많은 요청이 필요하므로
+한 번의 요청(또는 명령)으로 전체 행을 스트리밍함.
+- 행은 queryset.iterator(chunk_size)로 읽음. PostgreSQL에서는 server-side cursor로
+  chunk_size행씩 가져오므로 전체 결과를 메모리에 올리지 않음.
+- 응답은 StreamingHttpResponse로 OUTPUT_BUFFER_SIZE 단위씩 흘려보냄.
+  ASGI에서는 Django가 sync iterator를 모두 읽어 list로 만든 뒤에 보내므로
+  조각을 하나씩 스레드에서 꺼내는 async iterator로 넘김
+따라서 행 수와 관계없이 메모리 사용량이 일정함.
+"""
+
+import csv
+import itertools
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils import encoders
+from rest_framework.views import APIView
+
+from .renderers import orjson
+
+CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+CHUNK_SIZE = 2000
+OUTPUT_BUFFER_SIZE = 64 * 1024
+
+_encode_default = encoders.JSONEncoder().default
+
+
+def chunked(iterable, size):
+    """iterable을 size개씩 묶은 list로 return (연관 데이터를 묶음 단위로 조회할 때 사용)"""
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def encode(output, columns, rows):
+    """행(dict) iterator를 output 형식의 bytes 조각 iterator로 변환"""
+    if output == "csv":
+        lines = _csv_lines(columns, rows)
+    else:
+        lines = (
+            _json_line({column: row[column] for column in columns}) for row in rows
+        )
+    return _buffered(lines)
+
+
+def write(stream, output, columns, rows):
+    """binary stream(파일, stdout.buffer)에 내보내기 결과를 씀. 쓴 행 수를 return"""
+    count = 0
+
+    def counted():
+        nonlocal count
+        for row in rows:
+            count += 1
+            yield row
+
+    for chunk in encode(output, columns, counted()):
+        stream.write(chunk)
+    return count
+
+
+def streaming_response(output, columns, rows, filename, asynchronous=False):
+    """asynchronous: ASGI 요청이면 True (응답 본문을 async iterator로 보냄)"""
+    chunks = encode(output, columns, rows)
+    if asynchronous:
+        chunks = _aiterate(chunks)
+    response = StreamingHttpResponse(chunks, content_type=CONTENT_TYPES[output])
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{output}"'
+    return response
+
+
+async def _aiterate(chunks):
+    # 행을 읽는 DB 연결(server-side cursor)을 요청의 다른 쿼리와 같은 스레드에서 쓰도록
+    # thread_sensitive로 실행. 클라이언트가 연결을 끊어도 cursor를 닫음
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        await sync_to_async(chunks.close, thread_sensitive=True)()
+
+
+def _json_line(row):
+    if orjson is not None:
+        return orjson.dumps(row, default=_encode_default) + b"\n"
+    line = json.dumps(row, cls=encoders.JSONEncoder, ensure_ascii=False)
+    return line.encode("utf-8") + b"\n"
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 return 하는 가짜 파일"""
+
+    def write(self, value):
+        return value
+
+
+def _csv_lines(columns, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns).encode("utf-8")
+    for row in rows:
+        line = writer.writerow([_csv_value(row[column]) for column in columns])
+        yield line.encode("utf-8")
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        # 이미지/편의시설 목록은 JSON 배열 문자열로 한 칸에 담음
+        return json.dumps(value, ensure_ascii=False)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def _buffered(lines):
+    buffer, size = [], 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= OUTPUT_BUFFER_SIZE:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+class ExportView(APIView):
+    """
+    관리자 전용 스트리밍 내보내기 view
+
+    GET ?format=ndjson (기본) | csv
+    - export_name: 내려받을 파일 이름
+    - columns: 내보낼 열 (순서대로)
+    - get_rows(): 행(dict) iterator. chunk_size 단위로 읽어야 함
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+    export_name = None
+    columns = ()
+    chunk_size = CHUNK_SIZE
+
+    def perform_content_negotiation(self, request, force=False):
+        # ?format=csv 처럼 DRF renderer가 없는 형식도 받기 위함 (오류 응답은 기본 renderer 사용)
+        return super().perform_content_negotiation(request, force=True)
+
+    def get_rows(self):
+        raise NotImplementedError
+
+    def get(self, request):
+        output = request.query_params.get("format", "ndjson")
+        if output not in CONTENT_TYPES:
+            raise ValidationError(
+                {"format": f"지원하는 형식: {', '.join(CONTENT_TYPES)}"}
+            )
+        return streaming_response(
+            output,
+            self.columns,
+            self.get_rows(),
+            self.export_name,
+            asynchronous=isinstance(request._request, ASGIRequest),
+        )
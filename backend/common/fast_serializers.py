@@ -0,0 +1,195 @@
+"""
+.values() 행으로 목록 응답을 만드는 읽기 전용 직렬화 fast path
+
+쿼리 수를 고정한 뒤에는 ModelSerializer가 행마다 모델 인스턴스를 만들고
+필드마다 get_attribute/to_representation을 거치는 비용이 응답 시간의 대부분을 차지함.
+serializer의 필드 구성을 요청마다 한 번만 분석해 (필드 이름, 값 계산 함수) 목록으로
+컴파일하고 queryset.values() dict에서 바로 응답을 만듦.
+값 변환은 각 필드의 to_representation을 그대로 쓰거나 같은 규칙으로 미리 컴파일하므로
+기존 serializer와 바이트 단위로 같은 JSON이 나옴.
+
+지원하지 않는 필드(중첩 serializer, 관계 필드, 계산 방법이 없는 source="*")가 있으면
+compile_values_plan()이 None을 return 하고 view는 기존 serializer로 처리함.
+"""
+
+from operator import itemgetter, methodcaller
+
+from rest_framework import ISO_8601, serializers
+from rest_framework.fields import empty
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+# DB에서 읽은 값이 이미 응답 형태라 to_representation을 생략해도 되는 필드
+_PASSTHROUGH_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.ReadOnlyField,
+)
+
+
+def queryset_columns(queryset):
+    """queryset.values()로 읽을 수 있는 모델 필드/annotation 이름"""
+    names = set(queryset.query.annotations)
+    for field in queryset.model._meta.concrete_fields:
+        names.update((field.name, field.attname))
+    return names
+
+
+class ValuesPlan:
+    """컴파일된 fast path: columns를 .values()로 읽어 render(rows)로 응답 목록을 만듦"""
+
+    def __init__(self, columns, steps):
+        self.columns = columns
+        self.steps = steps
+
+    def render(self, rows):
+        steps = self.steps
+        return [{name: getter(row) for name, getter in steps} for row in rows]
+
+
+def _column_getter(field, column):
+    if type(field) in _PASSTHROUGH_FIELDS:
+        return itemgetter(column)
+
+    to_representation = _converter(field)
+
+    def getter(row):
+        value = row[column]
+        return None if value is None else to_representation(value)
+
+    return getter
+
+
+def _converter(field):
+    """
+    field.to_representation과 같은 값을 return 하는 변환 함수.
+    날짜/시간 필드는 값마다 반복하던 출력 형식/현재 시간대 조회를 컴파일 시점에 한 번만 수행
+    (plan은 요청마다 컴파일하므로 요청의 시간대와 같음)
+    """
+    if isinstance(field, serializers.DateTimeField):
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if hasattr(field, "timezone"):
+            timezone = field.timezone
+        else:
+            timezone = field.default_timezone()
+        if output_format and output_format.lower() == ISO_8601 and timezone:
+
+            def convert(value):
+                if value.tzinfo is None:
+                    return field.to_representation(value)
+                value = value.astimezone(timezone).isoformat()
+                if value.endswith("+00:00"):
+                    value = value[:-6] + "Z"
+                return value
+
+            return convert
+    elif isinstance(field, serializers.DateField):
+        output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+        if output_format and output_format.lower() == ISO_8601:
+            return methodcaller("isoformat")
+    return field.to_representation
+
+
+def _constant(value):
+    return lambda row: value
+
+
+class ValuesSerializerMixin:
+    """
+    .values() fast path를 지원하는 serializer mixin
+
+    class Meta:
+        # 모델 컬럼이 아닌 필드와 계산에 쓰는 컬럼. 값은 values_<필드>(row) 메서드로 계산
+        values_fields = {"thumbnail_url": ("thumbnail_cloudflare_id",)}
+
+    values_<필드>(row)는 같은 필드의 인스턴스 기반 계산과 같은 값을 return 해야 함.
+    queryset에 없는 컬럼(annotate 하지 않은 경우 등)은 row에 포함되지 않음.
+    """
+
+    def compile_values_plan(self, available):
+        """
+        available: queryset에서 읽을 수 있는 컬럼 이름 (queryset_columns())
+        return: ValuesPlan 또는 None (fast path로 만들 수 없는 필드 구성)
+        """
+        computed = getattr(self.Meta, "values_fields", {})
+        columns, steps = [], []
+        for name, field in self.fields.items():
+            if field.write_only:
+                continue
+            if name in computed:
+                columns.extend(
+                    column for column in computed[name] if column in available
+                )
+                steps.append((name, getattr(self, f"values_{name}")))
+                continue
+            if (
+                isinstance(
+                    field,
+                    (
+                        serializers.BaseSerializer,
+                        serializers.RelatedField,
+                        serializers.ManyRelatedField,
+                    ),
+                )
+                or field.source == "*"
+            ):
+                return None
+
+            if field.source_attrs[0] in available:
+                column = "__".join(field.source_attrs)
+                columns.append(column)
+                steps.append((name, _column_getter(field, column)))
+            # 값이 없을 때의 처리는 Field.get_attribute와 동일
+            elif field.default is not empty:
+                steps.append((name, _constant(field.get_default())))
+            elif field.allow_null:
+                steps.append((name, _constant(None)))
+            elif field.required:
+                return None
+        return ValuesPlan(list(dict.fromkeys(columns)), steps)
+
+
+class ValuesListMixin:
+    """
+    목록 응답을 .values() fast path로 만드는 ViewSet mixin
+
+    - values_list_actions: fast path를 쓸 action 목록
+    - paginated_response(queryset): 직접 만든 목록 action에서 페이지네이션 + 직렬화에 사용
+    serializer가 ValuesSerializerMixin이 아니거나 필드 구성을 지원하지 않으면 기존 경로로 처리.
+    """
+
+    values_list_actions = ("list",)
+
+    def list(self, request, *args, **kwargs):
+        return self.paginated_response(self.filter_queryset(self.get_queryset()))
+
+    def paginated_response(self, queryset):
+        plan = self.get_values_plan(queryset)
+        if plan is None:
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return self.get_paginated_response(serializer.data)
+            return Response(self.get_serializer(queryset, many=True).data)
+
+        rows = queryset.values(*plan.columns, *self._pagination_columns(plan))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(plan.render(page))
+        return Response(plan.render(rows))
+
+    def get_values_plan(self, queryset):
+        if self.action not in self.values_list_actions:
+            return None
+        serializer = self.get_serializer()
+        if not isinstance(serializer, ValuesSerializerMixin):
+            return None
+        return serializer.compile_values_plan(queryset_columns(queryset))
+
+    def _pagination_columns(self, plan):
+        # keyset 커서는 마지막 행의 정렬 키를 읽으므로 응답에 없는 필드여도 함께 조회
+        ordering = getattr(self.paginator, "ordering", None) or ()
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+        names = (name.lstrip("-") for name in ordering)
+        return [name for name in names if name not in plan.columns]
@@ -0,0 +1,163 @@
+"""
+대용량 가져오기 (NDJSON / CSV 스트리밍 읽기 + 대량 INSERT)
+
+common.export와 같은 형식을 읽음. CSV의 목록/객체 칸은 JSON 문자열.
+- read_records(): 입력을 한 줄(행)씩 읽으므로 파일 크기와 관계없이 메모리 사용량이 일정함
+- bulk_insert(): PostgreSQL(psycopg2)에서는 COPY FROM STDIN, 그 외에는 bulk_create.
+  COPY는 INSERT 문을 만들고 파싱하는 비용이 없어 행 수가 많은 테이블에서 훨씬 빠르지만
+  생성된 pk를 돌려주지 않으므로 pk가 필요 없는 행(자식 테이블)에만 사용
+- insert_rows(): 모델 인스턴스 없이 값 tuple을 바로 저장 (COPY 또는 executemany).
+  행마다 모델 인스턴스를 만들고 INSERT 문을 조립하는 ORM 비용을 없앰
+"""
+
+import csv
+import hashlib
+import io
+import json
+
+from django.db import connections, router
+
+from .export import CONTENT_TYPES
+from .renderers import orjson
+
+FORMATS = tuple(CONTENT_TYPES)
+BATCH_SIZE = 1000
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def detect_format(filename, default="ndjson"):
+    """파일 확장자로 형식을 추정 (.csv -> csv, 그 외 default)"""
+    extension = str(filename).rsplit(".", 1)[-1].lower()
+    return extension if extension in FORMATS else default
+
+
+def checksum(stream):
+    """binary stream 내용의 sha256 (읽은 뒤 처음 위치로 되돌림)"""
+    digest = hashlib.sha256()
+    while block := stream.read(_HASH_CHUNK_SIZE):
+        digest.update(block)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def read_records(stream, input_format, json_columns=()):
+    """
+    binary stream에서 (줄 번호, 행 dict, 오류) 를 하나씩 return
+    - 읽을 수 없는 줄은 행 대신 오류 메시지를 돌려주고 다음 줄을 계속 읽음
+    - CSV의 빈 칸은 값이 없는 것으로 보고 제외, json_columns 칸은 JSON으로 해석
+    """
+    if input_format == "csv":
+        return _csv_records(stream, json_columns)
+    return _ndjson_records(stream)
+
+
+def _ndjson_records(stream):
+    loads = orjson.loads if orjson is not None else json.loads
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = loads(line)
+        except ValueError as exc:
+            yield number, None, f"JSON 형식 오류: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield number, None, "각 줄은 JSON 객체여야 합니다."
+            continue
+        yield number, record, None
+
+
+def _csv_records(stream, json_columns):
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text)
+    # 1번 줄은 헤더
+    for number, row in enumerate(reader, start=2):
+        record = {key: value for key, value in row.items() if key and value != ""}
+        try:
+            for column in json_columns:
+                if column in record:
+                    record[column] = json.loads(record[column])
+        except ValueError as exc:
+            yield number, None, f"{column} 칸의 JSON 형식 오류: {exc}"
+            continue
+        yield number, record, None
+    # 호출한 쪽에서 원래 stream을 계속 다룰 수 있도록 wrapper가 닫지 않게 분리
+    text.detach()
+
+
+def bulk_insert(model, objs, batch_size=BATCH_SIZE):
+    """모델 인스턴스 목록을 한 번에 저장 (pk는 채워지지 않음). 저장한 행 수를 return"""
+    if not objs:
+        return 0
+    connection = connections[router.db_for_write(model)]
+    if _can_copy(connection):
+        fields = [
+            field for field in model._meta.concrete_fields if not field.primary_key
+        ]
+        rows = (
+            [
+                field.get_db_prep_save(field.pre_save(obj, True), connection)
+                for field in fields
+            ]
+            for obj in objs
+        )
+        _copy(connection, model, [field.column for field in fields], rows)
+    else:
+        model.objects.bulk_create(objs, batch_size=batch_size)
+    return len(objs)
+
+
+def insert_rows(model, columns, rows):
+    """
+    값 tuple 목록을 모델 인스턴스를 만들지 않고 바로 저장 (행 수가 아주 많은 파생 테이블용)
+    값은 DB 드라이버가 그대로 받는 타입(int, str, date, Decimal 등)이어야 하며
+    save()/bulk_create와 달리 auto_now 같은 필드 기본값은 채워지지 않음
+    """
+    if not rows:
+        return 0
+    connection = connections[router.db_for_write(model)]
+    if _can_copy(connection):
+        _copy(connection, model, columns, rows)
+        return len(rows)
+    quote = connection.ops.quote_name
+    sql = "INSERT INTO {} ({}) VALUES ({})".format(
+        quote(model._meta.db_table),
+        ", ".join(quote(column) for column in columns),
+        ", ".join(["%s"] * len(columns)),
+    )
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
+    return len(rows)
+
+
+def _can_copy(connection):
+    # psycopg2 cursor에만 copy_expert가 있음 (psycopg 3는 bulk_create/executemany 사용)
+    return (
+        connection.vendor == "postgresql" and connection.Database.__name__ == "psycopg2"
+    )
+
+
+def _copy(connection, model, columns, rows):
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_value(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    quote = connection.ops.quote_name
+    sql = "COPY {} ({}) FROM STDIN".format(
+        quote(model._meta.db_table), ", ".join(quote(column) for column in columns)
+    )
+    with connection.cursor() as cursor:
+        cursor.cursor.copy_expert(sql, buffer)
+
+
+# COPY text 형식에서 특별한 의미가 있는 문자
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return str(value).translate(_COPY_ESCAPES)
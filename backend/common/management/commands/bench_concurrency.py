@@ -0,0 +1,170 @@
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+
+from campsites.cloudflare_stub import CloudflareStub
+
+# gunicorn 실행 인자 (Dockerfile과 같은 구성)
+SERVERS = {
+    "wsgi": ["config.wsgi:application"],
+    "asgi": [
+        "--worker-class",
+        "uvicorn_worker.UvicornWorker",
+        "config.asgi:application",
+    ],
+}
+UPLOAD_URL_PATH = "/api/v1/campsites/images/upload-url/"
+BENCH_EMAIL = "bench-concurrency@example.com"
+
+
+class Command(BaseCommand):
+    help = (
+        "업로드 URL 발급 API의 동시 요청 처리량 비교 "
+        "(gunicorn sync 워커 + config.wsgi vs UvicornWorker + config.asgi). "
+        "Cloudflare 대신 응답을 --delay초 늦게 주는 로컬 stub을 사용하고, "
+        "풀을 끄고 요청마다 발급하게 해서 느린 외부 API 호출을 재현함"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=2, help="워커 수 (기본 2)")
+        parser.add_argument(
+            "--requests", type=int, default=400, help="서버마다 보낼 요청 수"
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=50, help="동시에 보내는 요청 수"
+        )
+        parser.add_argument(
+            "--delay", type=float, default=0.1, help="stub의 발급 응답 지연(초)"
+        )
+        parser.add_argument(
+            "--servers",
+            default=",".join(SERVERS),
+            help="비교할 서버 (쉼표로 구분, 기본 wsgi,asgi)",
+        )
+
+    def handle(self, *args, **options):
+        names = [name.strip() for name in options["servers"].split(",")]
+        unknown = set(names) - SERVERS.keys()
+        if unknown:
+            raise CommandError(f"알 수 없는 서버: {', '.join(sorted(unknown))}")
+
+        User = get_user_model()
+        User.objects.filter(email=BENCH_EMAIL).delete()
+        user = User.objects.create_user(email=BENCH_EMAIL)
+        token = str(AccessToken.for_user(user))
+        results = {}
+        try:
+            with CloudflareStub(delay=options["delay"]) as stub:
+                for name in names:
+                    results[name] = self._bench(name, stub, token, options)
+        finally:
+            user.delete()
+
+        if "wsgi" in results and "asgi" in results:
+            self.stdout.write(
+                f"ASGI 처리량: WSGI의 {results['asgi'] / results['wsgi']:.1f}배"
+            )
+
+    def _bench(self, name, stub, token, options):
+        port = _free_port()
+        env = dict(
+            os.environ,
+            CLOUDFLARE_API_URL=stub.api_url,
+            CLOUDFLARE_ACCOUNT_ID="bench",
+            CLOUDFLARE_API_TOKEN="bench",
+            CLOUDFLARE_UPLOAD_URL_POOL_SIZE="0",
+            CLOUDFLARE_UPLOAD_URL_QUOTA=str(options["requests"] * 2),
+            DJANGO_ALLOWED_HOSTS="127.0.0.1",
+        )
+        command = [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "--bind",
+            f"127.0.0.1:{port}",
+            "--workers",
+            str(options["workers"]),
+            *SERVERS[name],
+        ]
+        process = subprocess.Popen(
+            command,
+            cwd=settings.BASE_DIR,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            _wait_ready(f"{base_url}/healthz/ready/", process)
+            url = base_url + UPLOAD_URL_PATH
+            # 워커마다 첫 요청의 초기화 비용은 빼고 측정
+            _load(url, token, options["workers"] * 2, options["workers"])
+            latencies, failures, elapsed = _load(
+                url, token, options["requests"], options["concurrency"]
+            )
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+        throughput = len(latencies) / elapsed
+        quantiles = statistics.quantiles(latencies, n=20)
+        self.stdout.write(
+            f"{name}: {len(latencies)}건 {elapsed:.2f}s, {throughput:.1f} req/s, "
+            f"p50 {quantiles[9] * 1000:.0f}ms, p95 {quantiles[18] * 1000:.0f}ms, "
+            f"실패 {failures}건"
+        )
+        return throughput
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(url, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise CommandError(f"서버가 종료되었습니다 (exit {process.returncode}).")
+        try:
+            if requests.get(url, timeout=1).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise CommandError(f"{timeout}초 안에 서버가 준비되지 않았습니다.")
+
+
+def _load(url, token, total, concurrency):
+    """
+    total개의 요청을 concurrency개씩 동시에 보내서 (응답 시간 목록, 실패 수, 경과 시간)을 return
+    """
+    local = threading.local()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def send(_):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        started = time.perf_counter()
+        response = local.session.post(url, headers=headers, timeout=60)
+        return time.perf_counter() - started, response.status_code == 200
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(send, range(total)))
+    elapsed = time.perf_counter() - started
+    latencies = [latency for latency, _ in outcomes]
+    failures = sum(1 for _, ok in outcomes if not ok)
+    return latencies, failures, elapsed
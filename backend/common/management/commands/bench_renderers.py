@@ -0,0 +1,81 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from campsites import models as campsite_models
+from campsites import serializers as campsite_serializers
+from campsites.sample_data import seed_catalogue
+from common import renderers
+
+
+class Command(BaseCommand):
+    help = (
+        "캠핑장 목록 응답 본문 생성 시간/크기 비교 "
+        "(DRF JSONRenderer vs ORJSONRenderer vs MessagePackRenderer)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=100, help="응답에 담을 캠핑장 수 (기본 100)"
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=50, help="반복 횟수 (가장 빠른 값을 사용)"
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="지정한 수만큼 임시 캠핑장을 만들어 측정 (측정 후 롤백)",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            try:
+                if options["seed"]:
+                    owner = get_user_model().objects.create_user(
+                        email="bench-owner@example.com", username="bench-owner"
+                    )
+                    seed_catalogue(owner, campsites=options["seed"], reviews=0)
+                data = self._page_data(options["rows"])
+            finally:
+                transaction.set_rollback(True)
+
+        candidates = [("DRF JSONRenderer", JSONRenderer())]
+        if renderers.orjson is not None:
+            candidates.append(("ORJSONRenderer", renderers.ORJSONRenderer()))
+        if renderers.msgpack is not None:
+            candidates.append(("MessagePackRenderer", renderers.MessagePackRenderer()))
+
+        baseline = None
+        for name, renderer in candidates:
+            body = renderer.render(data)
+            elapsed = _best_ms(lambda: renderer.render(data), options["repeat"])
+            baseline = baseline or elapsed
+            self.stdout.write(
+                f"{name}: {elapsed:.3f}ms ({baseline / elapsed:.1f}배), {len(body):,} bytes"
+            )
+
+    def _page_data(self, rows):
+        queryset = campsite_models.Campsite.objects.with_thumbnail()[:rows]
+        results = campsite_serializers.CampsiteListSerializer(queryset, many=True).data
+        if not results:
+            raise CommandError("측정할 데이터가 없습니다. --seed 옵션을 사용하세요.")
+        # 페이지네이션 응답과 같은 형태
+        return {
+            "count": len(results),
+            "next": None,
+            "previous": None,
+            "results": results,
+        }
+
+
+def _best_ms(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
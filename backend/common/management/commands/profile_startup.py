@@ -0,0 +1,179 @@
+import collections
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 프로파일 대상: 새 인터프리터에서 실행할 인자
+TARGETS = {
+    "manage": ["manage.py", "check"],
+    "wsgi": ["-c", "import config.wsgi"],
+}
+# 첫 요청까지의 시간 측정: config.wsgi를 import하고 application을 바로 호출
+FIRST_REQUEST = """
+import io, sys, time
+started = time.perf_counter()
+from config.wsgi import application
+imported = time.perf_counter()
+environ = {
+    "REQUEST_METHOD": "GET", "PATH_INFO": sys.argv[1], "QUERY_STRING": "",
+    "SERVER_NAME": "127.0.0.1", "SERVER_PORT": "80", "SERVER_PROTOCOL": "HTTP/1.1",
+    "wsgi.url_scheme": "http", "wsgi.input": io.BytesIO(), "wsgi.errors": sys.stderr,
+    "wsgi.multithread": False, "wsgi.multiprocess": True, "wsgi.run_once": False,
+}
+statuses = []
+response = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+b"".join(response)
+response.close()
+done = time.perf_counter()
+print(statuses[0].split()[0], imported - started, done - imported)
+"""
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+class Command(BaseCommand):
+    help = (
+        "시작 시간 프로파일: 새 인터프리터에서 manage.py check, config.wsgi import의 "
+        "모듈별 import 시간(python -X importtime)과 첫 요청까지의 시간을 측정"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--targets",
+            default=",".join(TARGETS),
+            help="import 시간을 잴 대상 (쉼표로 구분, 기본 manage,wsgi)",
+        )
+        parser.add_argument(
+            "--top", type=int, default=15, help="출력할 모듈/패키지 수 (기본 15)"
+        )
+        parser.add_argument(
+            "--path", default="/healthz/ready/", help="첫 요청으로 보낼 경로"
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="첫 요청 측정 횟수 (중앙값 출력, 0이면 측정하지 않음)",
+        )
+
+    def handle(self, *args, **options):
+        names = [name.strip() for name in options["targets"].split(",") if name]
+        unknown = set(names) - TARGETS.keys()
+        if unknown:
+            raise CommandError(f"알 수 없는 대상: {', '.join(sorted(unknown))}")
+
+        for name in names:
+            process, _ = _run(["-X", "importtime", *TARGETS[name]])
+            self._report(name, parse_importtime(process.stderr), options["top"])
+        if options["repeat"] > 0:
+            self._first_request(options["path"], options["repeat"])
+
+    def _report(self, name, modules, top):
+        total = sum(module.self_us for module in modules)
+        self.stdout.write(
+            f"== {name}: 모듈 {len(modules)}개, import {total / 1000:.1f}ms"
+        )
+        self.stdout.write("-- 패키지별 (self 합계, 처음 import한 모듈)")
+        for package, (self_us, via) in list(by_package(modules).items())[:top]:
+            self.stdout.write(f"{self_us / 1000:8.1f}ms  {package}  <- {via}")
+        self.stdout.write("-- 모듈별 (cumulative)")
+        for module in sorted(modules, key=lambda m: -m.cumulative_us)[:top]:
+            self.stdout.write(
+                f"{module.cumulative_us / 1000:8.1f}ms  {module.name}"
+                f"  (self {module.self_us / 1000:.1f}ms)"
+            )
+
+    def _first_request(self, path, repeat):
+        imports, requests, totals = [], [], []
+        for _ in range(repeat):
+            process, elapsed = _run(["-c", FIRST_REQUEST, path])
+            status, imported, handled = process.stdout.split()[-3:]
+            if not status.startswith(("2", "3")):
+                raise CommandError(f"{path} 응답 {status}")
+            imports.append(float(imported))
+            requests.append(float(handled))
+            totals.append(elapsed)
+        self.stdout.write(
+            f"== 첫 요청 {path} ({repeat}회 중앙값): "
+            f"프로세스 시작부터 응답까지 {statistics.median(totals) * 1000:.0f}ms "
+            f"(config.wsgi import {statistics.median(imports) * 1000:.0f}ms, "
+            f"첫 요청 처리 {statistics.median(requests) * 1000:.0f}ms)"
+        )
+
+
+Module = collections.namedtuple("Module", "name self_us cumulative_us importer")
+
+
+def parse_importtime(output):
+    """
+    python -X importtime의 stderr를 Module 목록으로 만듦
+    importer는 그 모듈을 처음 import한 모듈 (최상위면 None)
+    """
+    modules = []
+    # 하위 모듈이 먼저 출력되므로, 들여쓰기 단계별로 아직 부모가 정해지지 않은 모듈을 모아 둠
+    pending = collections.defaultdict(list)
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = len(indent) // 2
+        index = len(modules)
+        modules.append(Module(name, int(self_us), int(cumulative_us), None))
+        for child in pending.pop(depth + 1, []):
+            modules[child] = modules[child]._replace(importer=name)
+        pending[depth].append(index)
+    return modules
+
+
+def by_package(modules):
+    """
+    최상위 패키지별 {패키지: (self 합계, 패키지 밖에서 처음 import한 모듈)}
+    self 합계가 큰 순서. django.contrib.* 앱은 따로 셈
+    """
+    totals = collections.Counter()
+    via = {}
+    for module in modules:
+        package = _package(module.name)
+        totals[package] += module.self_us
+        if module.importer and _package(module.importer) != package:
+            via.setdefault(package, module.importer)
+    return {
+        package: (self_us, via.get(package, "-"))
+        for package, self_us in totals.most_common()
+    }
+
+
+def _package(name):
+    parts = name.split(".")
+    if parts[:2] == ["django", "contrib"]:
+        return ".".join(parts[:3])
+    return parts[0]
+
+
+def _run(args):
+    # 이 프로세스에서 이미 import한 모듈의 영향을 받지 않도록 새 인터프리터에서 실행
+    env = dict(
+        os.environ,
+        DJANGO_SETTINGS_MODULE="config.settings",
+        DJANGO_ALLOWED_HOSTS="127.0.0.1",
+    )
+    started = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, *args],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - started
+    if process.returncode != 0:
+        raise CommandError(
+            f"{' '.join(args[:3])} 실패 (exit {process.returncode})\n{process.stderr[-2000:]}"
+        )
+    return process, elapsed
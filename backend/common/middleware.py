@@ -0,0 +1,38 @@
+"""
+ASGI에서도 async로 동작하는 middleware
+
+Django는 middleware 중 하나라도 sync 전용이면 ASGI 요청을 그 지점에서 스레드로 넘기고,
+그 스레드는 안쪽의 async view가 끝날 때까지 묶여 있음 (async view의 이점이 사라짐)
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from whitenoise import middleware as whitenoise_middleware
+
+
+class WhiteNoiseMiddleware(whitenoise_middleware.WhiteNoiseMiddleware):
+    """
+    sync/async 모두 지원하는 WhiteNoiseMiddleware
+    정적 파일 목록은 시작할 때 메모리(dict)에 올려 두므로 조회는 async에서도 그대로 함
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
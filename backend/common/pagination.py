@@ -0,0 +1,163 @@
+import base64
+import binascii
+import json
+
+from django.core import exceptions
+from django.db.models import Q
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(pagination.BasePagination):
+    """
+    (정렬 키, id) 조합을 커서로 사용하는 keyset 페이지네이션
+
+    PageNumberPagination은 매 페이지마다 COUNT(*)와 OFFSET 스캔을 수행하므로
+    뒤쪽 페이지일수록 느려짐. keyset 방식은 마지막으로 본 행의 키 이후만
+    인덱스로 읽기 때문에 몇 번째 페이지든 첫 페이지와 같은 비용이 듦.
+
+    - ordering: (정렬 키, 타이브레이커) 두 필드. 둘 다 같은 방향이어야 함.
+    - 커서는 {"k": 정렬 키, "i": id, "r": 역방향 여부}를 base64로 인코딩한 불투명 문자열.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = api_settings.PAGE_SIZE
+    ordering = ("-created_at", "-id")
+    invalid_cursor_message = "잘못된 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+
+        key_field, pk_field = (name.lstrip("-") for name in self.ordering)
+        descending = self.ordering[0].startswith("-")
+
+        cursor = self.decode_cursor(request, queryset)
+        if cursor is None:
+            key, pk, reverse = None, None, False
+        else:
+            key, pk, reverse = cursor
+
+        # 역방향(이전 페이지)이면 정렬을 뒤집어서 읽은 뒤 다시 뒤집음
+        forward_desc = descending != reverse
+        if forward_desc:
+            order_by = [f"-{key_field}", f"-{pk_field}"]
+        else:
+            order_by = [key_field, pk_field]
+        queryset = queryset.order_by(*order_by)
+
+        if cursor is not None:
+            # key <= k AND (key < k OR id < i) 형태로 작성해야
+            # 첫 번째 조건으로 복합 인덱스 범위 스캔을 탈 수 있음
+            lookup = "lt" if forward_desc else "gt"
+            queryset = queryset.filter(**{f"{key_field}__{lookup}e": key}).filter(
+                Q(**{f"{key_field}__{lookup}": key})
+                | Q(**{f"{pk_field}__{lookup}": pk})
+            )
+
+        # page_size + 1개를 읽어 다음 페이지 존재 여부를 판단
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+
+        if reverse:
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = results
+        self.key_field = key_field
+        self.pk_field = pk_field
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, item, reverse):
+        payload = {
+            "k": self._get_value(item, self.key_field),
+            "i": self._get_value(item, self.pk_field),
+            "r": reverse,
+        }
+        # DjangoJSONEncoder는 datetime을 밀리초로 자르므로 isoformat을 그대로 사용
+        raw = json.dumps(payload, default=_isoformat, separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request, queryset):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode("ascii")).decode("utf-8")
+            payload = json.loads(raw)
+            key_field, pk_field = (name.lstrip("-") for name in self.ordering)
+            opts = queryset.model._meta
+            key = opts.get_field(key_field).to_python(payload["k"])
+            pk = opts.get_field(pk_field).to_python(payload["i"])
+            reverse = bool(payload.get("r", False))
+        except (
+            TypeError,
+            ValueError,
+            KeyError,
+            binascii.Error,
+            UnicodeError,
+            exceptions.ValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        if key is None or pk is None:
+            raise NotFound(self.invalid_cursor_message)
+        return key, pk, reverse
+
+    @staticmethod
+    def _get_value(item, name):
+        # 모델 인스턴스와 .values() dict 모두 지원
+        if isinstance(item, dict):
+            return item[name]
+        return getattr(item, name)
+
+
+def _isoformat(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} 값은 커서로 인코딩할 수 없습니다.")
@@ -0,0 +1,35 @@
+"""
+빠른 JSON(orjson) / MessagePack 요청 parser (common.renderers와 짝)
+"""
+
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from .renderers import MSGPACK_MEDIA_TYPE, msgpack, orjson
+
+
+class ORJSONParser(parsers.JSONParser):
+    """orjson으로 JSON 요청 본문을 읽음 (orjson이 없으면 DRF JSONParser)"""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        # orjson은 UTF-8만 읽으므로 다른 charset이 지정되면 DRF JSONParser로 처리
+        charset = (parser_context or {}).get("encoding") or "utf-8"
+        if charset.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class MessagePackParser(parsers.BaseParser):
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        # ExtraData/FormatError/StackError는 ValueError, dict 키 오류는 TypeError
+        except (ValueError, TypeError) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
@@ -13,4 +13,6 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
             return True
 
         # 쓰기 권한은 객체의 소유자(owner)에게만 허용
-        return obj.owner == request.user
+        # 소유자 필드 이름이 owner가 아니면 view에 owner_field로 지정 (예: Review.user)
+        owner_field = getattr(view, "owner_field", "owner")
+        return getattr(obj, owner_field) == request.user
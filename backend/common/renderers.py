@@ -0,0 +1,74 @@
+"""
+빠른 JSON(orjson) / MessagePack 응답 renderer
+
+- ORJSONRenderer: DRF JSONRenderer와 같은 출력 규칙(UTF-8 그대로, 공백 없음,
+  U+2028/U+2029 이스케이프)을 orjson으로 처리. orjson이 없거나 indent가 요청되면
+  (Browsable API 등) DRF JSONRenderer로 처리함.
+- MessagePackRenderer: Accept: application/msgpack (또는 ?format=msgpack) 요청에 응답.
+  JSON으로 표현되지 않는 값(Decimal, 날짜 등)은 JSON 응답과 같은 값으로 변환.
+
+MessagePack은 msgpack이 설치된 경우에만 REST_FRAMEWORK 설정에 등록됨 (config/settings.py)
+"""
+
+import re
+
+from rest_framework import renderers
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 설치되지 않은 환경에서는 stdlib json 사용
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# JSON 응답과 같은 규칙으로 Decimal, 날짜, QuerySet 등을 변환
+_encode_default = encoders.JSONEncoder().default
+
+# U+2028, U+2029의 UTF-8 표현
+_LINE_SEPARATORS = re.compile(b"\xe2\x80[\xa8\xa9]")
+_ESCAPED_SEPARATORS = {b"\xe2\x80\xa8": b"\\u2028", b"\xe2\x80\xa9": b"\\u2029"}
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or not (api_settings.UNICODE_JSON and api_settings.COMPACT_JSON)
+            or self.get_indent(accepted_media_type or "", renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        # datetime은 DRF 규칙(+00:00 -> Z)을 따르도록 default에서 변환
+        ret = orjson.dumps(
+            data,
+            default=_encode_default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+        # JavaScript 문자열 안에서 줄바꿈으로 해석되는 문자는 DRF와 같이 이스케이프
+        # (첫 바이트 검사는 memchr라 빠르므로 해당 바이트가 있을 때만 정규식으로 치환)
+        if b"\xe2" in ret:
+            ret = _LINE_SEPARATORS.sub(
+                lambda match: _ESCAPED_SEPARATORS[match.group()], ret
+            )
+        return ret
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    media_type = MSGPACK_MEDIA_TYPE
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=_encode_default, use_bin_type=True)
@@ -0,0 +1,49 @@
+"""
+serializer 필드 구성 캐시
+
+ModelSerializer.get_fields()는 인스턴스를 만들 때마다 모델 메타데이터를 다시 분석하고
+(get_field_info, build_field) 선언된 필드를 deepcopy 함. 목록 응답의 child, 상세 응답의
+중첩 serializer마다 같은 작업이 반복되므로 클래스별로 한 번만 만들고 복제해서 사용.
+"""
+
+import copy
+
+from rest_framework import serializers
+
+# serializer 클래스 -> 바인딩되지 않은 필드 원본 {이름: 필드}
+_field_prototypes = {}
+
+
+def clear_field_cache():
+    _field_prototypes.clear()
+
+
+class CachedFieldsMixin:
+    """
+    get_fields() 결과를 클래스별로 캐시하는 serializer mixin
+
+    - 일반 필드는 얕은 복사(bind로 바뀌는 속성만 인스턴스별로 가짐)
+    - 중첩 serializer는 parent/context가 섞이지 않도록 DRF와 같이 deepcopy
+    - cache_fields = False 로 끄기 (필드 구성이 context/instance에 따라 달라지는 경우)
+    context에 따라 필드를 고르는 mixin(DynamicFieldsMixin 등)은 이 mixin보다 앞에 둠
+    """
+
+    cache_fields = True
+
+    def get_fields(self):
+        if not self.cache_fields:
+            return super().get_fields()
+        prototypes = _field_prototypes.get(type(self))
+        if prototypes is None:
+            prototypes = _field_prototypes[type(self)] = super().get_fields()
+        return {name: _clone(field) for name, field in prototypes.items()}
+
+
+def _clone(field):
+    if isinstance(field, serializers.BaseSerializer):
+        return copy.deepcopy(field)
+    return copy.copy(field)
+
+
+class ModelSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """필드 구성을 클래스별로 캐시하는 ModelSerializer"""
@@ -0,0 +1,129 @@
+"""
+엔드포인트별 쿼리 예산(query budget) 테스트 도구
+
+N+1 같은 쿼리 수 회귀를 테스트 단계에서 잡기 위해 사용.
+
+    class CampsiteQueryBudgetTests(QueryBudgetTestCase):
+        def test_list(self):
+            with self.assertQueryBudget(queries=2, rows=11):
+                self.client.get("/api/v1/campsites/")
+
+예산을 넘으면 어떤 쿼리가 몇 번, 몇 행을 읽었는지 보고서를 출력하고 실패함.
+QUERY_BUDGET_REPORT=1 환경 변수를 주면 통과한 테스트의 보고서도 출력.
+"""
+
+import os
+import re
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.db import connection
+from rest_framework.test import APITestCase
+
+
+class QueryBudget:
+    """
+    블록 안에서 실행된 SQL을 기록하는 context manager
+
+    rows는 블록이 끝난 뒤 각 SELECT를 COUNT(*)로 감싸 다시 실행해서 계산함.
+    (DB-API 커서에서 fetch된 행 수를 직접 얻을 수 없기 때문)
+    따라서 쓰기 요청의 경우 응답 이후 상태 기준의 행 수임.
+    """
+
+    def __init__(self, using=connection):
+        self.connection = using
+        self.queries = []
+
+    def __enter__(self):
+        self._wrapper = self.connection.execute_wrapper(self._record)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._wrapper.__exit__(exc_type, exc_value, traceback)
+        if exc_type is None:
+            self._count_rows()
+
+    def _record(self, execute, sql, params, many, context):
+        # 테스트의 트랜잭션 안에서만 생기는 SAVEPOINT 문은 운영 환경과 달라 제외
+        if "SAVEPOINT" in sql[:20].upper():
+            return execute(sql, params, many, context)
+        self.queries.append({"sql": sql, "params": params, "many": many, "rows": 0})
+        return execute(sql, params, many, context)
+
+    def _count_rows(self):
+        with self.connection.cursor() as cursor:
+            for query in self.queries:
+                sql = query["sql"]
+                if query["many"] or not sql.lstrip().upper().startswith("SELECT"):
+                    continue
+                cursor.execute(
+                    f"SELECT COUNT(*) FROM ({sql}) query_budget_subquery",
+                    query["params"],
+                )
+                query["rows"] = cursor.fetchone()[0]
+
+    @property
+    def total_rows(self):
+        return sum(query["rows"] for query in self.queries)
+
+    def report(self, label="", max_queries=None, max_rows=None):
+        lines = [
+            f"{label}: {len(self.queries)} queries (budget {max_queries}), "
+            f"{self.total_rows} rows (budget {max_rows})"
+        ]
+
+        # 같은 형태의 쿼리가 반복되면 N+1일 가능성이 높으므로 묶어서 보여줌
+        shapes = {}
+        for query in self.queries:
+            shape = _normalize(query["sql"])
+            shapes.setdefault(shape, []).append(query)
+        repeated = {shape: qs for shape, qs in shapes.items() if len(qs) > 1}
+        if repeated:
+            lines.append("  repeated queries (possible N+1):")
+            for shape, qs in repeated.items():
+                lines.append(f"    x{len(qs)}  {_truncate(shape)}")
+
+        lines.append("   #   rows  sql")
+        for index, query in enumerate(self.queries, start=1):
+            over = max_queries is not None and index > max_queries
+            marker = "!" if over else " "
+            lines.append(
+                f"  {marker}{index:>2}  {query['rows']:>5}  {_truncate(query['sql'])}"
+            )
+        return "\n".join(lines)
+
+
+class QueryBudgetTestCase(APITestCase):
+    def setUp(self):
+        super().setUp()
+        # 응답 캐시가 테스트 간에 공유되지 않도록 초기화
+        cache.clear()
+
+    @contextmanager
+    def assertQueryBudget(self, queries, rows=None, label=None):
+        budget = QueryBudget()
+        with budget:
+            yield budget
+
+        label = label or self.id()
+        report = budget.report(label, max_queries=queries, max_rows=rows)
+        over_queries = len(budget.queries) > queries
+        over_rows = rows is not None and budget.total_rows > rows
+
+        if os.environ.get("QUERY_BUDGET_REPORT") or over_queries or over_rows:
+            print(f"\n{report}")
+        if over_queries or over_rows:
+            self.fail(f"Query budget exceeded\n{report}")
+
+
+def _normalize(sql):
+    sql = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    sql = re.sub(r"\b\d+\b", "?", sql)
+    sql = re.sub(r"%s", "?", sql)
+    return re.sub(r"\s+", " ", sql).strip()
+
+
+def _truncate(sql, width=140):
+    sql = re.sub(r"\s+", " ", sql).strip()
+    return sql if len(sql) <= width else sql[: width - 3] + "..."
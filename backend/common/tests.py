@@ -1,3 +1,269 @@
-from django.test import TestCase
+import datetime
+import decimal
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from unittest import mock
 
-# Create your tests here.
+import msgpack
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from rest_framework import renderers as drf_renderers
+from rest_framework import serializers as drf_serializers
+
+from campsites import models as campsite_models
+from campsites import serializers as campsite_serializers
+from campsites.sample_data import seed_catalogue
+from config import gunicorn as gunicorn_config
+
+from . import renderers, serializers, warmup
+from .management.commands import profile_startup
+from .testing import QueryBudget, QueryBudgetTestCase
+
+
+class QueryBudgetTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        seed_catalogue(owner, campsites=4, images=2, amenities=1, reviews=0)
+
+    def test_counts_queries_and_rows(self):
+        with QueryBudget() as budget:
+            list(campsite_models.Campsite.objects.all())
+            list(campsite_models.CampsiteImage.objects.all())
+        self.assertEqual(len(budget.queries), 2)
+        self.assertEqual(budget.total_rows, 4 + 8)
+
+    def test_report_flags_repeated_queries(self):
+        with QueryBudget() as budget:
+            for campsite in campsite_models.Campsite.objects.all():
+                campsite.images.first()
+        report = budget.report("n+1", max_queries=2, max_rows=10)
+        self.assertIn("x4", report)
+        self.assertIn("!", report)
+
+    def test_fails_when_over_budget(self):
+        with self.assertRaises(AssertionError), redirect_stdout(io.StringIO()):
+            with self.assertQueryBudget(queries=1):
+                list(campsite_models.Campsite.objects.all())
+                list(campsite_models.Amenity.objects.all())
+
+
+class CachedFieldsTests(SimpleTestCase):
+    def setUp(self):
+        serializers.clear_field_cache()
+
+    def test_fields_are_built_once_per_class(self):
+        with mock.patch.object(
+            drf_serializers.ModelSerializer,
+            "get_fields",
+            autospec=True,
+            side_effect=drf_serializers.ModelSerializer.get_fields,
+        ) as get_fields:
+            first = campsite_serializers.CampsiteDetailSerializer()
+            second = campsite_serializers.CampsiteDetailSerializer()
+            self.assertEqual(list(first.fields), list(second.fields))
+            # 중첩 serializer(policy, amenities, images)도 클래스별로 한 번씩만 구성
+            second.fields["images"].child.fields
+            campsite_serializers.CampsiteDetailSerializer().fields[
+                "images"
+            ].child.fields
+        self.assertEqual(get_fields.call_count, 2)
+
+    def test_instances_get_their_own_bound_fields(self):
+        first = campsite_serializers.CampsiteDetailSerializer(context={"n": 1})
+        second = campsite_serializers.CampsiteDetailSerializer(context={"n": 2})
+        self.assertIsNot(first.fields["name"], second.fields["name"])
+        self.assertIs(first.fields["name"].parent, first)
+        # 중첩 serializer의 context는 각자의 최상위 serializer에서 가져옴
+        self.assertEqual(first.fields["images"].child.context, {"n": 1})
+        self.assertEqual(second.fields["images"].child.context, {"n": 2})
+
+
+class RendererTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.campsite = seed_catalogue(cls.owner, campsites=3, reviews=3)[0]
+        cls.reviews_url = f"/api/v1/campsites/{cls.campsite.pk}/reviews/"
+
+    def test_orjson_output_matches_drf_json_renderer(self):
+        payload = {
+            "text": "캠핑\u2028장\u2029",
+            "price": decimal.Decimal("12.50"),
+            "at": datetime.datetime(2024, 6, 1, 12, 0, tzinfo=datetime.timezone.utc),
+            "date": datetime.date(2024, 6, 1),
+            "nested": [{"none": None, "float": 0.1, 1: True}],
+        }
+        expected = drf_renderers.JSONRenderer().render(payload)
+        self.assertEqual(renderers.ORJSONRenderer().render(payload), expected)
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(renderers.ORJSONRenderer().render(payload), expected)
+
+        response = self.client.get("/api/v1/campsites/")
+        self.assertEqual(
+            response.content, drf_renderers.JSONRenderer().render(response.data)
+        )
+
+    def test_msgpack_is_chosen_by_accept_header(self):
+        as_json = self.client.get(self.reviews_url)
+        response = self.client.get(self.reviews_url, HTTP_ACCEPT="application/msgpack")
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertEqual(msgpack.unpackb(response.content), json.loads(as_json.content))
+        # 형식이 다르면 ETag도 다름
+        self.assertNotEqual(response["ETag"], as_json["ETag"])
+
+    def test_parsers(self):
+        self.client.force_authenticate(self.owner)
+        response = self.client.post(
+            self.reviews_url,
+            msgpack.packb({"rating": 4, "content": "좋아요"}),
+            content_type="application/msgpack",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["content"], "좋아요")
+
+        response = self.client.post(
+            self.reviews_url,
+            '{"rating": 5, "content": "최고"}',
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+
+        for body, content_type in (
+            ("{broken", "application/json"),
+            (b"\xc1", "application/msgpack"),
+        ):
+            with self.subTest(content_type=content_type):
+                response = self.client.post(
+                    self.reviews_url, body, content_type=content_type
+                )
+                self.assertEqual(response.status_code, 400)
+
+
+class WarmupTests(TestCase):
+    def test_prepare(self):
+        serializers.clear_field_cache()
+        self.addCleanup(serializers.clear_field_cache)
+        routes, built = warmup.prepare()
+        self.assertGreater(routes, 50)
+        self.assertGreater(built, 10)
+        # 필드 캐시가 채워져 있으므로 fork된 워커는 첫 요청에서 필드를 다시 만들지 않음
+        self.assertIn(
+            campsite_serializers.CampsiteListSerializer,
+            serializers._field_prototypes,
+        )
+        self.assertNotIn(serializers.ModelSerializer, serializers._field_prototypes)
+
+    def test_connect_databases(self):
+        connection.close()
+        warmup.connect_databases()
+        self.assertIsNotNone(connection.connection)
+
+
+class GunicornConfigTests(SimpleTestCase):
+    def cpus(self, files):
+        with tempfile.TemporaryDirectory() as root:
+            for name, content in files.items():
+                path = os.path.join(root, name)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w") as f:
+                    f.write(content)
+            with mock.patch("os.sched_getaffinity", return_value=set(range(8))):
+                return gunicorn_config.available_cpus(root)
+
+    def test_available_cpus_follows_cgroup_limit(self):
+        self.assertEqual(self.cpus({"cpu.max": "150000 100000\n"}), 2)
+        self.assertEqual(self.cpus({"cpu.max": "max 100000\n"}), 8)
+        self.assertEqual(self.cpus({"cpu.max": "20000 100000\n"}), 1)
+        self.assertEqual(
+            self.cpus(
+                {"cpu/cpu.cfs_quota_us": "400000", "cpu/cpu.cfs_period_us": "100000"}
+            ),
+            4,
+        )
+        self.assertEqual(self.cpus({"cpu/cpu.cfs_quota_us": "-1"}), 8)
+        self.assertEqual(self.cpus({}), 8)
+
+    def test_warns_about_per_process_response_cache(self):
+        log = mock.Mock()
+        with self.settings(RESPONSE_CACHE_ENABLED=True):
+            gunicorn_config.check_response_cache(log, workers=1)
+            log.warning.assert_not_called()
+            gunicorn_config.check_response_cache(log, workers=4)
+            log.warning.assert_called_once()
+        log.reset_mock()
+        with self.settings(RESPONSE_CACHE_ENABLED=False):
+            gunicorn_config.check_response_cache(log, workers=4)
+        log.warning.assert_not_called()
+
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |       urllib3.util
+import time:       200 |        300 |     urllib3
+import time:       400 |        700 |   requests
+import time:        50 |         50 |   yaml
+import time:       300 |       1050 | rest_framework.compat
+import time:        20 |         20 | requests.compat
+"""
+
+
+class StartupTests(SimpleTestCase):
+    def test_parse_importtime(self):
+        modules = profile_startup.parse_importtime(IMPORTTIME_OUTPUT)
+        importers = {module.name: module.importer for module in modules}
+        self.assertEqual(
+            importers,
+            {
+                "urllib3.util": "urllib3",
+                "urllib3": "requests",
+                "requests": "rest_framework.compat",
+                "yaml": "rest_framework.compat",
+                "rest_framework.compat": None,
+                "requests.compat": None,
+            },
+        )
+        self.assertEqual(
+            list(profile_startup.by_package(modules).items())[:3],
+            [
+                ("requests", (420, "rest_framework.compat")),
+                ("urllib3", (300, "requests")),
+                ("rest_framework", (300, "-")),
+            ],
+        )
+
+    def test_api_only_startup_skips_admin_and_httpx(self):
+        # 이미 import된 모듈이 없는 새 인터프리터에서 URL까지 불러옴
+        script = (
+            "import sys, config.wsgi\n"
+            "from django.urls import get_resolver\n"
+            "routes = [str(p.pattern) for p in get_resolver().url_patterns]\n"
+            "print('admin/' in routes, 'campsites.admin' in sys.modules, "
+            "'grappelli' in sys.modules, 'httpx' in sys.modules)"
+        )
+        process = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=settings.BASE_DIR,
+            env=dict(
+                os.environ,
+                DJANGO_SETTINGS_MODULE="config.settings",
+                IN_DOCKER_BUILD="true",
+                ENABLE_ADMIN="false",
+            ),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(process.stdout.split(), ["False"] * 4)
@@ -1,3 +1,81 @@
-from django.shortcuts import render
+"""
+async view (ASGI 배포용)
 
-# Create your views here.
+AsyncAPIView는 APIView와 같은 순서(content negotiation -> 인증 -> 권한 -> throttle ->
+handler -> 예외 처리)로 요청을 처리하지만 handler(get/post 등)가 async 함수임.
+ASGI 서버에서 실행하면 외부 API나 DB를 기다리는 동안 워커가 다른 요청을 처리함.
+
+- 인증: DRF Request는 request.user에 처음 접근할 때 sync로 인증(DB 조회)하므로,
+  handler 전에 미리 인증해 둠. 인증 클래스에 aauthenticate()가 있으면 그것을 사용
+  (common.authentication.JWTAuthentication), 없으면 sync authenticate()를 스레드에서 실행
+- 권한/throttle 검사는 sync 그대로 실행하므로 DB를 조회하는 권한 클래스는 쓰지 않아야 함
+- handler 안에서는 async ORM(aget, aexists, async for ...)이나 sync_to_async를 사용
+- WSGI(gunicorn sync 워커, 테스트 클라이언트)에서도 Django가 async_to_sync로 실행하므로 동작함
+"""
+
+from asgiref.sync import sync_to_async
+from rest_framework import exceptions
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.ainitial(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def ainitial(self, request, *args, **kwargs):
+        """APIView.initial()과 같지만 인증을 async로 처리"""
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+        neg = self.perform_content_negotiation(request)
+        request.accepted_renderer, request.accepted_media_type = neg
+        version, scheme = self.determine_version(request, *args, **kwargs)
+        request.version, request.versioning_scheme = version, scheme
+
+        await self.aperform_authentication(request)
+        self.check_permissions(request)
+        self.check_throttles(request)
+
+    async def aperform_authentication(self, request):
+        # rest_framework.request.Request._authenticate()의 async 버전
+        for authenticator in request.authenticators:
+            try:
+                if hasattr(authenticator, "aauthenticate"):
+                    user_auth_tuple = await authenticator.aauthenticate(request)
+                else:
+                    user_auth_tuple = await sync_to_async(authenticator.authenticate)(
+                        request
+                    )
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+        request._not_authenticated()
+
+    # Django View는 handler가 모두 async여야 async view로 인식함
+
+    async def options(self, request, *args, **kwargs):
+        return super().options(request, *args, **kwargs)
+
+    async def http_method_not_allowed(self, request, *args, **kwargs):
+        return super().http_method_not_allowed(request, *args, **kwargs)
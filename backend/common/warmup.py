@@ -0,0 +1,94 @@
+"""
+워커가 요청을 받기 전에 하는 초기화 (config/gunicorn.py의 hook에서 호출)
+
+Django/DRF는 URL 정규식 컴파일, DRF 설정 클래스 import, serializer 필드 구성 등을
+처음 사용할 때 하므로, 배포나 scale-up 직후 워커마다 첫 요청들이 느려짐.
+- prepare(): URL, DRF 설정, serializer 초기화. preload_app이면 master에서 한 번 하고
+  fork된 워커들이 그 메모리를 그대로 공유함
+- connect_databases(): DB 연결 확인. 연결(socket)은 프로세스 간에 공유하면 안 되므로
+  fork 후 워커마다 실행
+"""
+
+import importlib.util
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.urls import URLResolver, get_resolver
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+
+def prepare():
+    """(URL 패턴 수, serializer 수)를 return"""
+    routes = resolve_urls()
+    load_api_settings()
+    built = build_serializers()
+    return routes, built
+
+
+def resolve_urls(resolver=None):
+    """config.urls의 모든 URL 패턴 정규식을 컴파일하고 reverse 목록을 만듦. 패턴 수를 return"""
+    resolver = resolver or get_resolver()
+    # 전체 패턴의 reverse/namespace 목록을 만들면서 정규식도 컴파일됨
+    resolver.reverse_dict
+    count = 0
+    for pattern in resolver.url_patterns:
+        pattern.pattern.regex
+        if isinstance(pattern, URLResolver):
+            count += resolve_urls(pattern)
+        else:
+            count += 1
+    return count
+
+
+def load_api_settings():
+    # renderer, parser, 인증, 필터 등 DRF 설정의 클래스 경로를 import
+    for name in api_settings.defaults:
+        getattr(api_settings, name)
+
+
+def build_serializers():
+    """
+    프로젝트 앱의 serializers 모듈에 정의된 serializer를 하나씩 만들어 필드를 구성
+    (common.serializers.CachedFieldsMixin의 클래스별 필드 캐시가 채워짐). 만든 수를 return
+    """
+    count = 0
+    for serializer_class in _project_serializers():
+        serializer_class().fields
+        count += 1
+    return count
+
+
+def _project_serializers():
+    base_dir = Path(settings.BASE_DIR).resolve()
+    for app_config in apps.get_app_configs():
+        if not Path(app_config.path).resolve().is_relative_to(base_dir):
+            continue
+        module_name = f"{app_config.name}.serializers"
+        if importlib.util.find_spec(module_name) is None:
+            continue
+        module = importlib.import_module(module_name)
+        for value in vars(module).values():
+            if (
+                isinstance(value, type)
+                and issubclass(value, serializers.BaseSerializer)
+                and value.__module__ == module_name
+                # Meta가 없는 ModelSerializer는 상속용 기반 클래스
+                and not (
+                    issubclass(value, serializers.ModelSerializer)
+                    and not hasattr(value, "Meta")
+                )
+            ):
+                yield value
+
+
+def connect_databases():
+    """
+    모든 DB에 연결해 둠 (연결할 수 없으면 트래픽을 받기 전에 예외로 실패)
+    CONN_MAX_AGE가 0이면 연결 자체는 첫 요청이 시작될 때 닫히지만, 드라이버와
+    DB 백엔드(버전 확인 등)의 초기화는 남음
+    """
+    for connection in connections.all():
+        connection.ensure_connection()
@@ -0,0 +1,30 @@
+"""
+리뷰 내보내기 (common.export로 NDJSON/CSV 스트리밍)
+"""
+
+from django.db.models import F
+
+from common import export as common_export
+
+from . import models
+
+REVIEW_COLUMNS = (
+    "id",
+    "campsite_id",
+    "user_id",
+    "username",
+    "rating",
+    "content",
+    "created_at",
+    "updated_at",
+)
+
+
+def review_rows(chunk_size=common_export.CHUNK_SIZE):
+    """리뷰 행을 작성자 username과 함께 return (user는 JOIN으로 같은 쿼리에서 읽음)"""
+    fields = [column for column in REVIEW_COLUMNS if column != "username"]
+    return (
+        models.Review.objects.order_by("pk")
+        .values(*fields, username=F("user__username"))
+        .iterator(chunk_size=chunk_size)
+    )
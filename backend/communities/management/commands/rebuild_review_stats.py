@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from communities import stats
+
+
+class Command(BaseCommand):
+    help = "리뷰 테이블로부터 캠핑장별 평점 집계(개수/합계/평균/분포)를 일괄 재계산"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 bulk_update 할 캠핑장 수 (기본값: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        updated = stats.rebuild_rating_stats(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"평점 집계를 다시 계산했습니다. (변경된 캠핑장: {updated}곳)"
+            )
+        )
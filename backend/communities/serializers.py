@@ -1,8 +1,21 @@
 from rest_framework import serializers
+
+from common import dynamic_fields as common_dynamic_fields
+from common import fast_serializers as common_fast_serializers
+from common import serializers as common_serializers
+from users import serializers as user_serializers
 from . import models
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(
+    common_dynamic_fields.DynamicFieldsMixin,
+    common_fast_serializers.ValuesSerializerMixin,
+    common_serializers.ModelSerializer,
+):
+    """
+    리뷰 Serializer
+    ?fields=로 필드를 줄이거나 ?expand=user로 작성자를 {id, username} 객체로 받을 수 있음
+    """
 
     # 리뷰를 작성한 사용자의 username을 보여주는 읽기 전용 필드
     user = serializers.ReadOnlyField(source="user.username")
@@ -15,3 +28,8 @@ class ReviewSerializer(serializers.ModelSerializer):
         # 사용자가 직접 수정/입력할 수 없는 필드들
         # user와 campsite는 View에서 자동으로 설정.
         read_only_fields = ["user", "campsite"]
+
+        # 평점은 1~5점 (캠핑장 평점 분포 집계와 맞춤)
+        extra_kwargs = {"rating": {"min_value": 1, "max_value": 5}}
+
+        expandable_fields = {"user": (user_serializers.UserSummarySerializer, {})}
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from campsites import cache as campsite_cache
+
+from . import models
+
+
+@receiver(post_save, sender=models.Review)
+@receiver(post_delete, sender=models.Review)
+def invalidate_campsite_reviews(sender, instance, **kwargs):
+    # 리뷰 목록 캐시는 캠핑장별 버전 키에 의존
+    campsite_cache.bump_campsite(instance.campsite_id)
@@ -0,0 +1,77 @@
+"""
+리뷰 테이블로부터 캠핑장별 평점 집계를 일괄 재계산
+
+rebuild_review_stats 명령과 샘플 데이터(campsites.sample_data)처럼
+리뷰를 bulk_create 해서 시그널 없이 넣은 경우에 사용
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from campsites import cache as campsite_cache
+from campsites import models as campsite_models
+from common import cache as common_cache
+
+from . import models
+
+
+def rebuild_rating_stats(campsites=None, batch_size=1000):
+    """
+    campsites(기본: 전체 캠핑장)의 평점 집계(개수/합계/평균/분포)를 다시 계산.
+    값이 바뀐 캠핑장만 bulk_update 하고 그 수를 return
+    """
+    if campsites is None:
+        campsites = campsite_models.Campsite.objects.all()
+
+    # 캠핑장별 집계를 GROUP BY 한 번으로 계산
+    histogram = {
+        f"rating_{star}_count": Count("id", filter=Q(rating=star))
+        for star in range(1, 6)
+    }
+    stats = {
+        row.pop("campsite_id"): row
+        for row in models.Review.objects.filter(campsite__in=campsites)
+        .values("campsite_id")
+        .annotate(rating_count=Count("id"), rating_sum=Sum("rating"), **histogram)
+    }
+
+    now = timezone.now()
+    changed = []
+    updated = 0
+    campsites = campsites.only("id", *campsite_models.RATING_FIELDS)
+    for campsite in campsites.iterator(chunk_size=batch_size):
+        row = stats.get(campsite.pk, {})
+        values = {field: row.get(field, 0) for field in campsite_models.RATING_FIELDS}
+        values["rating_average"] = Decimal("0.00")
+        if values["rating_count"]:
+            values["rating_average"] = (
+                Decimal(values["rating_sum"]) / values["rating_count"]
+            ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+        if all(getattr(campsite, f) == v for f, v in values.items()):
+            continue
+        for field, value in values.items():
+            setattr(campsite, field, value)
+        campsite.updated_at = now
+        changed.append(campsite)
+
+        if len(changed) >= batch_size:
+            updated += _flush(changed)
+            changed = []
+    return updated + _flush(changed)
+
+
+def _flush(campsites):
+    if not campsites:
+        return 0
+    campsite_models.Campsite.objects.bulk_update(
+        campsites, [*campsite_models.RATING_FIELDS, "updated_at"]
+    )
+    # bulk_update는 시그널을 보내지 않으므로 캐시를 직접 무효화
+    common_cache.bump_versions(
+        campsite_cache.LIST_VERSION_KEY,
+        *(campsite_cache.campsite_version_key(c.pk) for c in campsites),
+    )
+    return len(campsites)
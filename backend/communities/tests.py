@@ -1,3 +1,177 @@
-from django.test import TestCase
+import io
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import override_settings
+
+from campsites.sample_data import seed_catalogue
+from common.testing import QueryBudgetTestCase
+
+from . import models, views
+
+
+class ReviewQueryBudgetTests(QueryBudgetTestCase):
+    """중첩 리뷰 엔드포인트의 최대 쿼리 수/행 수"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.campsite = seed_catalogue(cls.owner, campsites=5, reviews=30)[0]
+        cls.url = f"/api/v1/campsites/{cls.campsite.pk}/reviews/"
+
+    def test_list(self):
+        # validator(MAX/COUNT) + COUNT(*) + 리뷰 조회(user JOIN)
+        with self.assertQueryBudget(queries=3, rows=1 + 1 + 10):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 30)
+
+    def test_seed_catalogue_fills_aggregates(self):
+        # bulk_create한 리뷰 30개(평점 1~5 순환)가 집계에 반영되어 있음
+        self.assertEqual(
+            (self.campsite.rating_count, self.campsite.rating_sum),
+            (30, 90),
+        )
+        self.assertEqual(self.campsite.rating_average, 3)
+        self.assertEqual(
+            [getattr(self.campsite, f"rating_{star}_count") for star in range(1, 6)],
+            [6] * 5,
+        )
+
+    def test_create(self):
+        self.client.force_authenticate(self.owner)
+        # campsite 조회 + INSERT + 평점 집계 UPDATE
+        with self.assertQueryBudget(queries=3, rows=1):
+            response = self.client.post(
+                self.url, {"rating": 5, "content": "최고"}, format="json"
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(
+            models.Review.objects.filter(
+                pk=response.data["id"], user=self.owner
+            ).exists()
+        )
+
+
+class ReviewAggregateTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.campsite = seed_catalogue(cls.owner, campsites=1, reviews=0)[0]
+        cls.url = f"/api/v1/campsites/{cls.campsite.pk}/reviews/"
+
+    def assertAggregates(self, count, total, average, histogram):
+        self.campsite.refresh_from_db()
+        self.assertEqual(self.campsite.rating_count, count)
+        self.assertEqual(self.campsite.rating_sum, total)
+        self.assertEqual(float(self.campsite.rating_average), average)
+        self.assertEqual(
+            [getattr(self.campsite, f"rating_{star}_count") for star in range(1, 6)],
+            histogram,
+        )
+
+    def test_create_update_delete_keep_aggregates_in_sync(self):
+        self.client.force_authenticate(self.owner)
+        first = self.client.post(self.url, {"rating": 5, "content": "a"}, format="json")
+        self.client.post(self.url, {"rating": 2, "content": "b"}, format="json")
+        self.assertAggregates(2, 7, 3.5, [0, 1, 0, 0, 1])
+
+        self.client.patch(
+            f"{self.url}{first.data['id']}/", {"rating": 3}, format="json"
+        )
+        self.assertAggregates(2, 5, 2.5, [0, 1, 1, 0, 0])
+
+        self.client.delete(f"{self.url}{first.data['id']}/")
+        self.assertAggregates(1, 2, 2.0, [0, 1, 0, 0, 0])
+
+        review = models.Review.objects.get()
+        self.client.delete(f"{self.url}{review.pk}/")
+        self.assertAggregates(0, 0, 0.0, [0, 0, 0, 0, 0])
+
+    def test_concurrent_deletes_remove_rating_once(self):
+        self.client.force_authenticate(self.owner)
+        response = self.client.post(
+            self.url, {"rating": 4, "content": "a"}, format="json"
+        )
+        # 두 요청이 같은 리뷰를 읽은 뒤 차례로 삭제하는 경우
+        first = models.Review.objects.get(pk=response.data["id"])
+        second = models.Review.objects.get(pk=response.data["id"])
+        view = views.ReviewViewSet()
+        view.perform_destroy(first)
+        view.perform_destroy(second)
+        self.assertAggregates(0, 0, 0.0, [0, 0, 0, 0, 0])
+
+    def test_rating_must_be_between_1_and_5(self):
+        self.client.force_authenticate(self.owner)
+        response = self.client.post(
+            self.url, {"rating": 6, "content": "a"}, format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_rebuild_command(self):
+        models.Review.objects.bulk_create(
+            models.Review(user=self.owner, campsite=self.campsite, rating=r, content="")
+            for r in (1, 4, 4)
+        )
+        call_command("rebuild_review_stats", stdout=io.StringIO())
+        self.assertAggregates(3, 9, 3.0, [1, 0, 0, 2, 0])
+
+
+class ReviewSparseFieldsTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.campsite = seed_catalogue(cls.owner, campsites=1, reviews=5)[0]
+        cls.url = f"/api/v1/campsites/{cls.campsite.pk}/reviews/"
+
+    def test_fields_skip_user_join_and_content(self):
+        with self.assertQueryBudget(queries=3) as budget:
+            response = self.client.get(self.url, {"fields": "id,rating"})
+        self.assertEqual(set(response.data["results"][0]), {"id", "rating"})
+        sql = budget.queries[-1]["sql"]
+        self.assertNotIn("JOIN", sql)
+        self.assertNotIn('"content"', sql)
+
+    def test_expand_user(self):
+        response = self.client.get(self.url, {"fields": "id", "expand": "user"})
+        user = response.data["results"][0]["user"]
+        self.assertEqual(set(user), {"id", "username"})
+
+        # 기본 응답은 username 문자열
+        response = self.client.get(self.url)
+        self.assertIsInstance(response.data["results"][0]["user"], str)
+
+    @override_settings(RESPONSE_CACHE_ENABLED=False)
+    def test_values_fast_path_matches_model_serializer(self):
+        for params in (None, {"fields": "id,user,created_at"}):
+            with self.subTest(params=params):
+                fast = self.client.get(self.url, params)
+                with mock.patch.object(views.ReviewViewSet, "values_list_actions", ()):
+                    slow = self.client.get(self.url, params)
+                self.assertEqual(fast.content, slow.content)
+
+
+class ReviewExportTests(QueryBudgetTestCase):
+    def test_csv_export_reads_users_in_same_query(self):
+        owner = get_user_model().objects.create_user(
+            email="owner@example.com", password="password", is_staff=True
+        )
+        seed_catalogue(owner, campsites=2, reviews=4)
+        self.client.force_authenticate(owner)
+        with self.assertQueryBudget(queries=1):
+            response = self.client.get(
+                "/api/v1/campsites/reviews/export/", {"format": "csv"}
+            )
+            lines = b"".join(response.streaming_content).decode("utf-8").splitlines()
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(
+            lines[0].split(",")[:4], ["id", "campsite_id", "user_id", "username"]
+        )
+        self.assertEqual(len(lines), 1 + 8)
@@ -1,22 +1,44 @@
+from django.db import transaction
 from rest_framework import viewsets, permissions
 
 
+from common import cache as common_cache
+from common import conditional as common_conditional
+from common import dynamic_fields as common_dynamic_fields
+from common import export as common_export
+from common import fast_serializers as common_fast_serializers
 from common import permissions as common_perm
+from campsites import cache as campsite_cache
 from campsites import models as campsite_models  # Campsite 모델 임포트
 
-from . import models, serializers
+from . import export, models, serializers
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(
+    common_conditional.ConditionalGetMixin,
+    common_cache.CachedResponseMixin,
+    common_dynamic_fields.DynamicFieldsViewMixin,
+    common_fast_serializers.ValuesListMixin,
+    viewsets.ModelViewSet,
+):
     """
     특정 캠핑장에 대한 리뷰 CRUD를 위한 ViewSet
     """
 
+    # 리뷰 목록만 ETag 적용 및 캐싱 (캠핑장별 버전 키에 의존)
+    conditional_actions = ("list",)
+    response_cache_actions = ("list",)
+
     serializer_class = serializers.ReviewSerializer
     permission_classes = [
         permissions.IsAuthenticatedOrReadOnly,
         common_perm.IsOwnerOrReadOnly,
     ]
+    # 리뷰 작성자만 수정/삭제 가능
+    owner_field = "user"
+
+    def get_response_cache_versions(self):
+        return [campsite_cache.campsite_version_key(self.kwargs["campsite_pk"])]
 
     def get_queryset(self):
         """
@@ -24,7 +46,20 @@ class ReviewViewSet(viewsets.ModelViewSet):
         """
         # URL로부터 campsite_pk 값을 가져옴. (예: /campsites/1/reviews/ -> 1)
         campsite_pk = self.kwargs["campsite_pk"]
-        return models.Review.objects.filter(campsite_id=campsite_pk)
+        queryset = models.Review.objects.filter(campsite_id=campsite_pk).order_by(
+            "-created_at", "-id"
+        )
+        if self.action not in self.dynamic_fields_actions:
+            # 쓰기 응답은 user.username을 사용하므로 JOIN으로 함께 조회
+            return queryset.select_related("user")
+
+        # ?fields= 로 고른 필드에 필요한 JOIN/컬럼만 조회
+        fields = self.get_response_fields()
+        if "user" in fields:
+            queryset = queryset.select_related("user")
+        if "content" not in fields:
+            queryset = queryset.defer("content")
+        return queryset
 
     def perform_create(self, serializer):
         """
@@ -35,4 +70,52 @@ class ReviewViewSet(viewsets.ModelViewSet):
         )
 
         # serializer.save()를 호출할 때 추가적인 데이터를 전달
-        serializer.save(user=self.request.user, campsite=campsite_instance)
+        # 리뷰 저장과 캠핑장 평점 집계 갱신을 하나의 트랜잭션으로 처리
+        with transaction.atomic():
+            review = serializer.save(user=self.request.user, campsite=campsite_instance)
+            campsite_models.Campsite.objects.apply_rating_change(
+                review.campsite_id, added=review.rating
+            )
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            # 동시 수정 시에도 이전 평점을 정확히 빼기 위해 행 잠금 후 다시 읽음
+            old_rating = (
+                models.Review.objects.select_for_update()
+                .values_list("rating", flat=True)
+                .get(pk=serializer.instance.pk)
+            )
+            review = serializer.save()
+            if review.rating != old_rating:
+                campsite_models.Campsite.objects.apply_rating_change(
+                    review.campsite_id, added=review.rating, removed=old_rating
+                )
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            # 행을 잠그고 다시 읽음. 동시에 삭제한 요청이 먼저 끝났으면 평점을 다시 빼지 않음
+            rating = (
+                models.Review.objects.select_for_update()
+                .filter(pk=instance.pk)
+                .values_list("rating", flat=True)
+                .first()
+            )
+            if rating is None:
+                return
+            instance.delete()
+            campsite_models.Campsite.objects.apply_rating_change(
+                instance.campsite_id, removed=rating
+            )
+
+
+class ReviewExportView(common_export.ExportView):
+    """
+    GET /api/v1/campsites/reviews/export/?format=ndjson|csv (관리자 전용)
+    전체 리뷰를 작성자 username과 함께 스트리밍
+    """
+
+    export_name = "reviews"
+    columns = export.REVIEW_COLUMNS
+
+    def get_rows(self):
+        return export.review_rows(self.chunk_size)
@@ -0,0 +1,134 @@
+"""
+gunicorn 설정 (gunicorn --config python:config.gunicorn)
+
+환경 변수 (괄호 안은 기본값)
+- GUNICORN_BIND (0.0.0.0:8000)
+- GUNICORN_WORKER_CLASS (uvicorn_worker.UvicornWorker): ASGI 워커면 config.asgi,
+  그 외(sync, gthread)는 config.wsgi를 실행
+- GUNICORN_WORKERS (ASGI: CPU 수, 최소 2 / WSGI: CPU 수 * 2 + 1)
+- GUNICORN_THREADS (1): WSGI 워커별 스레드 수 (2 이상이면 gthread 워커)
+- GUNICORN_PRELOAD (true): master에서 앱을 import하고 warm-up 한 뒤 워커를 fork
+- GUNICORN_WARMUP (true): 워커가 요청을 받기 전에 common.warmup 실행
+CPU 수는 컨테이너의 CPU limit(cgroup quota)과 사용 가능한 CPU(affinity) 중 작은 값
+
+preload_app이면 import한 모듈, URL, serializer 필드 등을 워커들이 copy-on-write로 공유함.
+master에서 gc.freeze()로 이 객체들을 GC 대상에서 빼 두어 워커의 GC가 참조 정보를
+쓰면서 공유 메모리 페이지를 복사하지 않게 함
+"""
+
+import gc
+import math
+import os
+import time
+
+ASGI_WORKER_CLASSES = ("uvicorn_worker.UvicornWorker", "uvicorn.workers.UvicornWorker")
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+
+def available_cpus(cgroup_root=CGROUP_ROOT):
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:  # pragma: no cover - macOS 등
+        cpus = os.cpu_count() or 1
+    limit = _cgroup_cpu_limit(cgroup_root)
+    if limit is not None:
+        cpus = min(cpus, max(1, math.ceil(limit)))
+    return cpus
+
+
+def _cgroup_cpu_limit(root):
+    # cgroup v2: cpu.max = "<quota> <period>" (제한이 없으면 quota가 "max")
+    try:
+        with open(os.path.join(root, "cpu.max")) as f:
+            quota, period = f.read().split()
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    # cgroup v1: quota가 -1이면 제한 없음
+    try:
+        with open(os.path.join(root, "cpu", "cpu.cfs_quota_us")) as f:
+            quota = int(f.read())
+        with open(os.path.join(root, "cpu", "cpu.cfs_period_us")) as f:
+            period = int(f.read())
+        return None if quota <= 0 else quota / period
+    except (OSError, ValueError):
+        return None
+
+
+def _env_int(name, default):
+    value = os.environ.get(name, "")
+    return int(value) if value.strip() else default
+
+
+def _env_bool(name, default):
+    value = os.environ.get(name, "").strip().lower()
+    return default if not value else value in ("1", "true", "yes", "on")
+
+
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", ASGI_WORKER_CLASSES[0])
+is_asgi = worker_class in ASGI_WORKER_CLASSES
+wsgi_app = "config.asgi:application" if is_asgi else "config.wsgi:application"
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+cpus = available_cpus()
+# ASGI 워커는 이벤트 루프 하나가 I/O 대기 중인 요청을 여러 개 처리하므로 CPU당 하나
+workers = _env_int("GUNICORN_WORKERS", max(2, cpus) if is_asgi else cpus * 2 + 1)
+threads = 1 if is_asgi else _env_int("GUNICORN_THREADS", 1)
+
+preload_app = _env_bool("GUNICORN_PRELOAD", True)
+warmup = _env_bool("GUNICORN_WARMUP", True)
+
+
+def when_ready(server):
+    # master: preload_app이면 앱이 이미 import 되어 있으므로 fork 전에 warm-up
+    if preload_app:
+        check_response_cache(server.log, workers)
+        if warmup:
+            _prepare(server.log)
+        gc.freeze()
+
+
+def check_response_cache(log, workers):
+    # 프로세스별 캐시로 응답 캐시를 켜면 다른 워커는 무효화(버전 증가)를 모름
+    from django.conf import settings
+
+    backend = settings.CACHES["default"]["BACKEND"]
+    if (
+        workers > 1
+        and settings.RESPONSE_CACHE_ENABLED
+        and backend.endswith(("LocMemCache", "DummyCache"))
+    ):
+        log.warning(
+            "응답 캐시가 프로세스별 캐시(%s)를 사용하지만 워커가 %d개임. "
+            "CACHE_URL을 Redis/Memcached 등 공유 캐시로 설정할 것",
+            backend,
+            workers,
+        )
+
+
+def post_worker_init(worker):
+    # 워커: 앱을 불러온 뒤, 요청을 받기 전
+    if not warmup:
+        return
+    if not preload_app:
+        _prepare(worker.log)
+    from common import warmup as common_warmup
+
+    common_warmup.connect_databases()
+
+
+def _prepare(log):
+    from django.db import connections
+
+    from common import warmup as common_warmup
+
+    started = time.perf_counter()
+    routes, built = common_warmup.prepare()
+    # master에서 연 연결이 있으면 fork된 워커들이 같은 socket을 쓰게 되므로 닫음
+    connections.close_all()
+    log.info(
+        "warm-up: URL %d개, serializer %d개 (%.0fms)",
+        routes,
+        built,
+        (time.perf_counter() - started) * 1000,
+    )
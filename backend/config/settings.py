@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 import environ
+import importlib.util
 import os
 from datetime import timedelta
 
@@ -26,6 +27,13 @@ env = environ.Env(
     CLOUDFLARE_API_TOKEN=(str, ""),
     CLOUDFLARE_ACCOUNT_ID=(str, ""),
     CLOUDFLARE_ACCOUNT_HASH=(str, ""),
+    CLOUDFLARE_API_URL=(str, "https://api.cloudflare.com/client/v4"),
+    CLOUDFLARE_UPLOAD_URL_POOL_SIZE=(int, 6),
+    CLOUDFLARE_UPLOAD_URL_QUOTA=(int, 200),
+    RESPONSE_CACHE_TIMEOUT=(int, 60),
+    PRICE_CALENDAR_DAYS=(int, 365),
+    CAMPSITE_IMPORT_MAX_BYTES=(int, 10 * 1024 * 1024),
+    ENABLE_ADMIN=(bool, True),
 )
 
 IN_DOCKER_BUILD = env("IN_DOCKER_BUILD")
@@ -51,9 +59,14 @@ else:
     ALLOWED_HOSTS = ALLOWED_HOSTS_STRING.split(",")
 
 
+# 관리자 페이지(grappelli, django admin)
+# API만 서비스하는 pod는 ENABLE_ADMIN=false로 admin 앱과 URL을 빼서
+# 시작할 때 admin 모듈, 앱별 admin.py import와 admin URL 구성을 생략함
+ENABLE_ADMIN = env("ENABLE_ADMIN")
+
+ADMIN_APPS = ["grappelli", "django.contrib.admin"] if ENABLE_ADMIN else []
+
 SYSTEM_APPS = [
-    "grappelli",
-    "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
@@ -63,6 +76,7 @@ SYSTEM_APPS = [
 
 THIRD_PART_APPS = [
     "rest_framework",
+    "django_filters",
     "rest_framework_simplejwt",
     "corsheaders",
 ]
@@ -72,13 +86,15 @@ CUSTOM_APPS = [
     "common.apps.CommonConfig",
     "campsites.apps.CampsitesConfig",
     "communities.apps.CommunitiesConfig",
+    "reservations.apps.ReservationsConfig",
 ]
 
-INSTALLED_APPS = SYSTEM_APPS + THIRD_PART_APPS + CUSTOM_APPS
+INSTALLED_APPS = ADMIN_APPS + SYSTEM_APPS + THIRD_PART_APPS + CUSTOM_APPS
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    # WhiteNoise + ASGI(async) 지원 (common.middleware)
+    "common.middleware.WhiteNoiseMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -131,6 +147,33 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# 기본값은 프로세스별 LocMem 캐시. 워커가 여러 개면 다른 워커의 캐시는 버전 증가를 모르기 때문에
+# RESPONSE_CACHE_TIMEOUT 동안 이전 응답이 보일 수 있음.
+# 워커 간 무효화가 필요하면 CACHE_URL을 공유 캐시로 바꾸면 됨. (예: rediscache://..., filecache:///var/tmp/django_cache)
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
+# 캠핑장/리뷰 응답 캐시 (common.cache.CachedResponseMixin)
+# 위 이유로 프로세스별 캐시(LocMem, Dummy)에서는 기본으로 끔.
+# 워커가 하나뿐이면 RESPONSE_CACHE_ENABLED=true로 켜도 됨 (워커가 여러 개면 gunicorn이 경고를 남김)
+RESPONSE_CACHE_ENABLED = env.bool(
+    "RESPONSE_CACHE_ENABLED",
+    default=not CACHES["default"]["BACKEND"].endswith(("LocMemCache", "DummyCache")),
+)
+RESPONSE_CACHE_TIMEOUT = env("RESPONSE_CACHE_TIMEOUT")
+
+# 사이트별 일자 요금표(campsites.SiteDailyPrice)를 오늘부터 며칠치 미리 계산해 둘지
+PRICE_CALENDAR_DAYS = env("PRICE_CALENDAR_DAYS")
+
+# API(/api/v1/campsites/import/)로 한 번에 가져올 수 있는 파일 크기.
+# 가져오기는 요청 안에서 끝까지 실행되므로, 더 큰 파일은 import_campsites 명령으로 가져옴
+CAMPSITE_IMPORT_MAX_BYTES = env("CAMPSITE_IMPORT_MAX_BYTES")
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -181,9 +224,8 @@ REST_FRAMEWORK = {
     # Set the default authentication class for all API views to JWTAuthentication.
     # This means that Django Rest Framework will expect a JWT in the 'Authorization' header
     # for authenticating requests.
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-    ),
+    # simplejwt JWTAuthentication + async view용 aauthenticate() (common.authentication)
+    "DEFAULT_AUTHENTICATION_CLASSES": ("common.authentication.JWTAuthentication",),
     # Note: Other settings like 'DEFAULT_PERMISSION_CLASSES' can remain as they are.
     # For example:
     "DEFAULT_PERMISSION_CLASSES": [
@@ -195,8 +237,25 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     # 페이지 당 기본 데이터 개수
     "PAGE_SIZE": env("PAGE_SIZE"),
+    # JSON은 orjson으로 처리 (설치되지 않았으면 common.renderers/parsers가 stdlib json 사용)
+    "DEFAULT_RENDERER_CLASSES": [
+        "common.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "common.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
+# msgpack이 설치되어 있으면 Accept: application/msgpack 요청/응답 지원
+if importlib.util.find_spec("msgpack") is not None:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].append(
+        "common.renderers.MessagePackRenderer"
+    )
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"].append("common.parsers.MessagePackParser")
+
 SIMPLE_JWT = {
     # Set the lifespan of the access token.
     "ACCESS_TOKEN_LIFETIME": (
@@ -323,3 +382,19 @@ if env("ENABLE_ACCESS_LOG"):
 CLOUDFLARE_API_TOKEN = env("CLOUDFLARE_API_TOKEN")
 CLOUDFLARE_ACCOUNT_ID = env("CLOUDFLARE_ACCOUNT_ID")
 CLOUDFLARE_ACCOUNT_HASH = env("CLOUDFLARE_ACCOUNT_HASH")
+
+# Cloudflare Images API 클라이언트 (campsites.cloudflare)
+# 오프라인 개발/테스트에서는 cloudflare_stub 명령으로 띄운 서버 주소를 지정
+CLOUDFLARE_API_URL = env("CLOUDFLARE_API_URL")
+CLOUDFLARE_TIMEOUT = (3.05, 10)  # (연결, 응답) 초
+CLOUDFLARE_RETRIES = 3
+# 워커 프로세스마다 미리 발급해 둘 direct upload URL 수 (0이면 요청할 때마다 발급)
+CLOUDFLARE_UPLOAD_URL_POOL_SIZE = env("CLOUDFLARE_UPLOAD_URL_POOL_SIZE")
+# 미리 발급한 URL의 유효 시간, 만료까지 이만큼도 남지 않은 URL은 내주지 않음 (초)
+CLOUDFLARE_UPLOAD_URL_TTL = 60 * 60
+CLOUDFLARE_UPLOAD_URL_MARGIN = 15 * 60
+# images/upload-urls/ 한 번에 요청할 수 있는 최대 개수
+CLOUDFLARE_UPLOAD_URL_BATCH_MAX = 20
+# 사용자별 업로드 URL 발급 한도 (QUOTA_WINDOW초 동안 QUOTA개)
+CLOUDFLARE_UPLOAD_URL_QUOTA = env("CLOUDFLARE_UPLOAD_URL_QUOTA")
+CLOUDFLARE_UPLOAD_URL_QUOTA_WINDOW = 60 * 60
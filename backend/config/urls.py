@@ -1,12 +1,20 @@
-from django.contrib import admin
+from django.conf import settings
 from django.urls import path, include, re_path
 from . import views
 
 urlpatterns = [
-    path("grappelli/", include("grappelli.urls")),
-    path("admin/", admin.site.urls),
     re_path(r"^healthz/ready/?$", views.Healthcheck.as_view()),
     path("api/v1/users/", include("users.urls")),
     path("api/v1/host/", include("users.urls")),
     path("api/v1/campsites/", include("campsites.urls")),
+    path("api/v1/reservations/", include("reservations.urls")),
 ]
+
+# ENABLE_ADMIN=false(API 전용 pod)이면 admin 모듈을 import하지 않음
+if settings.ENABLE_ADMIN:
+    from django.contrib import admin
+
+    urlpatterns = [
+        path("grappelli/", include("grappelli.urls")),
+        path("admin/", admin.site.urls),
+    ] + urlpatterns
@@ -1,8 +1,10 @@
-from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
+from common import views as common_views
 
-class Healthcheck(APIView):
-    def get(self, request):
+
+class Healthcheck(common_views.AsyncAPIView):
+    # probe가 자주 호출하므로 ASGI에서 스레드를 거치지 않도록 async로 처리
+    async def get(self, request):
         return Response(status=status.HTTP_200_OK)
@@ -0,0 +1,9 @@
+from django.contrib import admin
+
+from . import models
+
+
+@admin.register(models.Reservation)
+class ReservationAdmin(admin.ModelAdmin):
+    list_display = ("site", "user", "check_in", "check_out", "status", "total_price")
+    list_filter = ("status",)
@@ -0,0 +1,20 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+class ReservationsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "reservations"
+
+    def ready(self):
+        post_migrate.connect(install_overlap_guard, sender=self)
+
+
+def install_overlap_guard(sender, using, plan=None, **kwargs):
+    # SQLite는 테이블을 다시 만드는 마이그레이션 뒤에 트리거가 사라지므로 매번 복구
+    from django.db import connections
+
+    from . import overlap
+
+    if plan:
+        overlap.install_if_ready(connections[using])
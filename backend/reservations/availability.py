@@ -0,0 +1,27 @@
+from django.db.models import Count, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from campsites import models as campsite_models
+
+from . import models
+
+
+def with_free_sites(campsites, start, end):
+    """
+    [start, end) 동안 예약이 하나도 없는 사이트 수를 free_sites로 annotate
+
+    사이트마다 NOT EXISTS(겹치는 확정 예약)를 검사하며, 이 검사는
+    reservation_site_period_idx(site, check_out, check_in)에서 check_out > start 범위만 읽음.
+    지난 예약은 범위에 들어오지 않으므로 예약 테이블 전체 크기와 관계없이 빠름.
+    """
+    busy = models.Reservation.objects.overlapping(start, end).filter(
+        site=OuterRef("pk")
+    )
+    free_sites = (
+        campsite_models.Site.objects.filter(campsite=OuterRef("pk"))
+        .filter(~Exists(busy))
+        .values("campsite")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return campsites.annotate(free_sites=Coalesce(Subquery(free_sites), 0))
@@ -0,0 +1,98 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+
+from reservations import overlap
+
+
+def install_overlap_guard(apps, schema_editor):
+    overlap.install(schema_editor.connection)
+
+
+def uninstall_overlap_guard(apps, schema_editor):
+    overlap.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("campsites", "0013_site_daily_price"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # exclusion constraint에서 site_id(=)와 daterange(&&)를 함께 쓰기 위해 필요 (PostgreSQL 전용)
+        BtreeGistExtension(),
+        migrations.CreateModel(
+            name="Reservation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("check_in", models.DateField()),
+                ("check_out", models.DateField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("confirmed", "확정"), ("cancelled", "취소")],
+                        default="confirmed",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "total_price",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="예약 시점의 숙박 요금 합계",
+                        max_digits=12,
+                    ),
+                ),
+                (
+                    "site",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reservations",
+                        to="campsites.site",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reservations",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-check_in", "-id"],
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("status", "confirmed")),
+                        fields=["site", "check_out", "check_in"],
+                        name="reservation_site_period_idx",
+                    )
+                ],
+                "constraints": [
+                    models.CheckConstraint(
+                        condition=models.Q(("check_out__gt", models.F("check_in"))),
+                        name="reservation_check_out_after_check_in",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(install_overlap_guard, uninstall_overlap_guard),
+    ]
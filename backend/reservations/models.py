@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.db import models
+
+from common.models import BaseModel
+
+
+class ReservationQuerySet(models.QuerySet):
+    def overlapping(self, start, end):
+        """[start, end) 숙박 기간과 하루라도 겹치는 확정 예약"""
+        return self.filter(
+            status=Reservation.Status.CONFIRMED, check_out__gt=start, check_in__lt=end
+        )
+
+
+class Reservation(BaseModel):
+    """
+    사이트 예약. 숙박 기간은 [check_in, check_out) (체크아웃 날은 다음 예약이 가능)
+
+    같은 사이트의 확정 예약끼리 기간이 겹치지 않도록 DB 수준에서 막음 (overlap.py)
+    - PostgreSQL: btree_gist 기반 exclusion constraint
+    - SQLite: INSERT/UPDATE 전에 검사하는 트리거
+    """
+
+    class Status(models.TextChoices):
+        CONFIRMED = "confirmed", "확정"
+        CANCELLED = "cancelled", "취소"
+
+    site = models.ForeignKey(
+        "campsites.Site", on_delete=models.CASCADE, related_name="reservations"
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="reservations",
+    )
+    check_in = models.DateField()
+    check_out = models.DateField()
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.CONFIRMED
+    )
+    total_price = models.DecimalField(
+        max_digits=12, decimal_places=2, help_text="예약 시점의 숙박 요금 합계"
+    )
+
+    objects = ReservationQuerySet.as_manager()
+
+    class Meta:
+        ordering = ["-check_in", "-id"]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(check_out__gt=models.F("check_in")),
+                name="reservation_check_out_after_check_in",
+            ),
+        ]
+        indexes = [
+            # 겹치는 예약 조회용: 지난 예약(check_out <= 조회 시작일)은 인덱스 범위에서 제외됨
+            models.Index(
+                fields=["site", "check_out", "check_in"],
+                name="reservation_site_period_idx",
+                condition=models.Q(status="confirmed"),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.site} - {self.check_in}~{self.check_out} ({self.get_status_display()})"
@@ -0,0 +1,69 @@
+"""
+같은 사이트의 확정 예약 기간이 겹치지 않도록 DB 수준에서 막는 제약
+
+"겹치는 예약이 있는지 조회한 뒤 INSERT" 방식은 동시 요청 사이에 경쟁 조건이 있으므로
+DB가 직접 거부하도록 함. 위반 시 두 DB 모두 IntegrityError가 발생함.
+
+- PostgreSQL: EXCLUDE USING gist (site_id WITH =, daterange(check_in, check_out) WITH &&)
+  (btree_gist 확장 필요. 제약이 사용하는 GiST 인덱스가 겹침 조회도 처리함)
+- SQLite: BEFORE INSERT/UPDATE 트리거에서 reservation_site_period_idx 인덱스로 겹침을 검사.
+  SQLite는 쓰기가 DB 전체 잠금으로 직렬화되므로 검사와 쓰기 사이에 경쟁 조건이 없음.
+"""
+
+TABLE = "reservations_reservation"
+CONSTRAINT = "reservation_no_overlap"
+OVERLAP_MESSAGE = "reservation overlaps an existing reservation"
+
+_SQLITE_CHECK = (
+    f"WHEN NEW.status = 'confirmed' AND EXISTS ("
+    f"SELECT 1 FROM {TABLE} AS other "
+    f"WHERE other.site_id = NEW.site_id AND other.status = 'confirmed' "
+    f"AND other.check_out > NEW.check_in AND other.check_in < NEW.check_out "
+    f"AND other.id IS NOT NEW.id) "
+    f"BEGIN SELECT RAISE(ABORT, '{OVERLAP_MESSAGE}'); END"
+)
+
+
+def install(connection):
+    """겹침 방지 제약을 생성 (이미 있으면 건너뜀)"""
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "SELECT 1 FROM pg_constraint WHERE conname = %s", [CONSTRAINT]
+            )
+            if cursor.fetchone() is None:
+                cursor.execute(
+                    f"ALTER TABLE {TABLE} ADD CONSTRAINT {CONSTRAINT} "
+                    f"EXCLUDE USING gist (site_id WITH =, "
+                    f"daterange(check_in, check_out, '[)') WITH &&) "
+                    f"WHERE (status = 'confirmed')"
+                )
+        elif connection.vendor == "sqlite":
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {CONSTRAINT}_insert "
+                f"BEFORE INSERT ON {TABLE} {_SQLITE_CHECK}"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {CONSTRAINT}_update "
+                f"BEFORE UPDATE OF site_id, check_in, check_out, status ON {TABLE} "
+                f"{_SQLITE_CHECK}"
+            )
+
+
+def install_if_ready(connection):
+    """예약 테이블이 있을 때만 install (마이그레이션을 되돌린 경우 대비)"""
+    with connection.cursor() as cursor:
+        if TABLE not in connection.introspection.table_names(cursor):
+            return
+    install(connection)
+
+
+def uninstall(connection):
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                f"ALTER TABLE {TABLE} DROP CONSTRAINT IF EXISTS {CONSTRAINT}"
+            )
+        elif connection.vendor == "sqlite":
+            for suffix in ("insert", "update"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {CONSTRAINT}_{suffix}")
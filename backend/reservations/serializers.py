@@ -0,0 +1,85 @@
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from campsites import pricing
+from common import serializers as common_serializers
+
+from . import models
+
+# 한 번에 예약할 수 있는 최대 숙박 수
+MAX_NIGHTS = 30
+
+
+def validate_stay(attrs, check_in="check_in", check_out="check_out"):
+    nights = (attrs[check_out] - attrs[check_in]).days
+    if nights <= 0:
+        raise serializers.ValidationError(
+            {check_out: "체크아웃 날짜는 체크인 날짜보다 이후이어야 합니다."}
+        )
+    if nights > MAX_NIGHTS:
+        raise serializers.ValidationError(
+            {check_out: f"최대 {MAX_NIGHTS}박까지 예약할 수 있습니다."}
+        )
+    return attrs
+
+
+class ReservationSerializer(common_serializers.ModelSerializer):
+    user = serializers.ReadOnlyField(source="user.username")
+    campsite = serializers.ReadOnlyField(source="site.campsite_id")
+    site_name = serializers.ReadOnlyField(source="site.name")
+
+    class Meta:
+        model = models.Reservation
+        fields = (
+            "id",
+            "user",
+            "campsite",
+            "site",
+            "site_name",
+            "check_in",
+            "check_out",
+            "status",
+            "total_price",
+            "created_at",
+        )
+        read_only_fields = ("status", "total_price")
+
+    def validate_check_in(self, value):
+        if value < timezone.localdate():
+            raise serializers.ValidationError("지난 날짜는 예약할 수 없습니다.")
+        return value
+
+    def validate(self, attrs):
+        return validate_stay(attrs)
+
+    def create(self, validated_data):
+        site = validated_data["site"]
+        compiled = pricing.get_compiled(site.campsite_id)
+        _, prices = compiled.quote(
+            validated_data["check_in"], validated_data["check_out"]
+        )
+        [row] = prices[compiled.site_ids == site.pk]
+        validated_data["total_price"] = pricing.from_cents(row.sum())
+
+        # 겹침 검사는 DB 제약에 맡기고, 위반 시 발생하는 IntegrityError를 검증 오류로 변환
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {"check_in": "이미 예약된 날짜가 포함되어 있습니다."}
+            )
+
+
+class AvailabilityQuerySerializer(serializers.Serializer):
+    """예약 가능 캠핑장 검색 query parameter (check_out 당일 밤은 포함하지 않음)"""
+
+    check_in = serializers.DateField()
+    check_out = serializers.DateField()
+    sites = serializers.IntegerField(
+        min_value=1, default=1, help_text="필요한 사이트 수"
+    )
+
+    def validate(self, attrs):
+        return validate_stay(attrs)
@@ -0,0 +1,150 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from campsites import models as campsite_models
+from campsites.sample_data import seed_catalogue
+from common.testing import QueryBudgetTestCase
+
+from . import models
+
+
+class ReservationTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.owner = User.objects.create_user(
+            email="owner@example.com", password="password"
+        )
+        cls.guest = User.objects.create_user(
+            email="guest@example.com", username="guest", password="password"
+        )
+        cls.today = timezone.localdate()
+        cls.one, cls.two, cls.none = seed_catalogue(cls.owner, campsites=3, reviews=0)
+        cls.site_a = campsite_models.Site.objects.create(
+            campsite=cls.one, name="A1", camp_type="오토캠핑", base_price=30000
+        )
+        cls.site_b = campsite_models.Site.objects.create(
+            campsite=cls.one, name="A2", camp_type="오토캠핑", base_price=40000
+        )
+        cls.site_c = campsite_models.Site.objects.create(
+            campsite=cls.two, name="G1", camp_type="글램핑", base_price=50000
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.guest)
+
+    def day(self, offset):
+        return self.today + datetime.timedelta(days=offset)
+
+    def reserve(self, site, start, end, status=models.Reservation.Status.CONFIRMED):
+        return models.Reservation.objects.create(
+            site=site,
+            user=self.guest,
+            check_in=self.day(start),
+            check_out=self.day(end),
+            status=status,
+            total_price=0,
+        )
+
+    def book(self, site, start, end):
+        return self.client.post(
+            "/api/v1/reservations/",
+            {"site": site.pk, "check_in": self.day(start), "check_out": self.day(end)},
+        )
+
+    def test_create_prices_reservation(self):
+        response = self.book(self.site_a, 1, 3)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["total_price"], "60000.00")
+        self.assertEqual(response.data["campsite"], self.one.pk)
+
+    def test_database_rejects_overlapping_reservations(self):
+        self.reserve(self.site_a, 5, 8)
+        for start, end in [(5, 8), (4, 6), (7, 10), (6, 7), (3, 12)]:
+            with self.subTest(start=start, end=end):
+                with self.assertRaises(IntegrityError), transaction.atomic():
+                    self.reserve(self.site_a, start, end)
+
+        # 체크아웃 날 체크인, 다른 사이트, 취소된 예약은 허용
+        self.reserve(self.site_a, 8, 9)
+        self.reserve(self.site_a, 3, 5)
+        self.reserve(self.site_b, 5, 8)
+        self.reserve(self.site_a, 5, 8, status=models.Reservation.Status.CANCELLED)
+
+    def test_update_cannot_create_overlap(self):
+        self.reserve(self.site_a, 5, 8)
+        cancelled = self.reserve(
+            self.site_a, 5, 8, status=models.Reservation.Status.CANCELLED
+        )
+        cancelled.status = models.Reservation.Status.CONFIRMED
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            cancelled.save()
+
+    def test_api_reports_conflict_and_cancel_frees_dates(self):
+        first = self.book(self.site_a, 1, 3)
+        response = self.book(self.site_a, 2, 4)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("check_in", response.data)
+
+        response = self.client.post(f"/api/v1/reservations/{first.data['id']}/cancel/")
+        self.assertEqual(response.data["status"], "cancelled")
+        self.assertEqual(self.book(self.site_a, 2, 4).status_code, 201)
+
+    def test_invalid_stays(self):
+        self.assertEqual(self.book(self.site_a, -1, 1).status_code, 400)
+        self.assertEqual(self.book(self.site_a, 3, 3).status_code, 400)
+        self.assertEqual(self.book(self.site_a, 1, 40).status_code, 400)
+
+    def test_list_only_own_reservations(self):
+        other = get_user_model().objects.create_user(
+            email="other@example.com", username="other", password="password"
+        )
+        models.Reservation.objects.create(
+            site=self.site_c,
+            user=other,
+            check_in=self.day(1),
+            check_out=self.day(2),
+            total_price=0,
+        )
+        self.reserve(self.site_a, 1, 2)
+        self.reserve(self.site_b, 1, 2)
+        # 인증(사용자 조회)은 force_authenticate로 생략되므로 COUNT(*) + 목록 조회
+        with self.assertQueryBudget(queries=2):
+            response = self.client.get("/api/v1/reservations/")
+        self.assertEqual(response.data["count"], 2)
+
+    def test_available_campsites(self):
+        self.reserve(self.site_a, 5, 8)
+        self.reserve(self.site_c, 0, 30)
+        # 지난 예약이 많아도 결과에 영향이 없어야 함
+        for week in range(1, 20):
+            self.reserve(self.site_b, -7 * week, -7 * week + 3)
+
+        def available(start, end, sites=1):
+            response = self.client.get(
+                "/api/v1/campsites/available/",
+                {
+                    "check_in": self.day(start),
+                    "check_out": self.day(end),
+                    "sites": sites,
+                },
+            )
+            self.assertEqual(response.status_code, 200)
+            return {item["id"]: item["free_sites"] for item in response.data["results"]}
+
+        self.assertEqual(available(1, 3), {self.one.pk: 2})
+        self.assertEqual(available(6, 7), {self.one.pk: 1})
+        self.assertEqual(available(6, 7, sites=2), {})
+        self.assertEqual(available(8, 10, sites=2), {self.one.pk: 2})
+        self.assertEqual(available(30, 31), {self.one.pk: 2, self.two.pk: 1})
+
+        # COUNT(*) + 페이지 조회 (사이트별 NOT EXISTS는 같은 쿼리의 서브쿼리)
+        with self.assertQueryBudget(queries=2):
+            self.client.get(
+                "/api/v1/campsites/available/",
+                {"check_in": self.day(1), "check_out": self.day(3)},
+            )
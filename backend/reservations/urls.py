@@ -0,0 +1,12 @@
+from django.urls import include, path
+from rest_framework import routers
+
+from . import views
+
+# /api/v1/reservations/
+router = routers.DefaultRouter()
+router.register(prefix="", viewset=views.ReservationViewSet, basename="reservation")
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
@@ -0,0 +1,39 @@
+from rest_framework import mixins, permissions, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from . import models, serializers
+
+
+class ReservationViewSet(
+    mixins.CreateModelMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    내 예약 조회/생성/취소
+    - list/retrieve: 로그인한 사용자의 예약만 조회
+    - create: 사이트와 기간을 지정해 예약 (겹치는 예약은 DB 제약으로 거부)
+    - cancel: 예약 취소 (취소된 예약은 겹침 검사에서 제외)
+    """
+
+    serializer_class = serializers.ReservationSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        # serializer가 user.username, site.name을 사용하므로 JOIN으로 함께 조회
+        return models.Reservation.objects.filter(user=self.request.user).select_related(
+            "user", "site"
+        )
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+
+    @action(detail=True, methods=["post"])
+    def cancel(self, request, pk=None):
+        reservation = self.get_object()
+        if reservation.status != models.Reservation.Status.CANCELLED:
+            reservation.status = models.Reservation.Status.CANCELLED
+            reservation.save(update_fields=["status", "updated_at"])
+        return Response(self.get_serializer(reservation).data)
@@ -2,8 +2,10 @@ from django.contrib.auth import get_user_model
 
 from rest_framework import serializers
 
+from common import serializers as common_serializers
 
-class UserRegistrationSerializer(serializers.ModelSerializer):
+
+class UserRegistrationSerializer(common_serializers.ModelSerializer):
     password = serializers.CharField(
         write_only=True, required=True, style={"input_type": "password"}
     )
@@ -23,8 +25,16 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return user
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(common_serializers.ModelSerializer):
     class Meta:
         model = get_user_model()
         # API 응답에 포함될 필드 목록
         fields = ("id", "email", "username", "phone_number")
+
+
+class UserSummarySerializer(common_serializers.ModelSerializer):
+    """다른 사용자에게 보여줄 공개 정보 (리뷰 작성자 등)"""
+
+    class Meta:
+        model = get_user_model()
+        fields = ("id", "username")
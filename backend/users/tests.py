@@ -1,3 +1,45 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from rest_framework_simplejwt.tokens import RefreshToken
 
-# Create your tests here.
+from common.testing import QueryBudgetTestCase
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class UserQueryBudgetTests(QueryBudgetTestCase):
+    """users 엔드포인트의 최대 쿼리 수/행 수"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+
+    def test_me(self):
+        # JWT 인증 시 사용자 조회 1회
+        access = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        with self.assertQueryBudget(queries=1, rows=1):
+            response = self.client.get("/api/v1/users/me/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["email"], self.user.email)
+
+    def test_token_obtain(self):
+        with self.assertQueryBudget(queries=1, rows=1):
+            response = self.client.post(
+                "/api/v1/users/token/",
+                {"email": "user@example.com", "password": "password"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("refresh_token", response.cookies)
+
+    def test_token_refresh(self):
+        refresh = str(RefreshToken.for_user(self.user))
+        self.client.cookies["refresh_token"] = refresh
+        with self.assertQueryBudget(queries=1, rows=1):
+            response = self.client.post(
+                "/api/v1/users/token/refresh/", {}, format="json"
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("access", response.data)
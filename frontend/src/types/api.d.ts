@@ -59,12 +59,18 @@ export interface ICampsiteListItem {
   stay_nights: number
   check_in: string
   check_out: string
+  rating_count: number
+  rating_average: number
+  stay_price: string | null // stay_start/stay_end로 조회한 경우에만 값이 있음
 }
 
 /**
  * 캠핑장 목록 API 응답 전체 타입
  */
 export interface ICampsiteListResponse {
+  count?: number // page 모드에서만 포함
+  next: string | null
+  previous: string | null
   results: ICampsiteListItem[]
 }
 
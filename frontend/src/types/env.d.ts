@@ -1,5 +1,7 @@
 interface ImportMetaEnv {
   readonly VITE_API_BASE_URL: string
+  // 'cursor'로 설정하면 캠핑장 목록을 keyset(cursor) 페이지네이션으로 조회
+  readonly VITE_CAMPSITE_PAGINATION?: 'cursor' | 'page'
   // 추가 VITE_* 변수들 모두 여기에 선언
 }
 